@@ -184,6 +184,46 @@ class _InstrumentEnum(util.PyLabHalEnum):
     return categories_enum.get(instrument_info['module'])
 
 
+def build_instrument(
+    instrument_model,
+    com: cominterface.ComInterfaceClass,
+    inst_config: instrument.InstrumentConfig,
+):
+  """This is the function to build the instrument on the cominterface.
+
+  Args:
+        instrument_model: The instrument model.
+        com (ComInterfaceClass): The cominterface for the instrument.
+        inst_config (InstrumentConfig): The config for the instrument.
+
+  Raises:
+      RuntimeError: The instrument_model is not supported.
+
+  Returns:
+        The instrument object.
+  """
+
+  if isinstance(instrument_model, util.PyLabHalEnum):
+    instrument_info = extract_instrument_name(instrument_model.value)
+  elif isinstance(instrument_model, str):
+    instrument_info = extract_instrument_name(
+        _InstrumentEnum.get_inst(instrument_model)
+    )
+  else:
+    raise RuntimeError(
+        f'The type of the instrument_model: {type(instrument_model)} is not'
+        ' supported.',
+    )
+
+  return instrument.select(
+      instrument_info.group('categories'),
+      instrument_info.group('module'),
+      instrument_info.group('class_name'),
+      com,
+      inst_config,
+  )
+
+
 class PyLabHALBuilder:
   """This is the builder for py_lab_hal."""
 
@@ -292,18 +332,6 @@ class PyLabHALBuilder:
           The instrument object.
     """
 
-    if isinstance(instrument_model, util.PyLabHalEnum):
-      instrument_info = extract_instrument_name(instrument_model.value)
-    elif isinstance(instrument_model, str):
-      instrument_info = extract_instrument_name(
-          _InstrumentEnum.get_inst(instrument_model)
-      )
-    else:
-      raise RuntimeError(
-          f'The type of the instrument_model: {type(instrument_model)} is not'
-          ' supported.',
-      )
-
     if self.cominterface is None:
       if self.connection_config is None:
         raise RuntimeError(
@@ -312,12 +340,8 @@ class PyLabHALBuilder:
 
       self.cominterface = cominterface.select(self.connection_config)
 
-    built_instrument = instrument.select(
-        instrument_info.group('categories'),
-        instrument_info.group('module'),
-        instrument_info.group('class_name'),
-        self.cominterface,
-        self.instrument_config,
+    built_instrument = build_instrument(
+        instrument_model, self.cominterface, self.instrument_config
     )
     self.cominterface = None
 
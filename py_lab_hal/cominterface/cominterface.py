@@ -17,13 +17,23 @@
 from __future__ import annotations
 
 import abc
+import array
+import asyncio
+import collections
+from collections.abc import Iterable
+from concurrent import futures
+import contextlib
+import copy
 import dataclasses
 import enum
 import importlib
 import logging
 import platform
 import re
-from typing import Any, Literal, TypeVar
+import sys
+import threading
+import time
+from typing import Any, Callable, Literal, TypeVar
 
 from py_lab_hal.datagram import datagram
 from py_lab_hal.logger import logger
@@ -31,6 +41,7 @@ from py_lab_hal.util import json_dataclass
 from typing_extensions import TypeAlias
 
 T = TypeVar('T', bound=datagram.Datagram)
+_R = TypeVar('_R')
 
 
 @dataclasses.dataclass
@@ -134,6 +145,7 @@ class ControlFlow(enum.IntEnum):
   DTR_DSR = VI_ASRL_FLOW_DTR_DSR
 
 
+@json_dataclass.dataclass_json_codegen
 @dataclasses.dataclass
 class HttpConfig(json_dataclass.DataClassJsonCamelMixIn):
   """The config for connect with http.
@@ -156,6 +168,7 @@ class HttpConfig(json_dataclass.DataClassJsonCamelMixIn):
   auth_data: dict[str, str] = dataclasses.field(default_factory=dict)
 
 
+@json_dataclass.dataclass_json_codegen
 @dataclasses.dataclass
 class SerialConfig(json_dataclass.DataClassJsonCamelMixIn):
   """The config for connect with serial.
@@ -185,6 +198,7 @@ class SerialConfig(json_dataclass.DataClassJsonCamelMixIn):
       self.flow_control = ControlFlow(self.flow_control)
 
 
+@json_dataclass.dataclass_json_codegen
 @dataclasses.dataclass
 class TerminatorConfig(json_dataclass.DataClassJsonCamelMixIn):
   """The config for Terminator.
@@ -198,6 +212,7 @@ class TerminatorConfig(json_dataclass.DataClassJsonCamelMixIn):
   write: str = DEFAULT_WRITE_TERMINATOR
 
 
+@json_dataclass.dataclass_json_codegen
 @dataclasses.dataclass
 class TimeoutConfig(json_dataclass.DataClassJsonCamelMixIn):
   """The config for timeout.
@@ -216,6 +231,7 @@ class TimeoutConfig(json_dataclass.DataClassJsonCamelMixIn):
     return getattr(self, item)
 
 
+@json_dataclass.dataclass_json_codegen
 @dataclasses.dataclass
 class NetworkConfig(json_dataclass.DataClassJsonCamelMixIn):
   """The config for network.
@@ -239,6 +255,7 @@ class NetworkConfig(json_dataclass.DataClassJsonCamelMixIn):
     return f'{self.host}:{self.port}'
 
 
+@json_dataclass.dataclass_json_codegen
 @dataclasses.dataclass
 class UsbConfig(json_dataclass.DataClassJsonCamelMixIn):
   """Configuration parameters for devices attached over USB.
@@ -258,6 +275,7 @@ class UsbConfig(json_dataclass.DataClassJsonCamelMixIn):
       logging.debug('Usb Configuration selected, protocol %s', self.protocol)
 
 
+@json_dataclass.dataclass_json_codegen
 @dataclasses.dataclass
 class HiSlipConfig(json_dataclass.DataClassJsonCamelMixIn):
   """Configuration parameters for devices attached over HiSlip.
@@ -271,6 +289,7 @@ class HiSlipConfig(json_dataclass.DataClassJsonCamelMixIn):
   sub_address: str = 'hislip0'
 
 
+@json_dataclass.dataclass_json_codegen
 @dataclasses.dataclass
 class ConnectConfig(json_dataclass.DataClassJsonCamelMixIn):
   """The config data class for connection.
@@ -531,11 +550,74 @@ class BytesBuffer:
       self.get(len(target_term))
 
 
+# The headers never coalesced by default, in upper case without the leading
+# colon. They perform an action or select the target of the next commands
+# rather than write a setting, so a later command with the same header does
+# not make an earlier one redundant.
+NO_COALESCE_HEADERS = frozenset({
+    b'INPUT:SHORT',
+    b'INP:SHOR',
+    b'LOAD:SHORT',
+    b'LOAD:SHOR',
+    b'CHANNEL',
+    b'CHAN',
+    b'INSTRUMENT',
+    b'INST',
+    b'INSTRUMENT:SELECT',
+    b'INST:SEL',
+    b'INSTRUMENT:NSELECT',
+    b'INST:NSEL',
+    b'TRIGGER',
+    b'TRIG',
+    b'SAVE:IMAGE',
+    b'SAVE:IMAGE:START',
+    b'SAVE:SETUP',
+    b'RECALL:SETUP',
+    b'FILESYSTEM:DELETE',
+    b'MEASUREMENT:DELETE',
+})
+
+
+class _BatchState(threading.local):
+  """The batch of one thread.
+
+  Kept per thread, so a batch held by one thread, such as the worker of
+  DataHandler.submit, does not absorb the commands sent by another.
+  """
+
+  def __init__(self) -> None:
+    # The held commands, each with the separator written before it.
+    self.commands: dict[Any, tuple[bytes, bytes]] | None = None
+    self.separator = b';:'
+    self.window: float | None = None
+    self.deadline = 0.0
+    self.coalesce = False
+
+
 class DataHandler:
   """The data handler for interface and datagram."""
 
   def __init__(self, interface: ComInterfaceClass):
     self.interface = interface
+    self._batch_state = _BatchState()
+    # The headers never coalesced by a coalescing batch, such as the commands
+    # with side effects beyond the setting they write. Matched in upper case
+    # without the leading colon.
+    self.no_coalesce_headers: set[bytes] = set(NO_COALESCE_HEADERS)
+    # If true, the commands sent outside a batch are queued for the background
+    # writer instead of written before send returns, see send_nowait.
+    self.queue_sends = False
+    self._executor: futures.ThreadPoolExecutor | None = None
+    # The commands for the background writer, ended by None once close stops
+    # the writer.
+    self._queued: collections.deque[datagram.Datagram | None] = (
+        collections.deque()
+    )
+    self._queued_event = threading.Event()
+    self._writer: threading.Thread | None = None
+    # Called without arguments when held or queued commands failed to be
+    # written, so the callers which took them as written can forget that.
+    self.write_error_callbacks: list[Callable[[], None]] = []
 
   def _build_bytes_datagram(
       self, data: bytes = b'', size: int = -1
@@ -547,14 +629,246 @@ class DataHandler:
         size=size,
     )
 
-  def send(self, command: str, timeout: int = -1) -> None:
+  def send(self, command: str, timeout: int = -1, key: Any = None) -> None:
     """Send command to the interface.
 
     Args:
         command (str): The command to send.
         timeout (int, optional): Timeout in seconds. Defaults to -1.
+        key (Any, optional): Identifies the setting the command writes. Inside
+          a batch, a command with the same key replaces the one held before
+          it in its place, so only the last value is sent. Defaults to None.
+    """
+    self.send_bytes(command.encode(), timeout=timeout, key=key)
+
+  def send_bytes(self, data: bytes, timeout: int = -1, key: Any = None) -> None:
+    """Send an already encoded command to the interface.
+
+    Unlike send_raw, the command takes part in an open batch.
+
+    Args:
+        data (bytes): The encoded command to send.
+        timeout (int, optional): Timeout in seconds. Defaults to -1.
+        key (Any, optional): Identifies the setting the command writes, see
+          send. Defaults to None.
+    """
+    state = self._batch_state
+    if state.commands is not None:
+      if key is None and state.coalesce:
+        key = self._header_key(data)
+      if key is None:
+        key = object()
+      # A command with a key already held takes its place, so the order of
+      # the first write of each setting is kept.
+      state.commands[key] = (state.separator, data)
+      if state.window is not None and time.monotonic() >= state.deadline:
+        self.flush()
+      return
+    if self.queue_sends:
+      self._queue(self._build_bytes_datagram(data))
+      return
+    self.send_raw(data, timeout=timeout)
+
+  def _header_key(self, data: bytes) -> bytes | None:
+    # Only a single set command with a value is keyed by its header. Queries,
+    # compound lines and events such as *TRG keep their own place.
+    if b'?' in data or b';' in data:
+      return None
+    header, space, _ = data.partition(b' ')
+    if not space or header.lstrip(b':').upper() in self.no_coalesce_headers:
+      return None
+    return header
+
+  @contextlib.contextmanager
+  def batch(
+      self,
+      separator: str = ';:',
+      window: float | None = None,
+      coalesce: bool = False,
+  ):
+    """Collect the commands sent inside the context and send them at once.
+
+    The commands passed to send are held and written in a single write when
+    the context exits. The batch only holds the commands of the thread which
+    opened it, the other threads keep writing theirs at once. Any other traffic
+    on the interface, such as a query, flushes the held commands first so the
+    order is kept. Nested batches are merged into the outermost one, but each
+    command is written after the separator of the batch it was sent in, so a
+    driver batch keeps its separator inside a batch of the caller. Commands
+    sent with the same key are coalesced and only the last one is written.
+
+    With a window, the batch is also written once the window has passed since
+    the last write, so a long running batch such as a GUI session sends at
+    most one write per window. The check runs on each send, so the commands
+    held after the last send of a burst go out with the next traffic or when
+    the context exits.
+
+    Args:
+        separator (str, optional): The separator placed before each command
+          sent inside the context. Defaults to ';:', which is valid between
+          SCPI commands of any subsystem.
+        window (float | None, optional): The coalescing window in seconds of
+          the outermost batch. Defaults to None, which holds the commands
+          until the context exits.
+        coalesce (bool, optional): If true, a command sent without a key is
+          keyed by its header, the part before the first space, so a later
+          command with the same header replaces it. Queries, compound lines,
+          commands without a value and the headers in no_coalesce_headers,
+          which holds the output short, channel selection and other action
+          headers by default, are never coalesced this way. Like window, only
+          used by the outermost batch. Defaults to False.
+
+    Yields:
+        DataHandler: The data handler itself.
+    """
+    state = self._batch_state
+    if state.commands is not None:
+      outer_separator = state.separator
+      state.separator = separator.encode()
+      try:
+        yield self
+      finally:
+        state.separator = outer_separator
+      return
+    state.commands = {}
+    state.separator = separator.encode()
+    state.window = window
+    state.coalesce = coalesce
+    if window is not None:
+      state.deadline = time.monotonic() + window
+    try:
+      yield self
+    finally:
+      try:
+        self.flush()
+      finally:
+        state.commands = None
+        state.window = None
+        state.coalesce = False
+
+  def flush(self) -> None:
+    """Send the queued commands and then the commands held by the batch.
+
+    Only the batch of the calling thread is sent.
+    """
+    state = self._batch_state
+    try:
+      if self._queued:
+        with self.interface.io_lock:
+          self._send_queued()
+      data = self.take_batch()
+      if not data:
+        return
+      if state.window is not None:
+        state.deadline = time.monotonic() + state.window
+      self.send_raw(data)
+    except Exception:
+      self._write_failed()
+      raise
+
+  def take_batch(self) -> bytes:
+    """Remove the commands held by the batch of the calling thread.
+
+    For the callers which write the held commands themselves, such as ahead of
+    a query in the same write.
+
+    Returns:
+        bytes: The held commands joined as flush writes them, b'' if none.
+    """
+    state = self._batch_state
+    if not state.commands:
+      return b''
+    commands, state.commands = list(state.commands.values()), {}
+    data = b''.join(separator + command for separator, command in commands)
+    return data[len(commands[0][0]) :]
+
+  def _write_failed(self) -> None:
+    for callback in self.write_error_callbacks:
+      callback()
+
+  def send_batch(
+      self, commands: Iterable[str], separator: str = ';', timeout: int = -1
+  ) -> None:
+    """Send multiple commands to the interface in a single write.
+
+    Args:
+        commands (Iterable[str]): The commands to send, such as a list or a
+          generator.
+        separator (str, optional): The separator placed between the commands.
+          Defaults to ';'. Use ';:' for SCPI commands from different
+          subsystems and '\\n' for G-code or the instruments without compound
+          command support.
+        timeout (int, optional): Timeout in seconds. Defaults to -1.
     """
-    self.send_raw(command.encode(), timeout=timeout)
+    data = separator.join(commands)
+    if not data:
+      return
+    self.send_raw(data.encode(), timeout=timeout)
+
+  def send_nowait(self, command: str) -> None:
+    """Queue command to be sent by a background writer and return at once.
+
+    The queued commands are sent in order. Any other traffic on the interface
+    sends the queued commands first, so a query never overtakes them. Errors
+    of a queued write are logged by the writer, not raised to the caller. The
+    command does not take part in a batch.
+
+    Args:
+        command (str): The command to send.
+    """
+    self._queue(self._build_bytes_datagram(command.encode()))
+
+  def _queue(self, dg: datagram.Datagram) -> None:
+    self._queued.append(dg)
+    if self._writer is None:
+      self._writer = threading.Thread(
+          target=self._write_queued, name='DataHandlerWriter', daemon=True
+      )
+      self._writer.start()
+    self._queued_event.set()
+
+  def _write_queued(self) -> None:
+    while True:
+      self._queued_event.wait()
+      self._queued_event.clear()
+      try:
+        with self.interface.io_lock:
+          self._send_queued()
+      except Exception:
+        logging.exception('Queued write failed')
+        self._write_failed()
+        # Carry on with the commands queued after the failed one.
+        self._queued_event.set()
+        continue
+      if self._queued and self._queued[0] is None:
+        self._queued.popleft()
+        return
+
+  def _send_queued(self) -> None:
+    # Always called with the io_lock held, so the queue is drained in order by
+    # one thread at a time. Stops at the None put by close, which is left for
+    # the writer to see.
+    while self._queued and self._queued[0] is not None:
+      self._queued.popleft().send(self.interface)
+
+  def close(self) -> None:
+    """Close the interface once the pending commands are sent.
+
+    The submitted calls finish first, then the queued and held commands are
+    sent and the background writer is stopped.
+    """
+    try:
+      executor, self._executor = self._executor, None
+      if executor is not None:
+        executor.shutdown(wait=True)
+      self.flush()
+    finally:
+      writer, self._writer = self._writer, None
+      if writer is not None:
+        self._queued.append(None)
+        self._queued_event.set()
+        writer.join()
+      self.interface.close()
 
   def send_raw(self, data: bytes, timeout: int = -1) -> None:
     """Send raw data to the interface.
@@ -572,8 +886,10 @@ class DataHandler:
         dg (datagram.Datagram): The datagram to send.
         timeout (int, optional): Timeout in seconds. Defaults to -1.
     """
-    self.interface.set_timeout(timeout)
-    dg.send(self.interface)
+    with self.interface.io_lock:
+      self.flush()
+      self.interface.set_timeout(timeout)
+      dg.send(self.interface)
 
   def recv(self, timeout: int = -1, size: int = -1) -> str:
     """Receive data from the interface.
@@ -611,8 +927,10 @@ class DataHandler:
     Returns:
         T: The datagram from the interface.
     """
-    self.interface.set_timeout(timeout)
-    dg.recv(self.interface)
+    with self.interface.io_lock:
+      self.flush()
+      self.interface.set_timeout(timeout)
+      dg.recv(self.interface)
     return dg
 
   def query(self, command: str, timeout: int = -1, size: int = -1) -> str:
@@ -621,6 +939,80 @@ class DataHandler:
         self.interface.connect_config.terminator.read.encode()
     ).decode()
 
+  def submit(
+      self, func: Callable[..., _R], *args, **kwargs
+  ) -> futures.Future[_R]:
+    """Run a blocking call on the worker thread of this data handler.
+
+    There is only one worker per data handler, since the instruments are not
+    safe to drive from several threads at once. The calls for one interface
+    still go out one at a time and in the order they were submitted, while the
+    calls submitted to other instruments run at the same time. Use
+    concurrent.futures.wait on the returned futures to synchronize.
+
+    Args:
+        func (Callable): The blocking call, usually a method of the instrument.
+        *args: The positional arguments of func.
+        **kwargs: The keyword arguments of func.
+
+    Returns:
+        futures.Future: The future of the return value of func.
+    """
+    if self._executor is None:
+      self._executor = futures.ThreadPoolExecutor(
+          max_workers=1, thread_name_prefix='DataHandler'
+      )
+    return self._executor.submit(func, *args, **kwargs)
+
+  async def run_async(self, func: Callable[..., _R], *args, **kwargs) -> _R:
+    """Run a blocking call without blocking the event loop.
+
+    The call runs on the worker thread of this data handler, see submit. The
+    overlap comes from other instruments and other coroutines running in the
+    meantime.
+
+    Args:
+        func (Callable): The blocking call, usually a method of the instrument.
+        *args: The positional arguments of func.
+        **kwargs: The keyword arguments of func.
+
+    Returns:
+        The return value of func.
+    """
+    return await asyncio.wrap_future(self.submit(func, *args, **kwargs))
+
+  async def send_async(
+      self, command: str, timeout: int = -1, key: Any = None
+  ) -> None:
+    """Send command to the interface without blocking the event loop.
+
+    See run_async and send.
+
+    Args:
+        command (str): The command to send.
+        timeout (int, optional): Timeout in seconds. Defaults to -1.
+        key (Any, optional): Identifies the setting the command writes, see
+          send. Defaults to None.
+    """
+    await self.run_async(self.send, command, timeout=timeout, key=key)
+
+  async def query_async(
+      self, command: str, timeout: int = -1, size: int = -1
+  ) -> str:
+    """Query the interface without blocking the event loop, see run_async.
+
+    Args:
+        command (str): The command to query.
+        timeout (int, optional): Timeout in seconds. Defaults to -1.
+        size (int, optional): The size to read back. Defaults to -1.
+
+    Returns:
+        str: The data from the interface.
+    """
+    return await self.run_async(
+        self.query, command, timeout=timeout, size=size
+    )
+
   def query_raw(self, data: bytes, timeout: int = -1, size: int = -1) -> bytes:
     return self.query_datagram(
         self._build_bytes_datagram(data),
@@ -628,12 +1020,56 @@ class DataHandler:
         timeout=timeout,
     ).data
 
+  def query_block(self, command: str, timeout: int = -1) -> bytes:
+    """Query a reply sent as an IEEE 488.2 definite length block.
+
+    Args:
+        command (str): The command to query.
+        timeout (int, optional): Timeout in seconds. Defaults to -1.
+
+    Returns:
+        bytes: The payload of the block.
+    """
+    return self.query_datagram(
+        self._build_bytes_datagram(command.encode()),
+        datagram.BlockDatagram(
+            recv_term=self.interface.connect_config.terminator.read.encode()
+        ),
+        timeout=timeout,
+    ).data
+
+  def query_binary_values(
+      self,
+      command: str,
+      datatype: str = 'f',
+      is_big_endian: bool = False,
+      timeout: int = -1,
+  ) -> list[float]:
+    """Query a reply sent as an IEEE 488.2 definite length block.
+
+    Args:
+        command (str): The command to query.
+        datatype (str, optional): The array typecode of each value. Defaults
+          to 'f', a 32 bit float.
+        is_big_endian (bool, optional): The byte order of the values. Defaults
+          to False.
+        timeout (int, optional): Timeout in seconds. Defaults to -1.
+
+    Returns:
+        list[float]: The values in the block.
+    """
+    values = array.array(datatype, self.query_block(command, timeout=timeout))
+    if is_big_endian != (sys.byteorder == 'big'):
+      values.byteswap()
+    return values.tolist()
+
   def query_datagram(
       self, send_dg: datagram.Datagram, recv_dg: T, timeout: int = -1
   ) -> T:
-    self.interface.set_timeout(timeout)
-    self.send_dataram(send_dg)
-    return self.recv_dataram(recv_dg)
+    with self.interface.io_lock:
+      self.interface.set_timeout(timeout)
+      self.send_dataram(send_dg)
+      return self.recv_dataram(recv_dg)
 
 
 class ComInterfaceClass(ComInterfaceClassBase):
@@ -650,6 +1086,9 @@ class ComInterfaceClass(ComInterfaceClassBase):
     self.timeout = -1
     self.enable = False
     self.buf = BytesBuffer()
+    # Held by the data handlers for a query, so the replies of the threads
+    # sharing this interface can not interleave.
+    self.io_lock = threading.RLock()
 
   def __del__(self) -> None:
     self.close()
@@ -742,6 +1181,31 @@ class ComInterfaceClass(ComInterfaceClassBase):
     logging.debug('Recv RAW %s', mesg)
     return mesg
 
+  def recv_block(self, size: int) -> bytes:
+    """Receive exactly size bytes of binary data from the interface.
+
+    Unlike recv_raw, the data is read as is, so a terminator byte inside it
+    neither ends the read nor is dropped.
+
+    Args:
+        size (int): The size to read back
+
+    Returns:
+        (bytes): The binary data from the instrument.
+    """
+    try:
+      mesg = self._recv_block(size)
+    except:
+      logging.exception('Recv Block ERROR')
+      raise
+    logging.debug('Recv Block %s', mesg)
+    return mesg
+
+  def _recv_block(self, size: int) -> bytes:
+    # The interfaces whose sized read already leaves the data untouched use
+    # it as is, the others override this.
+    return self._recv(size)
+
   def query_raw(self, data: bytes, size: int = -1) -> bytes:
     """Query RAW command to the interface.
 
@@ -776,6 +1240,10 @@ def select(connect_config: ConnectConfig) -> ComInterfaceClass:
   """
   logging.debug('Init cominterface select')
 
+  # The interfaces and drivers adjust their own config, such as the
+  # terminators, so they get a copy and the caller's config is left as is.
+  connect_config = copy.deepcopy(connect_config)
+
   try:
     module_name = connect_config.interface_type
     test_name_list = [item.capitalize() for item in module_name.split('_')]
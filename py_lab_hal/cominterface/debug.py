@@ -38,8 +38,15 @@ class Debug(cominterface.ComInterfaceClass):
     self._send_queue.put_nowait(data)
 
   def _recv(self, size=0) -> bytes:
+    if self.buf:
+      return bytes(self.buf.get(len(self.buf)))
     return self._recv_queue.get_nowait()
 
+  def _recv_block(self, size) -> bytes:
+    while len(self.buf) < size:
+      self.buf.put(self._recv_queue.get_nowait())
+    return bytes(self.buf.get(size))
+
   def _query(self, data) -> bytes:
     self._send(data)
     return self._recv()
@@ -14,6 +14,7 @@
 
 """Child ComInterfaceClass Module of DMX."""
 
+from collections.abc import Sequence
 import struct
 
 from py_lab_hal.cominterface import serial
@@ -146,6 +147,23 @@ class Dmx(serial.Serial):
     """
     self.data[channel - 1] = value
 
+  def set_values(self, start_channel: int, values: Sequence[int]) -> None:
+    """Set consecutive channel values in one call.
+
+    Args:
+      start_channel (int): The channel of the first value, from 1 to 512
+      values (Sequence[int]): The values of start_channel and the channels
+        following it
+
+    Raises:
+        ValueError: The channels do not fit in the 512 DMX channels.
+    """
+    start = start_channel - 1
+    end = start + len(values)
+    if start < 0 or end > DMX_SIZE:
+      raise ValueError('The channels should between 1 - 512')
+    self.data[start:end] = values
+
   def _query(self, data, size) -> bytes:
     raise NotImplementedError('DMX did not support read and query.')
 
@@ -88,6 +88,14 @@ class Serial(cominterface.ComInterfaceClass):
         raise TimeoutError('Serial read timeout')
       self.buf.put(read_back)
 
+  def _recv_block(self, size) -> bytes:
+    while len(self.buf) < size:
+      read_back = self._serial.read(size - len(self.buf))
+      if not read_back:
+        raise TimeoutError('Serial read timeout')
+      self.buf.put(read_back)
+    return bytes(self.buf.get(size))
+
   def _query(self, data, size) -> bytes:
     self.send_raw(data)
     return self.recv_raw(size)
@@ -31,6 +31,10 @@ class Socket(cominterface.ComInterfaceClass):
   def _open(self) -> None:
     self.connect_config.interface_type = 'socket'
     self._socket = socket.socket()
+    # SCPI commands are small writes that each wait for a reply, so Nagle's
+    # algorithm would hold every one of them back until the delayed ACK.
+    self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
     logging.info(
         'Connecting to %s port %d',
         self.connect_config.network.host,
@@ -96,6 +96,9 @@ class Visa(cominterface.ComInterfaceClass):
       return self._inst.read().encode()
     return self._inst.read_bytes(count=size, break_on_termchar=True).strip()
 
+  def _recv_block(self, size) -> bytes:
+    return self._inst.read_bytes(count=size, break_on_termchar=False)
+
   def _query(self, data: bytes, size) -> bytes:
     self.send_raw(data)
     return self.recv_raw(size)
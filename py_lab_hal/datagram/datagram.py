@@ -160,6 +160,47 @@ class PngDatagram(Datagram):
     return chunk_size + chunk_data
 
 
+class BlockDatagram(Datagram):
+  """The datagram for the IEEE 488.2 definite length arbitrary block.
+
+  Properties:
+    recv_term (bytes): The term sent after the block.
+    data (bytes): The payload of the block.
+  """
+
+  def __init__(self, recv_term: bytes = b'', data: bytes = b''):
+    self.recv_term = recv_term
+    self.data = data
+
+  def send(self, interface) -> None:
+    """Sends the datagram to the interface.
+
+    Args:
+      interface: The interface to send the datagram to.
+    """
+    pass
+
+  def recv(self, interface) -> None:
+    """Receives the datagram from the interface.
+
+    Args:
+      interface: The interface to receive the datagram from.
+
+    Raises:
+      ValueError: The reply is not a definite length block.
+    """
+    header = interface.recv_block(2)
+    if header[:1] != b'#' or not header[1:2].isdigit() or header[1:2] == b'0':
+      raise ValueError(f'Not a definite length block header: {header!r}')
+    length = int(interface.recv_block(int(header[1:2])))
+    data = b''
+    while len(data) < length:
+      data += interface.recv_block(length - len(data))
+    self.data = data
+    if self.recv_term:
+      interface.recv_block(len(self.recv_term))
+
+
 class HttpDatagram(Datagram):
   """The datagram for the http protocol.
 
@@ -20,6 +20,7 @@ cominterface, dut_interface, and the instrument will be created. Use get_object
 function to get the object that is in the py-lab-hal layer in this runtime.
 """
 
+from concurrent import futures
 import dataclasses
 import logging
 from typing import Literal, overload
@@ -31,6 +32,7 @@ from py_lab_hal.instrument import instrument
 from py_lab_hal.util import json_dataclass
 
 
+@json_dataclass.dataclass_json_codegen
 @dataclasses.dataclass
 class PyLabHALCom(json_dataclass.DataClassJsonCamelMixIn):
   """The py-lab-hal cominterface in py-lab-hal env.
@@ -43,10 +45,8 @@ class PyLabHALCom(json_dataclass.DataClassJsonCamelMixIn):
   name: str
   config: cominterface.ConnectConfig
 
-  def __post_init__(self) -> None:
-    self.config.__post_init__()
-
 
+@json_dataclass.dataclass_json_codegen
 @dataclasses.dataclass
 class PyLabHALDut(json_dataclass.DataClassJsonCamelMixIn):
   """The py-lab-hal dut_interface in py-lab-hal env.
@@ -60,6 +60,7 @@ class PyLabHALDut(json_dataclass.DataClassJsonCamelMixIn):
   config: interface.DUTConnectConfig
 
 
+@json_dataclass.dataclass_json_codegen
 @dataclasses.dataclass
 class PyLabHALInst(json_dataclass.DataClassJsonCamelMixIn):
   """The py-lab-hal instrument in py-lab-hal env.
@@ -77,6 +78,7 @@ class PyLabHALInst(json_dataclass.DataClassJsonCamelMixIn):
   config: instrument.InstrumentConfig
 
 
+@json_dataclass.dataclass_json_codegen
 @dataclasses.dataclass
 class EnvConfig(json_dataclass.DataClassJsonCamelMixIn):
   """The env config in py-lab-hal env.
@@ -99,6 +101,8 @@ def prepare_com(
 ) -> dict[str, cominterface.ComInterfaceClass]:
   """Init the cominterface based on the config.
 
+  The interfaces are opened concurrently.
+
   Args:
       full_data (list[PyLabHALCom]): The config for cominterface.
 
@@ -108,7 +112,12 @@ def prepare_com(
   ans = {}
   for item in full_data:
     ans[item.name] = cominterface.select(connect_config=item.config)
-    ans[item.name].open()
+
+  if not ans:
+    return ans
+
+  with futures.ThreadPoolExecutor(max_workers=min(32, len(ans))) as executor:
+    list(executor.map(lambda com: com.open(), ans.values()))
   return ans
 
 
@@ -143,13 +152,12 @@ def prepare_inst(
   Returns:
       dict[str, instrument.Instrument]: The dict for Instrument.
   """
-  build = builder.PyLabHALBuilder()
   ans = {}
   for item in full_data:
-    build.cominterface = com_dict[item.com_name]
-    build.instrument_config = item.config
-    ans[item.name] = build.build_instrument(
-        f'{item.instrument_type}.{item.module_name}'
+    ans[item.name] = builder.build_instrument(
+        f'{item.instrument_type}.{item.module_name}',
+        com_dict[item.com_name],
+        item.config,
     )
   return ans
 
@@ -168,6 +176,11 @@ class PyLabHALLayer:
     except:
       logging.exception('Get Error while setup connection or instrument.')
       raise
+    self._layer_maps = {
+        'cominterface': self._com,
+        'dut_interface': self._dut,
+        'instrument': self._inst,
+    }
 
   @property
   def com(self) -> dict[str, cominterface.ComInterfaceClass]:
@@ -209,10 +222,4 @@ class PyLabHALLayer:
     Returns:
         The object in the py-lab-hal layer.
     """
-    interface_mapping = {
-        'cominterface': self.com,
-        'dut_interface': self.dut,
-        'instrument': self.inst,
-    }
-    interface_dict = interface_mapping[layer_type]
-    return interface_dict[name]
+    return self._layer_maps[layer_type][name]
@@ -24,6 +24,7 @@ The origin is located at the top left corner.
 from __future__ import annotations
 
 import enum
+import functools
 import logging
 import os
 import re
@@ -32,6 +33,16 @@ from py_lab_hal.cominterface import cominterface
 from py_lab_hal.instrument import instrument
 from py_lab_hal.instrument.arm import arm
 
+_MOVE_AXES = ('X', 'Y', 'Z', 'A', 'B')
+
+
+@functools.lru_cache(maxsize=8)
+def _read_route(filepath: str, mtime_ns: int, size: int) -> str:
+  """Read the route file, the mtime and size are only used as cache key."""
+  del mtime_ns, size
+  with open(filepath, 'r') as file:
+    return file.read()
+
 
 class Arch(arm.Arm):
   """Child Arm Class of Arch."""
@@ -53,6 +64,14 @@ class Arch(arm.Arm):
     REPLY_NO = '[NO]'
     EMS = '[EMS]'
 
+  _ENCODED_COMMANDS = {
+      command: command.value.encode('ascii') for command in Commands
+  }
+
+  _MOVE_TEMPLATE = (
+      f'{Commands.MOVE_TO.value} x {{X}} y {{Y}} z {{Z}} a {{A}} b {{B}}'
+  )
+
   def __init__(
       self,
       com: cominterface.ComInterfaceClass,
@@ -82,7 +101,7 @@ class Arch(arm.Arm):
       self.state[axis] = round(value)
 
   def move_to_origin(self) -> None:
-    cmd = self.Commands.MOVE_TO_ORIGIN.value
+    cmd = self._ENCODED_COMMANDS[self.Commands.MOVE_TO_ORIGIN]
     recv_data = self.__query(cmd)
     self.update_state()
     logging.info(recv_data)
@@ -95,19 +114,14 @@ class Arch(arm.Arm):
       a: float | None,
       b: float | None,
   ) -> str:
-    def axis_command(axis: str, pos: float | None) -> str:
-      axis_lower = axis.lower()
-      if pos is None:
-        return f' {axis_lower} {self.state[axis]}'
-      return f' {axis_lower} {round(pos)}'
-
-    cmd = self.Commands.MOVE_TO.value
-    cmd += axis_command('X', x)
-    cmd += axis_command('Y', y)
-    cmd += axis_command('Z', z)
-    cmd += axis_command('A', a)
-    cmd += axis_command('B', b)
-    return cmd
+    positions = (x, y, z, a, b)
+    if positions.count(None) == len(positions):
+      return self._MOVE_TEMPLATE.format_map(self.state)
+    vals = {
+        axis: self.state[axis] if pos is None else round(pos)
+        for axis, pos in zip(_MOVE_AXES, positions)
+    }
+    return self._MOVE_TEMPLATE.format_map(vals)
 
   def absolute_move_to(
       self,
@@ -141,15 +155,17 @@ class Arch(arm.Arm):
     self.update_state()
     logging.info(recv_data)
 
-  def __query(self, cmd: str) -> str:
+  def __query(self, cmd: str | bytes) -> str:
     """Query command."""
-    return self.data_handler.query_raw(bytearray(cmd.encode('ascii'))).decode(
-        'utf-8'
-    )
+    if isinstance(cmd, str):
+      cmd = cmd.encode('ascii')
+    return self.data_handler.query_raw(cmd).decode('utf-8')
 
   def get_current_position(self) -> dict[str, float]:
     """Get current position."""
-    recv_data = self.__query(self.Commands.QUERY_POSITION.value)
+    recv_data = self.__query(
+        self._ENCODED_COMMANDS[self.Commands.QUERY_POSITION]
+    )
     cur_pos = dict()
     pattern = r'(\w+)\s+(\d+\.?\d*)'
     for axis, value in re.findall(pattern, recv_data):
@@ -160,20 +176,19 @@ class Arch(arm.Arm):
     """Send route.json file."""
     if not os.path.exists(filepath):
       raise FileNotFoundError(f'{filepath} does not exit.')
-    cmd = self.Commands.SEND_FILE.value
-    with open(filepath, 'r') as file:
-      cmd = f'{cmd}{file.read()}'
-      resp_data = self.__query(cmd)
-      logging.info(resp_data)
+    stat = os.stat(filepath)
+    route = _read_route(filepath, stat.st_mtime_ns, stat.st_size)
+    resp_data = self.__query(f'{self.Commands.SEND_FILE.value}{route}')
+    logging.info(resp_data)
 
   def start(self) -> None:
     """Start to perform route.json file."""
-    self.__query(self.Commands.START.value)
+    self.__query(self._ENCODED_COMMANDS[self.Commands.START])
 
   def reply_yes(self) -> None:
     """Reply yes to Arch."""
-    self.__query(self.Commands.REPLY_YES.value)
+    self.__query(self._ENCODED_COMMANDS[self.Commands.REPLY_YES])
 
   def reply_no(self) -> None:
     """Reply no to Arch."""
-    self.__query(self.Commands.REPLY_NO.value)
+    self.__query(self._ENCODED_COMMANDS[self.Commands.REPLY_NO])
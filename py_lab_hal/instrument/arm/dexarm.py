@@ -22,10 +22,11 @@ Use G-Code control commands.
 
 from __future__ import annotations
 
+import contextlib
 import enum
+import itertools
 import logging
 import re
-import time
 
 from py_lab_hal.cominterface import cominterface
 from py_lab_hal.instrument import instrument
@@ -33,6 +34,14 @@ from py_lab_hal.instrument.arm import arm
 
 Y_OFFSET = 300.0
 
+_NUM_RE = re.compile(r'[-+]?\d*\.\d+|\d+')
+
+_AXES = ('X', 'Y', 'Z', 'E', 'A', 'B', 'C')
+_THETA_BASE = _AXES.index('A')
+
+_MOVE_AXES = ('X', 'Y', 'Z', 'E')
+_MOVE_TEMPLATE = '{mode}F{feedrate}X{X}Y{Y}Z{Z}E{E}'
+
 
 class Dexarm(arm.Arm):
   """Child Arm Class of Dexarm."""
@@ -46,41 +55,78 @@ class Dexarm(arm.Arm):
       com: cominterface.ComInterfaceClass,
       inst_config: instrument.InstrumentConfig,
   ) -> None:
+    self._pipeline: list[str] | None = None
+    self._position: dict[str, float] | None = None
+    self.time_out = 10
+    com.connect_config.terminator.read = 'ok\n'
     super().__init__(com, inst_config)
     self.reset_state()
-    self.time_out = 10
 
-  def __send(self, cmd: str, wait: bool = True):
-    """Send command to arm.
+  def __send(self, cmd: str) -> str:
+    """Send command to arm and wait until arm response ok.
+
+    If the pipeline is active, the command will be queued and sent when the
+    pipeline is flushed.
 
     Args:
         cmd (str): command to send.
-        wait (bool): if wait is true, then wait until arm response ok.
+
+    Returns:
+        str: The response of the arm before ok.
+    """
+    if self._pipeline is not None:
+      self._pipeline.append(cmd)
+      return ''
+    try:
+      return self.data_handler.query(cmd, timeout=self.time_out)
+    except TimeoutError:
+      logging.warning('Wait for response ok time out.')
+      return ''
+
+  def __wait_ok(self, count: int = 1) -> None:
+    """Wait until arm response ok for the number of commands.
+
+    Args:
+        count (int): The number of ok to wait for.
+    """
+    try:
+      for _ in range(count):
+        self.data_handler.recv(timeout=self.time_out)
+    except TimeoutError:
+      logging.warning('Wait for response ok time out.')
+
+  @contextlib.contextmanager
+  def pipeline(self):
+    """Queue the commands and send them to the arm in a single write.
+
+    The commands sent inside the context are joined with newlines and written
+    once on exit, then the ok of every command is read back, so no ok is left
+    to answer a later command. The state is read back from the arm once the
+    pipeline is flushed.
+
+    Yields:
+        Dexarm: The arm itself.
     """
-    self.data_handler.send(cmd)
-    if not wait:
+    self._pipeline = []
+    try:
+      yield self
+    except:
+      self._pipeline = None
+      raise
+    cmds, self._pipeline = self._pipeline, None
+    if not cmds:
       return
-    cur_time = time.time()
-    while time.time() < cur_time + self.time_out:
-      recv_data = self.data_handler.recv()
-      if recv_data and recv_data.find('ok') >= 0:
-        return
-    logging.warning('Wait for response ok time out.')
+    self.data_handler.send_batch(cmds, separator='\n')
+    self.__wait_ok(len(cmds))
+    self.update_state()
 
   def wait(self) -> None:
     """Wait until previous operation finish."""
     self.__send('M400')
+    self._position = None
 
   def reset_state(self):
-    self.state = {
-        'X': 0.0,
-        'Y': 0.0,
-        'Z': 0.0,
-        'E': 0.0,
-        'A': 0.0,
-        'B': 0.0,
-        'C': 0.0,
-    }
+    self.state = {axis: 0.0 for axis in _AXES}
 
   def get_state(self) -> dict[str, float]:
     """Return arm's current state."""
@@ -89,6 +135,8 @@ class Dexarm(arm.Arm):
 
   def update_state(self) -> None:
     """Get current position and update state."""
+    if self._pipeline is not None:
+      return
     cur_pos = self.get_current_position()
     if not cur_pos:
       logging.warning('Fail to update state.')
@@ -99,6 +147,7 @@ class Dexarm(arm.Arm):
   def move_to_origin(self) -> None:
     """Move to the original position."""
     self.__send('M1112')
+    self._position = None
     self.update_state()
 
   def prepare_move_command(
@@ -110,17 +159,12 @@ class Dexarm(arm.Arm):
       feedrate: float,
       mode: str,
   ) -> str:
-    def axis_command(axis: str, pos: float | None) -> str:
-      if pos is None:
-        return f'{axis}{self.state[axis]+(0.0 if axis != "Y" else Y_OFFSET)}'
-      return f'{axis}{round(pos)+(0.0 if axis != "Y" else Y_OFFSET)}'
-
-    cmd = f'{mode}F{feedrate}'
-    cmd += axis_command('X', x)
-    cmd += axis_command('Y', y)
-    cmd += axis_command('Z', z)
-    cmd += axis_command('E', e)
-    return cmd
+    vals = {
+        axis: (self.state[axis] if pos is None else round(pos))
+        + (Y_OFFSET if axis == 'Y' else 0.0)
+        for axis, pos in zip(_MOVE_AXES, (x, y, z, e))
+    }
+    return _MOVE_TEMPLATE.format(mode=mode, feedrate=feedrate, **vals)
 
   def absolute_move_to(
       self,
@@ -131,9 +175,17 @@ class Dexarm(arm.Arm):
       feedrate: int = 10_000,
       mode: str = Mode.G1.value,
   ) -> None:
+    """Move to absolute position.
+
+    The state is updated with the target position without reading back from
+    the arm, use get_current_position to read the real position.
+    """
     cmd = self.prepare_move_command(x, y, z, e, feedrate, mode)
     self.__send(cmd)
-    self.update_state()
+    self._position = None
+    for axis, pos in zip(_MOVE_AXES, (x, y, z, e)):
+      if pos is not None:
+        self.state[axis] = float(round(pos))
 
   def relative_move_to(
       self,
@@ -144,7 +196,7 @@ class Dexarm(arm.Arm):
       feedrate: int = 10_000,
       mode: str = Mode.G1.value,
   ) -> None:
-    cmd = self.prepare_move_command(
+    self.absolute_move_to(
         x + self.state['X'],
         y + self.state['Y'],
         z + self.state['Z'],
@@ -152,33 +204,38 @@ class Dexarm(arm.Arm):
         feedrate,
         mode,
     )
-    self.__send(cmd)
-    self.update_state()
 
   def get_current_position(self) -> dict[str, float]:
-    """Get current position."""
-    self.__send('M114', wait=False)
-    coor = [i for i in self.state]
-    cur_pos = {i: 0.0 for i in coor}
-    cur_time = time.time()
-    while time.time() < cur_time + self.time_out:
-      recv_data = self.data_handler.recv()
-      if recv_data.find('X:') > -1:
-        val = re.findall(r'[-+]?\d*\.\d+|\d+', recv_data)
-        for i, value in enumerate(val):
-          cur_pos[coor[i]] = float(value) - (0.0 if i != 'Y' else Y_OFFSET)
-      if recv_data.find('DEXARM Theta') > -1:
-        val = re.findall(r'[-+]?\d*\.\d+|\d+', recv_data)
-        for i, value in enumerate(val):
-          cur_pos[coor[i + coor.index('A')]] = float(value)
-      if recv_data.find('ok') > -1:
-        return cur_pos
-    logging.warning('Get current position time out.')
-    return {}
+    """Get current position.
+
+    The position is read back from the arm only if the arm could have moved
+    since the last read, otherwise the cached position is returned.
+    """
+    if self._position is not None:
+      return dict(self._position)
+    recv_data = self.__send('M114')
+    if not recv_data:
+      logging.warning('Get current position time out.')
+      return {}
+    cur_pos = {axis: 0.0 for axis in _AXES}
+    for line in recv_data.splitlines():
+      if line.find('X:') > -1:
+        val = itertools.islice(_NUM_RE.finditer(line), _THETA_BASE)
+        for axis, value in zip(_AXES, val):
+          cur_pos[axis] = float(value.group()) - (
+              Y_OFFSET if axis == 'Y' else 0.0
+          )
+      if line.find('DEXARM Theta') > -1:
+        val = itertools.islice(_NUM_RE.finditer(line), 3)
+        for j, value in enumerate(val):
+          cur_pos[_AXES[_THETA_BASE + j]] = float(value.group())
+    self._position = cur_pos
+    return dict(cur_pos)
 
   def set_origin(self) -> None:
     """Set current position to be the origin."""
     self.__send('G92 X0 Y0 Z0 E0')
+    self._position = None
     self.update_state()
 
   def delay(self, value: float, unit: str = 's') -> None:
@@ -186,5 +243,6 @@ class Dexarm(arm.Arm):
     if unit in ['s', 'ms']:
       cmd = f'G4 S{str(value)}' if unit == 's' else f'G4 P{str(value)}'
       self.__send(cmd)
+      self._position = None
     else:
       logging.warning('Unit %s is not supported.', unit)
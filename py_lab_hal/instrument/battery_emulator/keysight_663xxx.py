@@ -14,6 +14,8 @@
 
 """Child BatteryEmulator Module of Keysight66300Series."""
 
+from __future__ import annotations
+
 from py_lab_hal.instrument.battery_emulator import battery_emulator
 
 
@@ -44,18 +46,60 @@ class Keysight66300Series(battery_emulator.BatteryEmulator):
   def enable_OVP(self, channel: int, enable: bool):
     self.data_handler.send(f'VOLT:PROT:STAT {int(enable)}')
 
+  def configure(
+      self,
+      channel: int,
+      voltage: float | None = None,
+      current: float | None = None,
+      ovp: float | None = None,
+      enable: bool | None = None,
+  ) -> None:
+    """Configures the selected channel with a single write.
+
+    Only the parameters that are not None will be sent.
+
+    Args:
+        channel (int): The specified output channel
+        voltage (float | None): The voltage of the config
+        current (float | None): The current of the config
+        ovp (float | None): The voltage of the ovp config
+        enable (bool | None): If true will enable the OVP of the channel
+    """
+    cmds = []
+    if voltage is not None:
+      cmds.append(f'VOLT{channel} {voltage}')
+    if current is not None:
+      cmds.append(f'CURR{channel} {current}')
+    if ovp is not None:
+      cmds.append(f'VOLT:PROT {ovp}')
+    if enable is not None:
+      cmds.append(f'VOLT:PROT:STAT {int(enable)}')
+    self.data_handler.send_batch(cmds, separator=';:')
+
   def set_range(self, channel, range_type, max_value):
     pass
 
   def measure_current(self, channel) -> float:
-    self.data_handler.send(f'MEAS:SCAL:CURR{channel}?')
-    return float(self.data_handler.recv())
+    return float(self.data_handler.query(f'MEAS:SCAL:CURR{channel}?'))
 
   def measure_voltage(self, channel) -> float:
-    self.data_handler.send(f'MEAS:SCAL:VOLT{channel}?')
-    return float(self.data_handler.recv())
+    return float(self.data_handler.query(f'MEAS:SCAL:VOLT{channel}?'))
+
+  def measure_vi(self, channel) -> tuple[float, float]:
+    """Measures the voltage and current with a single query.
+
+    Args:
+        channel (int): The specified channel.
+
+    Returns:
+        tuple[float, float]: The output voltage in volts and the output
+        current in amperes.
+    """
+    v, i = self.data_handler.query(
+        f'MEAS:SCAL:VOLT{channel}?;:MEAS:SCAL:CURR{channel}?'
+    ).split(';')
+    return float(v), float(i)
 
   def measure_power(self, channel) -> float:
-    v = self.measure_voltage(channel)
-    i = self.measure_current(channel)
+    v, i = self.measure_vi(channel)
     return i * v
@@ -14,12 +14,83 @@
 
 """Child Colormeter Module of Admesy Hyperion."""
 
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+import struct
+
 from py_lab_hal.instrument.color_meter import color_meter
 
+# The measurements that take no argument, keyed by the name used in
+# measure_bulk.
+MEASUREMENTS = {
+    'XYZ': ':MEASure:XYZ',
+    'Yxy': ':MEASure:YXY',
+    'Yuv': ':MEASure:YUV ',
+    'CCT': ':MEASure:CCT',
+    'luminance': ':MEASure:Y',
+    'colortemp': ':MEASure:TEMPerature ',
+    'dwl': ':MEASure:DWL',
+    'delta_temp': ':MEASure:DTCAL',
+    'all': ':MEASure:ALL ',
+}
+
+_XYZ = struct.Struct('<3f')
+
+
+def parse_xyz(reply: bytes | str) -> list[tuple[float, float, float]]:
+  """Groups a reply of XYZ values into (X, Y, Z) tuples.
+
+  Args:
+      reply: The payload of a binary block of 32 bit floats, or the comma
+        separated ASCII reply.
+
+  Returns:
+      list[tuple[float, float, float]]: The X, Y, Z of each sample.
+  """
+  if isinstance(reply, bytes):
+    return list(_XYZ.iter_unpack(reply))
+  values = [float(value) for value in reply.split(',')]
+  return list(zip(values[0::3], values[1::3], values[2::3]))
+
 
 class AdmesyHyperion(color_meter.ColorMeter):
   """Child Colormeter Class of Admesy Hyperion."""
 
+  def measure_bulk(self, names: Iterable[str]) -> dict[str, str]:
+    """Run several measurements back to back.
+
+    Args:
+        names: The measurements to run, keys of MEASUREMENTS.
+
+    Returns:
+        dict[str, str]: The raw reply of each measurement keyed by name.
+    """
+    commands = {name: MEASUREMENTS[name] for name in names}
+    return {
+        name: self.data_handler.query(command)
+        for name, command in commands.items()
+    }
+
+  async def ameasure_bulk(self, names: Iterable[str]) -> dict[str, str]:
+    """Run several measurements without blocking the event loop.
+
+    The queries are still sent one at a time, so this only pays off when other
+    instruments or coroutines are awaited alongside it.
+
+    Args:
+        names: The measurements to run, keys of MEASUREMENTS.
+
+    Returns:
+        dict[str, str]: The raw reply of each measurement keyed by name.
+    """
+    commands = {name: MEASUREMENTS[name] for name in names}
+    replies = await asyncio.gather(
+        *(self.data_handler.query_async(cmd) for cmd in commands.values())
+    )
+    return dict(zip(commands, replies))
+
   def measure_XYZ(self) -> str:
     """Measure XYZ.
 
@@ -196,7 +267,74 @@ class AdmesyHyperion(color_meter.ColorMeter):
     Returns:
       str: dt, clip, XYZ data.
     """
-    return self.data_handler.query(':SAMPle:XYZ {samples},{delay}')
+    return self.data_handler.query(f':SAMPle:XYZ {samples},{delay}')
+
+  def enable_binary_transfer(self, enable: bool = True) -> None:
+    """Selects whether replies are sent as 32 bit float blocks or as ASCII.
+
+    The *_values methods need the binary transfer enabled.
+
+    Args:
+        enable: If true the replies are sent as binary blocks.
+    """
+    data_format = 'REAL,32' if enable else 'ASCii'
+    self.data_handler.send(f':FORMat:DATA {data_format}')
+
+  def measure_sample_Y_values(self, samples: int, delay: int) -> list[float]:
+    """Same as measure_sample_Y, read back as a binary block.
+
+    Args:
+        samples: Number of samples.
+        delay: Delay in number of samples.
+
+    Returns:
+        list[float]: dt, clip, Y data
+    """
+    return self.data_handler.query_binary_values(
+        f':SAMPLE:Y {samples},{delay}'
+    )
+
+  def measure_sample_XYZ_values(self, samples: int, delay: int) -> list[float]:
+    """Same as measure_sample_XYZ, read back as a binary block.
+
+    Args:
+        samples: Number of samples.
+        delay: Delay in number of samples.
+
+    Returns:
+        list[float]: dt, clip, XYZ data.
+    """
+    return self.data_handler.query_binary_values(
+        f':SAMPle:XYZ {samples},{delay}'
+    )
+
+  def measure_sequence_XYZ_values(self, frames: int) -> list[float]:
+    """Same as measure_sequence_XYZ, read back as a binary block.
+
+    Args:
+        frames: Number of frames.
+
+    Returns:
+        list[float]: X, Y, Z, clip, noise
+    """
+    return self.data_handler.query_binary_values(f':MEASure:SEQXYZ {frames}')
+
+  def measure_sequence_XYZ_frames(
+      self, frames: int
+  ) -> list[tuple[float, float, float]]:
+    """Same as measure_sequence_XYZ, grouped into the XYZ of each frame.
+
+    This needs the binary transfer enabled.
+
+    Args:
+        frames: Number of frames.
+
+    Returns:
+        list[tuple[float, float, float]]: The X, Y, Z of each frame.
+    """
+    return parse_xyz(
+        self.data_handler.query_block(f':MEASure:SEQXYZ {frames}')
+    )
 
   def measure_all(self) -> str:
     """Measure all data XYZ and Yxy calibrated, XYZ without Calibration and XYZ saturation.
@@ -14,6 +14,9 @@
 
 """Common Layer for Keysight DMMs."""
 
+from __future__ import annotations
+
+from py_lab_hal.cominterface import cominterface
 from py_lab_hal.instrument import instrument
 from py_lab_hal.instrument.dmm.dmm import DMM
 from py_lab_hal.util import util
@@ -58,12 +61,21 @@ VALUE_RANGE = {
 def _map_value_range(value):
   if isinstance(value, instrument.ValueRange):
     return util.get_from_dict(VALUE_RANGE, value)
-  return
+  return value
 
 
 class KeysightDMM(DMM):
   """Parent Common Abstract Class of Keysight Common."""
 
+  def __init__(
+      self,
+      com: cominterface.ComInterfaceClass,
+      inst_config: instrument.InstrumentConfig,
+  ) -> None:
+    super().__init__(com, inst_config)
+    self.channel_modes = {}
+    self._channel_mode_str: dict[int, str] = {}
+
   def error_check(self) -> None:
     error_code, error_message = self.data_handler.query('system:error?').split(
         ','
@@ -76,15 +88,26 @@ class KeysightDMM(DMM):
     self.data_handler.send(':read?')
     return float(self.data_handler.recv())
 
-  def _get_channel_mode(self, channel: int):
-    return util.get_from_dict(CHANNEL_MODE, self.channel_modes[channel])
+  def _get_channel_mode(self, channel: int) -> str:
+    try:
+      return self._channel_mode_str[channel]
+    except KeyError:
+      return self._set_channel_mode_str(channel, self.channel_modes[channel])
+
+  def _set_channel_mode_str(
+      self, channel: int, mode: instrument.ChannelMode
+  ) -> str:
+    channel_mode = self._channel_mode_str[channel] = util.get_from_dict(
+        CHANNEL_MODE, mode
+    )
+    return channel_mode
 
   def _sense_command(self, channel, config_type, value):
     channel_mode = self._get_channel_mode(channel)
     self.data_handler.send(f'{channel_mode}:{config_type} {value}')
 
   def _config_channel_mode(self, channel, mode):
-    channel_mode = util.get_from_dict(CHANNEL_MODE, mode)
+    channel_mode = self._set_channel_mode_str(channel, mode)
     self.data_handler.send(f'CONF:{channel_mode}')
 
   def config_range(self, channel, value=instrument.ValueRange.DEFFULT):
@@ -14,6 +14,11 @@
 
 """Common code for Keysight N6705C."""
 
+from __future__ import annotations
+
+from collections.abc import Sequence
+import functools
+
 from py_lab_hal.cominterface import cominterface
 from py_lab_hal.instrument import instrument
 from py_lab_hal.util import util
@@ -25,20 +30,20 @@ def get_polarity(value: float):
   return 'NEG'
 
 
-POSITIVE_VOLTAGE = [
+POSITIVE_VOLTAGE = frozenset({
     instrument.SmuEmulationMode.PS2Q,
     instrument.SmuEmulationMode.PS1Q,
     instrument.SmuEmulationMode.BATTERY,
     instrument.SmuEmulationMode.CHARGER,
     instrument.SmuEmulationMode.CVLOAD,
-]
+})
 
-POSITIVE_CURRENT = [
+POSITIVE_CURRENT = frozenset({
     instrument.SmuEmulationMode.PS1Q,
     instrument.SmuEmulationMode.CHARGER,
-]
+})
 
-NEGATIVE_CURRENT = [instrument.SmuEmulationMode.CCLOAD]
+NEGATIVE_CURRENT = frozenset({instrument.SmuEmulationMode.CCLOAD})
 
 CHANNEL_MODE = {
     instrument.ChannelMode.VOLTAGE_DC: 'VOLTage',
@@ -53,6 +58,26 @@ EDGE_SLOPE = {
 }
 
 
+# Whether the voltage and the current are written as a limit for each
+# priority mode. The priority modes missing here can not set either.
+VOLTAGE_IS_LIMIT = {
+    instrument.ChannelMode.VOLTAGE_DC: False,
+    instrument.ChannelMode.CURRENT_DC: True,
+}
+
+CURRENT_IS_LIMIT = {
+    instrument.ChannelMode.VOLTAGE_DC: True,
+    instrument.ChannelMode.CURRENT_DC: False,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _level_header(mode: instrument.ChannelMode, limit_polarity: str) -> bytes:
+  limit_command = f':LIM:{limit_polarity}' if limit_polarity else ''
+  mode_str = util.get_from_dict(CHANNEL_MODE, mode)
+  return f'SOUR:{mode_str}{limit_command} '.encode()
+
+
 def check_current_input(
     value: float, emulation_mode: instrument.SmuEmulationMode
 ):
@@ -80,15 +105,60 @@ class KeysightN6705c(instrument.Instrument):
     super().__init__(com, inst_config)
     self.priority = instrument.ChannelMode.VOLTAGE_DC
     self.emulation_mode = instrument.SmuEmulationMode.BATTERY
+    self._measure_commands: dict[tuple[str, int], bytes] = {}
+    self._chan_suffix: dict[int | tuple[int, ...], bytes] = {}
+
+  @property
+  def priority(self) -> instrument.ChannelMode:
+    return self._priority
+
+  @priority.setter
+  def priority(self, priority: instrument.ChannelMode) -> None:
+    self._priority = priority
+    self._voltage_is_limit = VOLTAGE_IS_LIMIT.get(priority)
+    self._current_is_limit = CURRENT_IS_LIMIT.get(priority)
+
+  @property
+  def emulation_mode(self) -> instrument.SmuEmulationMode:
+    return self._emulation_mode
+
+  @emulation_mode.setter
+  def emulation_mode(self, mode: instrument.SmuEmulationMode) -> None:
+    self._emulation_mode = mode
+    self._require_pos_v = mode in POSITIVE_VOLTAGE
+    self._require_pos_i = mode in POSITIVE_CURRENT
+    self._require_neg_i = mode in NEGATIVE_CURRENT
 
   # Helper function for N6705C
 
+  def _channel_suffix(self, channel: int | Sequence[int]) -> bytes:
+    if not isinstance(channel, int):
+      channel = tuple(channel)
+    try:
+      return self._chan_suffix[channel]
+    except KeyError:
+      channel_list = (
+          str(channel)
+          if isinstance(channel, int)
+          else ','.join(map(str, channel))
+      )
+      suffix = self._chan_suffix[channel] = f',(@{channel_list})'.encode()
+      return suffix
+
   def select_mode(
       self,
       channel: int,
       mode: instrument.SmuEmulationMode = instrument.SmuEmulationMode.BATTERY,
+      force: bool = False,
   ):
-    self.data_handler.send(f'EMULation {mode.value},(@{channel})')
+    self._write_if_changed(
+        ('EMUL', channel),
+        mode,
+        self.data_handler.send,
+        f'EMULation {mode.value},(@{channel})',
+        force=force,
+    )
+    self.emulation_mode = mode
 
   def set_level(
       self,
@@ -97,25 +167,42 @@ class KeysightN6705c(instrument.Instrument):
       value: float,
       is_limit: bool = False,
   ):
-    limit_command = f':LIM:{get_polarity(value)}' if is_limit else ''
-    mode = util.get_from_dict(CHANNEL_MODE, mode)
-    self.data_handler.send(f'SOUR:{mode}{limit_command} {value},(@{channel})')
+    header = _level_header(mode, get_polarity(value) if is_limit else '')
+    self.data_handler.send_bytes(
+        header + str(value).encode() + self._channel_suffix(channel),
+        key=(header, channel),
+    )
 
   # The function for the Instrument
 
-  def set_priority(self, channel: int, priority: instrument.ChannelMode):
-    self.data_handler.send(f'FUNC {priority.value}, (@{channel})')
+  def set_priority(
+      self, channel: int, priority: instrument.ChannelMode, force: bool = False
+  ):
+    self._write_if_changed(
+        ('FUNC', channel),
+        priority,
+        self.data_handler.send,
+        f'FUNC {priority.value}, (@{channel})',
+        force=force,
+    )
+    # Kept with the written state, so it is forgotten along with it.
+    self._state['FUNC?', channel] = util.get_from_dict(CHANNEL_MODE, priority)
     self.priority = priority
 
   def enable_output(self, channel, enable):
-    self.data_handler.send(f'OUTP:STATE {int(enable)},(@{channel})')
+    self.data_handler.send_bytes(
+        (b'OUTP:STATE 1' if enable else b'OUTP:STATE 0')
+        + self._channel_suffix(channel)
+    )
 
   def enable_remote_sense(self, channel, enable):
     if enable == 1:
-      rem = 'EXT'
+      rem = b'EXT'
     else:
-      rem = 'INT'
-    self.data_handler.send(f'VOLT:SENS:SOUR {rem},(@{channel})')
+      rem = b'INT'
+    self.data_handler.send_bytes(
+        b'VOLT:SENS:SOUR ' + rem + self._channel_suffix(channel)
+    )
 
   def enable_OCP(self, channel, enable):
     self.data_handler.send(f'SOUR:CURR:PROT:STAT {int(enable)}, (@{channel})')
@@ -124,48 +211,126 @@ class KeysightN6705c(instrument.Instrument):
     self.data_handler.send(f'SOUR:VOLT:PROT:STAT {int(enable)}, (@{channel})')
 
   def set_output_voltage(self, channel, voltage):
-    check_voltage_input(voltage, self.emulation_mode)
-    if self.priority == instrument.ChannelMode.VOLTAGE_DC:
-      self.set_level(channel, instrument.ChannelMode.VOLTAGE_DC, voltage, False)
-    elif self.priority == instrument.ChannelMode.CURRENT_DC:
-      self.set_level(channel, instrument.ChannelMode.VOLTAGE_DC, voltage, True)
-    else:
-      raise RuntimeError(f'Can not set current in this mode {self.priority}')
+    if voltage < 0 and self._require_pos_v:
+      raise RuntimeError('Voltage can not be less than 0')
+    if self._voltage_is_limit is None:
+      raise RuntimeError(f'Can not set voltage in this mode {self.priority}')
+    self.set_level(
+        channel,
+        instrument.ChannelMode.VOLTAGE_DC,
+        voltage,
+        self._voltage_is_limit,
+    )
 
   def set_output_current(self, channel, current):
-    check_current_input(current, self.emulation_mode)
-    if self.priority == instrument.ChannelMode.VOLTAGE_DC:
-      self.set_level(channel, instrument.ChannelMode.CURRENT_DC, current, True)
-    elif self.priority == instrument.ChannelMode.CURRENT_DC:
-      self.set_level(channel, instrument.ChannelMode.CURRENT_DC, current, False)
-    else:
+    if current < 0 and self._require_pos_i:
+      raise RuntimeError('Current can not be less than 0')
+    if current > 0 and self._require_neg_i:
+      raise RuntimeError('Current can not be greater than 0')
+    if self._current_is_limit is None:
       raise RuntimeError(f'Can not set current in this mode {self.priority}')
+    self.set_level(
+        channel,
+        instrument.ChannelMode.CURRENT_DC,
+        current,
+        self._current_is_limit,
+    )
 
   def set_OVP_value(self, channel, ovp_voltage):
+    header = f'SOUR:VOLT:PROT:REM:{get_polarity(ovp_voltage)}'
     self.data_handler.send(
-        f'SOUR:VOLT:PROT:REM:{get_polarity(ovp_voltage)} {ovp_voltage},(@{channel})'
+        f'{header} {ovp_voltage},(@{channel})', key=(header, channel)
     )
 
   def set_range(self, channel, range_type, max_value):
     range_type = util.get_from_dict(CHANNEL_MODE, range_type)
-    self.data_handler.send(f'SOUR:{range_type}:RANG {max_value},(@{channel})')
+    self.data_handler.send_bytes(
+        f'SOUR:{range_type}:RANG {max_value}'.encode()
+        + self._channel_suffix(channel)
+    )
 
   def set_slewrate(self, channel, edge, rate):
-    mode = self.data_handler.query(f'FUNC? (@{channel})')
+    mode = self._state.get(('FUNC?', channel))
+    if mode is None:
+      mode = self._state['FUNC?', channel] = self.data_handler.query(
+          f'FUNC? (@{channel})'
+      )
     edge = util.get_from_dict(EDGE_SLOPE, edge)
     self.data_handler.send(f'{mode}:SLEW:{edge} {rate},(@{channel})')
 
   def short_output(self, channel, enable):
-    self.data_handler.send(f'OUTPut:SHORt {int(enable)},(@{channel}')
+    self.data_handler.send_bytes(
+        (b'OUTPut:SHORt 1' if enable else b'OUTPut:SHORt 0')
+        + self._channel_suffix(channel)
+    )
+
+  def enable_output_shorted(self, channel, short, enable):
+    """Sets the output short and the output state in one write.
+
+    Args:
+        channel (int): The specified output channel.
+        short (bool): If true will short the output of the channel.
+        enable (bool): If true will enable the output of the channel.
+    """
+    with self.data_handler.batch(self.COMMAND_SEPARATOR):
+      self.short_output(channel, short)
+      self.enable_output(channel, enable)
+
+  def _measure(self, quantity: str, channel: int) -> float:
+    try:
+      command = self._measure_commands[quantity, channel]
+    except KeyError:
+      command = f'measure:scalar:{quantity}? (@{channel})'.encode()
+      self._measure_commands[quantity, channel] = command
+    return float(self.data_handler.query_raw(command))
+
+  def _measure_many(
+      self, quantity: str, channels: Sequence[int]
+  ) -> list[float]:
+    channel_list = ','.join(map(str, channels))
+    reply = self.data_handler.query_raw(
+        f'measure:scalar:{quantity}? (@{channel_list})'.encode()
+    )
+    return [float(value) for value in reply.split(b',')]
+
+  def measure_current_many(self, channels: Sequence[int]) -> list[float]:
+    """Measures the current of several channels in one query.
+
+    Args:
+        channels: The channels to measure.
+
+    Returns:
+        list[float]: The current of each channel, in the order of channels.
+    """
+    return self._measure_many('current', channels)
+
+  def measure_voltage_many(self, channels: Sequence[int]) -> list[float]:
+    """Measures the voltage of several channels in one query.
+
+    Args:
+        channels: The channels to measure.
+
+    Returns:
+        list[float]: The voltage of each channel, in the order of channels.
+    """
+    return self._measure_many('voltage', channels)
+
+  def measure_power_many(self, channels: Sequence[int]) -> list[float]:
+    """Measures the power of several channels in one query.
+
+    Args:
+        channels: The channels to measure.
+
+    Returns:
+        list[float]: The power of each channel, in the order of channels.
+    """
+    return self._measure_many('power', channels)
 
   def measure_current(self, channel) -> float:
-    self.data_handler.send(f'measure:scalar:current? (@{channel})')
-    return float(self.data_handler.recv())
+    return self._measure('current', channel)
 
   def measure_voltage(self, channel) -> float:
-    self.data_handler.send(f'measure:scalar:voltage? (@{channel})')
-    return float(self.data_handler.recv())
+    return self._measure('voltage', channel)
 
   def measure_power(self, channel) -> float:
-    self.data_handler.send(f'measure:scalar:power? (@{channel})')
-    return float(self.data_handler.recv())
+    return self._measure('power', channel)
@@ -28,6 +28,8 @@ OVP_MAX_VOLT = 40
 class Aimtticpx4000dp(dcpsu.DCpsu):
   """Child DCpsu Class of atticpx4000dp."""
 
+  COMMAND_SEPARATOR = ';'
+
   def __init__(
       self,
       com: cominterface.ComInterfaceClass,
@@ -57,11 +59,15 @@ class Aimtticpx4000dp(dcpsu.DCpsu):
       self.set_OVP_value(channel, OVP_MAX_VOLT)
 
   def set_OCP_value(self, channel, set_current):
-    self.data_handler.send(f'OCP{channel} {set_current}')
+    self.data_handler.send(
+        f'OCP{channel} {set_current}', key=('OCP', channel)
+    )
     logging.warning('The OCP is auto enable after set OCP value.')
 
   def set_OVP_value(self, channel, ovp_voltage):
-    self.data_handler.send(f'OVP{channel} {ovp_voltage:.2f}')
+    self.data_handler.send(
+        'OVP%d %.2f' % (channel, ovp_voltage), key=('OVP', channel)
+    )
     logging.warning('The OVP is auto enable after set OVP value.')
 
   def set_sequence(self, channel, voltage, current, delay):
@@ -91,15 +97,16 @@ class Aimtticpx4000dp(dcpsu.DCpsu):
     return float(self.data_handler.query(f'V{channel}O?').replace('V', ''))
 
   def set_output(self, channel, voltage, current):
-    super().set_output(channel, voltage, current)
-    if self._ocp_flag[channel]:
-      self.enable_OCP(channel, True)
+    with self.data_handler.batch(self.COMMAND_SEPARATOR):
+      super().set_output(channel, voltage, current)
+      if self._ocp_flag[channel]:
+        self.set_OCP_value(channel, round(current, 2))
 
   def enable_output(self, channel, enable):
-    self.data_handler.send(f'OP{channel} {int(enable)}')
+    self.data_handler.send('OP%d %d' % (channel, enable))
 
   def set_output_voltage(self, channel, voltage):
-    self.data_handler.send(f'V{channel} {voltage:.2f}')
+    self.data_handler.send('V%d %.2f' % (channel, voltage), key=('V', channel))
 
   def set_output_current(self, channel, current):
-    self.data_handler.send(f'I{channel} {current:.2f}')
+    self.data_handler.send('I%d %.2f' % (channel, current), key=('I', channel))
@@ -14,6 +14,8 @@
 
 """Parent Abstract Module of DCpsu."""
 
+from __future__ import annotations
+
 import abc
 
 from py_lab_hal.instrument import instrument
@@ -30,8 +32,9 @@ class DCpsu(instrument.Instrument, metaclass=abc.ABCMeta):
         voltage (float): The voltage of the config
         current (float): The current of the config
     """
-    self.set_output_current(channel, current)
-    self.set_output_voltage(channel, voltage)
+    with self.data_handler.batch(self.COMMAND_SEPARATOR):
+      self.set_output_current(channel, current)
+      self.set_output_voltage(channel, voltage)
 
   @abc.abstractmethod
   def set_output_voltage(self, channel: int, voltage: float):
@@ -179,4 +182,18 @@ class DCpsu(instrument.Instrument, metaclass=abc.ABCMeta):
     Returns:
         (float): the measure result
     """
-    return self.measure_current(channel) * self.measure_voltage(channel)
+    current, voltage = self._measure_iv(channel)
+    return current * voltage
+
+  def _measure_iv(self, channel: int) -> tuple[float, float]:
+    """Measure the current and the voltage on output channel.
+
+    Drivers that can read both in one compound query should override this.
+
+    Args:
+        channel (int): The specified output channel.
+
+    Returns:
+        (tuple[float, float]): the current and the voltage
+    """
+    return self.measure_current(channel), self.measure_voltage(channel)
@@ -19,33 +19,56 @@ import time
 
 from py_lab_hal.instrument.dcpsu import dcpsu
 
+_OCP_STATE = b'CHAN%d:PROTection:CURRent %d'
+_OVP_VALUE = b'CHAN%d:PROTection:VOLTage %.2f'
+_OUTPUT_STATE = b'OUTP:STATE %d'
+_OUTPUT_VOLTAGE = b'CHAN%d:VOLT %.2f'
+_OUTPUT_CURRENT = b'CHAN%d:CURR %.2f'
+
 
 class GwinPst3202(dcpsu.DCpsu):
   """Child DCpsu Class of GwinPst3202."""
 
-  def enable_OCP(self, channel, enable):
-    self.data_handler.send(f'CHAN{channel}:PROTection:CURRent {int(enable)}')
+  def enable_OCP(self, channel, enable, force=False):
+    self._write_if_changed(
+        ('OCP', channel),
+        int(enable),
+        self.data_handler.send_bytes,
+        _OCP_STATE % (channel, enable),
+        force=force,
+    )
 
   def enable_OVP(self, channel: int, enable: bool):
     logging.warning('The OVP is auto enable after set OVP value.')
 
-  def set_OVP_value(self, channel, ovp_voltage):
-    self.data_handler.send(
-        f'CHAN{channel}:PROTection:VOLTage {ovp_voltage:.2f}'
+  def set_OVP_value(self, channel, ovp_voltage, force=False):
+    self._write_if_changed(
+        ('OVP', channel),
+        ovp_voltage,
+        self.data_handler.send_bytes,
+        _OVP_VALUE % (channel, ovp_voltage),
+        force=force,
     )
     logging.warning('The OVP is auto enable after set OVP value.')
 
   def set_sequence(self, channel, voltage, current, delay):
-    if len(voltage) != len(current):
-      logging.error('len error')
-      raise RuntimeError
-    if len(voltage) != len(delay):
-      logging.error('delay len error')
-      raise RuntimeError
-
+    if not len(voltage) == len(current) == len(delay):
+      raise RuntimeError(
+          'The voltage, current and delay lists must have the same length.'
+      )
+
+    monotonic = time.monotonic
+    sleep = time.sleep
+    set_output = self.set_output
+    # Sleep until a deadline from the start, so the time spent writing each
+    # step does not add up over the sequence.
+    deadline = monotonic()
     for v, c, t in zip(voltage, current, delay):
-      time.sleep(t)
-      self.set_output(channel, v, c)
+      deadline += t
+      remaining = deadline - monotonic()
+      if remaining > 0:
+        sleep(remaining)
+      set_output(channel, v, c)
 
   def set_range(self, channel, range_type, value):
     pass
@@ -62,11 +85,29 @@ class GwinPst3202(dcpsu.DCpsu):
   def measure_voltage(self, channel) -> float:
     return float(self.data_handler.query(f'CHAN{channel}:MEAS:VOLT?'))
 
-  def enable_output(self, channel, enable):
-    self.data_handler.send(f'OUTP:STATE {int(enable)}')
+  def enable_output(self, channel, enable, force=False):
+    self._write_if_changed(
+        'OUTP',
+        int(enable),
+        self.data_handler.send_bytes,
+        _OUTPUT_STATE % enable,
+        force=force,
+    )
 
-  def set_output_voltage(self, channel, voltage):
-    self.data_handler.send(f'CHAN{channel}:VOLT {voltage:.2f}')
+  def set_output_voltage(self, channel, voltage, force=False):
+    self._write_if_changed(
+        ('VOLT', channel),
+        voltage,
+        self.data_handler.send_bytes,
+        _OUTPUT_VOLTAGE % (channel, voltage),
+        force=force,
+    )
 
-  def set_output_current(self, channel, current):
-    self.data_handler.send(f'CHAN{channel}:CURR {current:.2f}')
+  def set_output_current(self, channel, current, force=False):
+    self._write_if_changed(
+        ('CURR', channel),
+        current,
+        self.data_handler.send_bytes,
+        _OUTPUT_CURRENT % (channel, current),
+        force=force,
+    )
@@ -14,27 +14,77 @@
 
 """Child DCpsu Module of KeysightE36300Series."""
 
+from __future__ import annotations
+
+import time
+
+from py_lab_hal.cominterface import cominterface
+from py_lab_hal.instrument import instrument
 from py_lab_hal.instrument.dcpsu import dcpsu
 
+_PROTECTION_STATE = b'voltage:protection:state %d,(@%d)'
+_OCP_VALUE = 'current:protection %s,(@%d)'
+_OVP_VALUE = 'voltage:protection %s,(@%d)'
+_OUTPUT_STATE = b'OUTP %d,(@%d)'
+_OUTPUT_VOLTAGE = 'VOLT %s,(@%d)'
+_OUTPUT_CURRENT = 'CURR %s,(@%d)'
+_APPLY = 'apply %s, %s'
+
 
 class KeysightE36300Series(dcpsu.DCpsu):
   """Child DCpsu Class of KeysightE36300Series."""
 
-  def enable_OCP(self, channel, enable):
-    self.data_handler.send(
-        f'voltage:protection:state {int(enable)},(@{channel})'
+  def __init__(
+      self,
+      com: cominterface.ComInterfaceClass,
+      inst_config: instrument.InstrumentConfig,
+  ) -> None:
+    super().__init__(com, inst_config)
+    # If true, measure_voltage and measure_current read both values in one
+    # query and the other value is returned by the next call without I/O,
+    # unless prefetch_max_age seconds have passed since the query.
+    self.prefetch_pair = False
+    self.prefetch_max_age = 0.1
+    # The prefetched value and the monotonic time it expires at.
+    self._pending_measure: dict[tuple[int, str], tuple[float, float]] = {}
+
+  def _write_if_changed(self, *args, **kwargs) -> None:
+    # Every setter may change the readings, so a prefetched one is stale.
+    self._pending_measure.clear()
+    super()._write_if_changed(*args, **kwargs)
+
+  def enable_OCP(self, channel, enable, force=False):
+    self._set_protection_state(channel, enable, force)
+
+  def set_OCP_value(self, channel, ocp_current, force=False):
+    self._write_if_changed(
+        (_OCP_VALUE, channel),
+        ocp_current,
+        self.data_handler.send,
+        _OCP_VALUE % (ocp_current, channel),
+        force=force,
     )
 
-  def set_OCP_value(self, channel, ocp_current):
-    self.data_handler.send(f'current:protection {ocp_current},(@{channel})')
+  def enable_OVP(self, channel, enable, force=False):
+    self._set_protection_state(channel, enable, force)
 
-  def enable_OVP(self, channel, enable):
-    self.data_handler.send(
-        f'voltage:protection:state {int(enable)},(@{channel})'
+  def _set_protection_state(self, channel, enable, force) -> None:
+    self._write_if_changed(
+        (_PROTECTION_STATE, channel),
+        int(enable),
+        self.data_handler.send_bytes,
+        _PROTECTION_STATE % (enable, channel),
+        force=force,
     )
 
-  def set_OVP_value(self, channel, ovp_voltage):
-    self.data_handler.send(f'voltage:protection {ovp_voltage},(@{channel})')
+  def set_OVP_value(self, channel, ovp_voltage, force=False):
+    self._write_if_changed(
+        (_OVP_VALUE, channel),
+        ovp_voltage,
+        self.data_handler.send,
+        _OVP_VALUE % (ovp_voltage, channel),
+        force=force,
+    )
 
   def set_sequence(self, channel, voltage, current, delay):
     pass
@@ -49,21 +99,86 @@ class KeysightE36300Series(dcpsu.DCpsu):
     pass
 
   def measure_current(self, channel):
-    self.data_handler.send(f'measure:scalar:current? (@{channel})')
-    return float(self.data_handler.recv())
+    if self.prefetch_pair:
+      return self._measure_from_pair(channel, 'current')
+    return float(
+        self.data_handler.query(f'measure:scalar:current? (@{channel})')
+    )
 
   def measure_voltage(self, channel):
-    self.data_handler.send(f'measure:scalar:voltage? (@{channel})')
-    return float(self.data_handler.recv())
+    if self.prefetch_pair:
+      return self._measure_from_pair(channel, 'voltage')
+    return float(
+        self.data_handler.query(f'measure:scalar:voltage? (@{channel})')
+    )
 
-  def set_output(self, channel, voltage, current):
-    self.data_handler.send(f'apply {voltage}, {current}')
+  def measure_voltage_current(self, channel: int) -> tuple[float, float]:
+    """Measure the voltage and the current on output channel in one query.
 
-  def enable_output(self, channel, enable):
-    self.data_handler.send(f'OUTP {int(enable)},(@{channel})')
+    Args:
+        channel (int): The specified output channel.
 
-  def set_output_voltage(self, channel, voltage):
-    self.data_handler.send(f'VOLT {voltage},(@{channel})')
+    Returns:
+        (tuple[float, float]): the voltage and the current
+    """
+    reply = self.data_handler.query(
+        f'measure:scalar:voltage? (@{channel});'
+        f':measure:scalar:current? (@{channel})'
+    )
+    voltage, current = reply.split(';')
+    return float(voltage), float(current)
+
+  def _measure_from_pair(self, channel: int, quantity: str) -> float:
+    pending = self._pending_measure.pop((channel, quantity), None)
+    if pending is not None and time.monotonic() < pending[1]:
+      return pending[0]
+    voltage, current = self.measure_voltage_current(channel)
+    expires = time.monotonic() + self.prefetch_max_age
+    if quantity == 'voltage':
+      self._pending_measure[channel, 'current'] = (current, expires)
+      return voltage
+    self._pending_measure[channel, 'voltage'] = (voltage, expires)
+    return current
+
+  def _measure_iv(self, channel):
+    voltage, current = self.measure_voltage_current(channel)
+    return current, voltage
+
+  def set_output(self, channel, voltage, current):
+    self._pending_measure.clear()
+    self.data_handler.send(_APPLY % (voltage, current))
+    # APPLY sets the selected channel, so the levels written before are no
+    # longer known.
+    for key in [
+        key
+        for key in self._state
+        if key[0] in (_OUTPUT_VOLTAGE, _OUTPUT_CURRENT)
+    ]:
+      del self._state[key]
+
+  def enable_output(self, channel, enable, force=False):
+    self._write_if_changed(
+        (_OUTPUT_STATE, channel),
+        int(enable),
+        self.data_handler.send_bytes,
+        _OUTPUT_STATE % (enable, channel),
+        force=force,
+    )
 
-  def set_output_current(self, channel, current):
-    self.data_handler.send(f'CURR {current},(@{channel})')
+  def set_output_voltage(self, channel, voltage, force=False):
+    self._write_if_changed(
+        (_OUTPUT_VOLTAGE, channel),
+        voltage,
+        self.data_handler.send,
+        _OUTPUT_VOLTAGE % (voltage, channel),
+        force=force,
+    )
+
+  def set_output_current(self, channel, current, force=False):
+    self._write_if_changed(
+        (_OUTPUT_CURRENT, channel),
+        current,
+        self.data_handler.send,
+        _OUTPUT_CURRENT % (current, channel),
+        force=force,
+    )
@@ -20,21 +20,46 @@ from py_lab_hal.instrument.dcpsu import dcpsu
 class KeysightE3630Series(dcpsu.DCpsu):
   """Child DCpsu Class of KeysightE3630Series."""
 
+  # Send the remote mode and the init commands in one write. The common
+  # commands are joined with ';' since they do not take a header path.
+  OPEN_SEPARATOR = ';'
+
   def open_interface(self):
     super().open_interface()
     self.data_handler.send('SYSTem:REMote')
 
-  def enable_OCP(self, channel, enable):
-    self.data_handler.send(f'voltage:protection:state {int(enable)}')
-
-  def set_OCP_value(self, channel, ocp_current) -> None:
-    self.data_handler.send(f'current:protection {ocp_current}')
-
-  def enable_OVP(self, channel, enable):
-    self.data_handler.send(f'voltage:protection:state {int(enable)}')
-
-  def set_OVP_value(self, channel, ovp_voltage) -> None:
-    self.data_handler.send(f'voltage:protection {ovp_voltage}')
+  def enable_OCP(self, channel, enable, force=False):
+    self._set_protection_state(enable, force)
+
+  def set_OCP_value(self, channel, ocp_current, force=False) -> None:
+    self._write_if_changed(
+        'current:protection',
+        ocp_current,
+        self.data_handler.send,
+        f'current:protection {ocp_current}',
+        force=force,
+    )
+
+  def enable_OVP(self, channel, enable, force=False):
+    self._set_protection_state(enable, force)
+
+  def _set_protection_state(self, enable, force) -> None:
+    self._write_if_changed(
+        'voltage:protection:state',
+        int(enable),
+        self.data_handler.send,
+        f'voltage:protection:state {int(enable)}',
+        force=force,
+    )
+
+  def set_OVP_value(self, channel, ovp_voltage, force=False) -> None:
+    self._write_if_changed(
+        'voltage:protection',
+        ovp_voltage,
+        self.data_handler.send,
+        f'voltage:protection {ovp_voltage}',
+        force=force,
+    )
 
   def set_sequence(self, channel, voltage, current, delay):
     pass
@@ -49,21 +74,39 @@ class KeysightE3630Series(dcpsu.DCpsu):
     pass
 
   def measure_current(self, channel) -> float:
-    self.data_handler.send('measure:current?')
-    return float(self.data_handler.recv())
+    return float(self.data_handler.query('measure:current?'))
 
   def measure_voltage(self, channel) -> float:
-    self.data_handler.send('measure:voltage?')
-    return float(self.data_handler.recv())
-
-  def enable_output(self, channel, enable) -> None:
-    if enable:
-      self.data_handler.send('OUTP ON')
-    else:
-      self.data_handler.send('OUTP OFF')
-
-  def set_output_voltage(self, channel, voltage):
-    self.data_handler.send(f'VOLT {voltage}')
-
-  def set_output_current(self, channel, current):
-    self.data_handler.send(f'CURR {current}')
+    return float(self.data_handler.query('measure:voltage?'))
+
+  def _measure_iv(self, channel):
+    reply = self.data_handler.query('measure:current?;:measure:voltage?')
+    current, voltage = reply.split(';')
+    return float(current), float(voltage)
+
+  def enable_output(self, channel, enable, force=False) -> None:
+    self._write_if_changed(
+        'OUTP',
+        bool(enable),
+        self.data_handler.send,
+        'OUTP ON' if enable else 'OUTP OFF',
+        force=force,
+    )
+
+  def set_output_voltage(self, channel, voltage, force=False):
+    self._write_if_changed(
+        'VOLT',
+        voltage,
+        self.data_handler.send,
+        f'VOLT {voltage}',
+        force=force,
+    )
+
+  def set_output_current(self, channel, current, force=False):
+    self._write_if_changed(
+        'CURR',
+        current,
+        self.data_handler.send,
+        f'CURR {current}',
+        force=force,
+    )
@@ -20,6 +20,12 @@ from py_lab_hal.instrument.common.keysight import keysight_n6705c
 from py_lab_hal.instrument.dcpsu import dcpsu
 
 
+def _format_list(values) -> str:
+  # One format call for the whole list instead of one per value.
+  values = tuple(values)
+  return ','.join(['%.6g'] * len(values)) % values
+
+
 class KeysightN6705c(keysight_n6705c.KeysightN6705c, dcpsu.DCpsu):
   """Child DCpsu Class of Keysightn6705c."""
 
@@ -45,7 +51,21 @@ class KeysightN6705c(keysight_n6705c.KeysightN6705c, dcpsu.DCpsu):
     pass
 
   def set_sequence(self, channel, voltage, current, delay):
-    pass
+    if not len(voltage) == len(current) == len(delay):
+      raise RuntimeError(
+          'The voltage, current and delay lists must have the same length.'
+      )
+    channel_suffix = f',(@{channel})'
+    self.data_handler.send_batch(
+        [
+            f'VOLT:MODE LIST{channel_suffix}',
+            f'CURR:MODE LIST{channel_suffix}',
+            f'LIST:VOLT {_format_list(voltage)}{channel_suffix}',
+            f'LIST:CURR {_format_list(current)}{channel_suffix}',
+            f'LIST:DWEL {_format_list(delay)}{channel_suffix}',
+        ],
+        separator=self.COMMAND_SEPARATOR,
+    )
 
   def set_output_current(self, channel, current):
     self.set_level(channel, instrument.ChannelMode.CURRENT_DC, current)
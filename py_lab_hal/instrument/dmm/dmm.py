@@ -150,11 +150,43 @@ class DMM(instrument.Instrument, metaclass=abc.ABCMeta):
         mea_range (float): The specified measurement range.
         abs_resolution (float): The specified absolute resolution.
     """
+    with self.data_handler.batch(self.COMMAND_SEPARATOR):
+      self.config_channel_mode(channel, function)
+      self.config_autorange(channel, auto_range)
+      self.config_range(channel, mea_range)
+      self.config_resolution(channel, abs_resolution)
 
-    self.config_channel_mode(channel, function)
-    self.config_autorange(channel, auto_range)
-    self.config_range(channel, mea_range)
-    self.config_resolution(channel, abs_resolution)
+  async def config_measurement_async(
+      self,
+      channel: int,
+      function: instrument.ChannelMode,
+      auto_range: bool,
+      mea_range: float | instrument.ValueRange,
+      abs_resolution: float | instrument.ValueRange,
+  ) -> None:
+    """Configures the measurement function without blocking the event loop.
+
+    The configuration commands are sent in a single write. Gather the
+    coroutines of several channels or instruments to submit them all before
+    waiting, such as
+    await asyncio.gather(*(dmm.config_measurement_async(ch, ...) for ch in
+    channels)).
+
+    Args:
+        channel (int): The specified output channel.
+        function (instrument.ChannelMode): The specified channel mode.
+        auto_range (bool): The specified auto range.
+        mea_range (float): The specified measurement range.
+        abs_resolution (float): The specified absolute resolution.
+    """
+    await self.data_handler.run_async(
+        self.config_measurement,
+        channel,
+        function,
+        auto_range,
+        mea_range,
+        abs_resolution,
+    )
 
   def config_temperature_measurement(
       self,
@@ -172,10 +204,11 @@ class DMM(instrument.Instrument, metaclass=abc.ABCMeta):
           temperature probe.
         temper_type (instrument.ThermoCouple): The specified thermo couple.
     """
-    self.config_channel_mode(channel, instrument.ChannelMode.TEMPERATURE)
-    self.config_temperature_probe(channel, temper_probe_type)
-    self.config_thermo_couple(channel, temper_type)
-    self.config_resolution(channel, abs_resolution)
+    with self.data_handler.batch(self.COMMAND_SEPARATOR):
+      self.config_channel_mode(channel, instrument.ChannelMode.TEMPERATURE)
+      self.config_temperature_probe(channel, temper_probe_type)
+      self.config_thermo_couple(channel, temper_type)
+      self.config_resolution(channel, abs_resolution)
 
   @abc.abstractmethod
   def read(self, channel: int = 1, timeout: float = 10) -> float:
@@ -14,22 +14,39 @@
 
 """Child DMM Module of Keysight34970a."""
 
+from __future__ import annotations
+
+from collections.abc import Sequence
+
 from py_lab_hal.instrument.common.keysight import keysight_dmm
-from py_lab_hal.util import util
 
 
 class Keysight34970a(keysight_dmm.KeysightDMM):
   """Child DMM Class of Keysight34970a."""
 
   def read(self, channel=0, timeout=0):
-    self.data_handler.send(f'ROUT:SCAN (@{channel})')
-    self.data_handler.send('read?')
-    return float(self.data_handler.recv())
+    return self.read_list([channel])[0]
+
+  def read_list(self, channels: Sequence[int]) -> list[float]:
+    """Scans several channels and reads them back in one query.
+
+    Args:
+        channels: The channels to scan.
+
+    Returns:
+        list[float]: The reading of each channel, in the scan order of the
+        instrument, which is ascending channel order.
+    """
+    channel_list = ','.join(map(str, channels))
+    reply = self.data_handler.query(
+        f'ROUT:SCAN (@{channel_list}){self.COMMAND_SEPARATOR}read?'
+    )
+    return [float(value) for value in reply.split(',')]
 
   def _sense_command(self, channel, config_type, value):
     channel_mode = self._get_channel_mode(channel)
     self.data_handler.send(f'{channel_mode}:{config_type} {value},(@{channel})')
 
   def _config_channel_mode(self, channel, mode):
-    channel_mode = util.get_from_dict(keysight_dmm.CHANNEL_MODE, mode)
+    channel_mode = self._set_channel_mode_str(channel, mode)
     self.data_handler.send(f'CONF:{channel_mode},(@{channel})')
@@ -44,22 +44,38 @@ EDGE_SLOPE = {
     instrument.EdgeTriggerSlope.FALL: 'FALL',
 }
 
+_INPUT_SHORT = b'INPut:SHORt %d'
+_INPUT_STATE = b'INPut %d'
+_SLEW_RATE = 'CURRent:SLEW:%s %s'
+_RANGE = '%s:RANGe %s'
+
+# The complete FUNCtion command and the level header of each channel mode.
+_FUNCTION = {mode: f'FUNCtion {name}' for mode, name in CHANNEL_MODE.items()}
+_LEVEL = {mode: f'{name} ' for mode, name in CHANNEL_MODE.items()}
+
 
 class Bk8500b(eload.Eload):
   """Child eload Class of Bk8500b."""
 
+  # Send the remote mode and the init commands in one write. The common
+  # commands are joined with ';' since they do not take a header path.
+  OPEN_SEPARATOR = ';'
+
   def open_interface(self):
     super().open_interface()
-    # We need to set to remote mode first, so don't run init options here
-    self.data_handler.interface.send_raw(b'SYSTem:REMote')
+    # We need to set to remote mode first, so it leads the init commands
+    self.data_handler.send_bytes(b'SYSTem:REMote')
 
   def short_output(self, channel, enable) -> None:
-    self.data_handler.send(f'INPut:SHORt {int(enable)}')
-    self.enable_output(channel, enable)
+    # Sent as one compound line, which the load parses left to right, so the
+    # short is set before the input state.
+    with self.data_handler.batch(self.COMMAND_SEPARATOR):
+      self.data_handler.send_bytes(_INPUT_SHORT % enable)
+      self.enable_output(channel, enable)
 
   def set_slewrate(self, channel, edge, rate) -> None:
     edge = util.get_from_dict(EDGE_SLOPE, edge)
-    self.data_handler.send(f'CURRent:SLEW:{edge} {rate}')
+    self.data_handler.send(_SLEW_RATE % (edge, rate))
 
   def set_current_dynamic(
       self, channel: int, l1, t1, rise_rate, l2, t2, fall_rate, repeat
@@ -68,12 +84,17 @@ class Bk8500b(eload.Eload):
         'This function is not currently implemented in the BK8500B'
     )
 
-  def enable_output(self, channel, enable) -> None:
-    self.data_handler.send(f'INPut {int(enable)}')
+  def enable_output(self, channel, enable, force=False) -> None:
+    self._write_if_changed(
+        _INPUT_STATE,
+        int(enable),
+        self.data_handler.send_bytes,
+        _INPUT_STATE % enable,
+        force=force,
+    )
 
   def set_mode(self, channel, mode) -> None:
-    mode = util.get_from_dict(CHANNEL_MODE, mode)
-    self.data_handler.send(f'FUNCtion {mode}')
+    self.data_handler.send(util.get_from_dict(_FUNCTION, mode))
 
   def set_level(self, channel, mode, value, curr_lim=None) -> None:
     """Sets the operation level of the selected channel.
@@ -92,8 +113,7 @@ class Bk8500b(eload.Eload):
 
     The BK8500 Does not support Current Limiting in CV Mode!!!
     """
-    mode_str = util.get_from_dict(CHANNEL_MODE, mode)
-    self.data_handler.send(f'{mode_str} {value}')
+    self.data_handler.send(util.get_from_dict(_LEVEL, mode) + str(value))
     if mode == instrument.ChannelMode.VOLTAGE_DC and curr_lim is not None:
       warnings.warn(
           'The BK8500 Series does not support Current Limitingover CV mode!'
@@ -110,7 +130,7 @@ class Bk8500b(eload.Eload):
         or range_type == instrument.ChannelMode.VOLTAGE_DC
     ):
       range_type = util.get_from_dict(CHANNEL_MODE, range_type)
-      self.data_handler.send(f'{range_type}:RANGe {value}')
+      self.data_handler.send(_RANGE % (range_type, value))
     else:
       raise NotImplementedError(
           'The BK8500B does not support range settings for CR or CP mode'
@@ -121,6 +141,19 @@ class Bk8500b(eload.Eload):
         'This function is not currently implemented in the BK8500B'
     )
 
+  def measure_voltage_current(self, channel: int) -> tuple[float, float]:
+    """Measure the voltage and the current on input channel in one query.
+
+    Args:
+        channel (int): The specified input channel.
+
+    Returns:
+        (tuple[float, float]): the voltage and the current
+    """
+    reply = self.data_handler.query('MEASure:VOLTage?;:MEASure:CURRent?')
+    voltage, current = reply.split(';')
+    return float(voltage), float(current)
+
   def measure_current(self, channel) -> float:
     return float(self.data_handler.query('MEASure:CURRent?'))
 
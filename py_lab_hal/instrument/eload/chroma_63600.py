@@ -28,7 +28,8 @@ The Chroma 63600 Programmable DC Electronic Load System consists of model
 
 from __future__ import annotations
 
-import dataclasses
+import bisect
+from collections.abc import Sequence
 import re
 
 from py_lab_hal.cominterface import cominterface
@@ -41,6 +42,9 @@ class MatchError(ValueError):
   pass
 
 
+_MODEL_RE = re.compile(r'\d+-\d+-\d+')
+
+
 CHANNEL_MODE = {
     instrument.ChannelMode.CURRENT_DC: 'CCH',
     instrument.ChannelMode.VOLTAGE_DC: 'CVH',
@@ -53,40 +57,52 @@ EDGE_SLOPE = {
     instrument.EdgeTriggerSlope.FALL: 'fall',
 }
 
+LEVEL_MODE = {
+    instrument.ChannelMode.CURRENT_DC: 'CURRent',
+    instrument.ChannelMode.VOLTAGE_DC: 'VOLTage',
+    instrument.ChannelMode.RESISTANCE: 'RESistance',
+    instrument.ChannelMode.POWER: 'POWer',
+}
+
 
 class Chroma63600(eload.Eload):
   """Child eload Class of Chroma63600."""
 
-  @dataclasses.dataclass
-  class ModelRange:
-    # Make floats for now, unsure if future models will have floating pt ranges
-    cc: list[float]
-    cv: list[float]
-    cr: list[float]
-    cp: list[float]
-
-  model_63610_80_20 = ModelRange(
-      cc=[0.2, 2, 20], cv=[6, 16, 80], cr=[80, 2900, 12000], cp=[2, 10, 100]
-  )
-
-  model_63630_80_60 = ModelRange(
-      cc=[0.6, 6, 60], cv=[6, 16, 80], cr=[30, 600, 3000], cp=[6, 30, 300]
-  )
-
-  model_63630_600_15 = ModelRange(
-      cc=[0.15, 1.5, 15],
-      cv=[80, 150, 600],
-      cr=[270, 4000, 200000],
-      cp=[6, 30, 300],
-  )
-
-  model_63640_80_80 = ModelRange(
-      cc=[0.8, 8, 80], cv=[6, 16, 80], cr=[20, 720, 2900], cp=[8, 40, 400]
-  )
-
-  model_63640_150_60 = ModelRange(
-      cc=[1, 6, 60], cv=[16, 80, 150], cr=[60, 800, 1500], cp=[8, 40, 400]
-  )
+  # The ascending low, medium and high range of each operation mode.
+  model_63610_80_20 = {
+      'cc': (0.2, 2, 20),
+      'cv': (6, 16, 80),
+      'cr': (80, 2900, 12000),
+      'cp': (2, 10, 100),
+  }
+
+  model_63630_80_60 = {
+      'cc': (0.6, 6, 60),
+      'cv': (6, 16, 80),
+      'cr': (30, 600, 3000),
+      'cp': (6, 30, 300),
+  }
+
+  model_63630_600_15 = {
+      'cc': (0.15, 1.5, 15),
+      'cv': (80, 150, 600),
+      'cr': (270, 4000, 200000),
+      'cp': (6, 30, 300),
+  }
+
+  model_63640_80_80 = {
+      'cc': (0.8, 8, 80),
+      'cv': (6, 16, 80),
+      'cr': (20, 720, 2900),
+      'cp': (8, 40, 400),
+  }
+
+  model_63640_150_60 = {
+      'cc': (1, 6, 60),
+      'cv': (16, 80, 150),
+      'cr': (60, 800, 1500),
+      'cp': (8, 40, 400),
+  }
 
   RANGE = {
       '63610-80-20': model_63610_80_20,
@@ -118,34 +134,66 @@ class Chroma63600(eload.Eload):
   def _check_channel_number(self):
     # Find the max number of channels
     max_ch = int(self.data_handler.query('CHAN MAX;CHAN?'))
-    # Get Channel module model
-    for ch in range(max_ch):
-      self.data_handler.send(f'CHAN {ch + 1}')
-      _, channel_id, _ = self.data_handler.query('CHAN:ID?').split(',', 2)
-      match = re.search(r'[0-9]*-[0-9]*-[0-9]*', channel_id)
+    channels = range(1, max_ch + 1)
+    # Get Channel module model of all the channels in one query
+    separator = self.COMMAND_SEPARATOR
+    replies = self.data_handler.query(
+        separator.join(f'CHAN {ch}{separator}CHAN:ID?' for ch in channels)
+    ).split(';')
+    if len(replies) != max_ch:
+      replies = [self._chan_query(ch, 'CHAN:ID?') for ch in channels]
+    for ch, reply in zip(channels, replies):
+      _, channel_id, _ = reply.split(',', 2)
+      match = _MODEL_RE.search(channel_id)
       if not match:
         raise MatchError('Channel ID cannot be found, please check your model!')
-      channel_id = match.group(0)
-      self.ch_ids[ch + 1] = channel_id
+      self.ch_ids[ch] = match.group(0)
+
+  def _chan_send(self, channel: int, *commands: str) -> None:
+    """Selects the channel and sends the commands in the same write.
 
-  def _find_next_level(self, data: list[float], point: float) -> int:
+    Args:
+        channel (int): The target channel
+        *commands (str): The commands for the channel, sent in order
+    """
+    self.data_handler.send(
+        self.COMMAND_SEPARATOR.join((f'CHAN {channel}', *commands))
+    )
+
+  def _chan_query(self, channel: int, command: str) -> str:
+    """Selects the channel and queries the command in the same write.
+
+    Args:
+        channel (int): The target channel
+        command (str): The query for the channel
+
+    Returns:
+        (str): The reply of the query
+    """
+    return self.data_handler.query(
+        f'CHAN {channel}{self.COMMAND_SEPARATOR}{command}'
+    )
+
+  def _find_next_level(self, data: Sequence[float], point: float) -> int:
     """Finds the first higher index in a list given a point.
 
     For example with [0, 1, 2, 3], if point = 1.5, then the return index should
     be 2
 
     Args:
-        data (list[float]): The list of floating pt numbers
+        data (Sequence[float]): The ascending floating pt numbers
         point (float): The number to find the high index
 
     Returns:
        (int): The next higher index
+
+    Raises:
+        ValueError: The point is above the last value of the list.
     """
-    try:
-      idx = next(idx for idx, val in enumerate(data) if (val >= point))
-      return int(idx)
-    except StopIteration as exc:
-      raise ValueError('Operation Value out of range!') from exc
+    idx = bisect.bisect_left(data, point)
+    if idx == len(data):
+      raise ValueError('Operation Value out of range!')
+    return idx
 
   def _auto_range(self, channel: int, mode: str, value: float) -> None:
     """Internal function to autorange the load since Chroma63600 lacks one.
@@ -157,18 +205,15 @@ class Chroma63600(eload.Eload):
     """
     # The range ends in L = Low, M = Medium, or H = High
     range_tags = ['L', 'M', 'H']
-    model = self.ch_ids[channel]
-    ranges = dataclasses.asdict(Chroma63600.RANGE[model])
-    op_ranges = ranges[mode.lower()]
+    op_ranges = Chroma63600.RANGE[self.ch_ids[channel]][mode.lower()]
     index = self._find_next_level(op_ranges, value)
     range_cmd = f'{mode}{range_tags[index]}'
-    self.data_handler.send(f'CHAN {channel}')
-    self.data_handler.send(f'MODE {range_cmd}')
+    self._chan_send(channel, f'MODE {range_cmd}')
 
   def short_output(self, channel, enable) -> None:
-    self.data_handler.send(f'CHAN {channel}')
-    self.data_handler.send(f'LOAD:SHORT {int(enable)}')
-    self.enable_output(channel, enable)
+    with self.data_handler.batch(self.COMMAND_SEPARATOR):
+      self._chan_send(channel, f'LOAD:SHORT {int(enable)}')
+      self.enable_output(channel, enable)
 
   def set_slewrate(self, channel, edge, rate) -> None:
     edge = util.get_from_dict(EDGE_SLOPE, edge)
@@ -182,31 +227,21 @@ class Chroma63600(eload.Eload):
     )
 
   def enable_output(self, channel, enable) -> None:
-    # Channel output needs to be enabled/disabled in a certain order
-    self.data_handler.send(f'CHAN {channel}')
+    # Channel output needs to be enabled/disabled in a certain order, the
+    # compound commands are executed in the order they are written.
     if enable:
-      self.data_handler.send(f'CHANnel:ACTive {int(enable)}')
-      self.data_handler.send(f'LOAD {int(enable)}')
+      self._chan_send(channel, 'CHANnel:ACTive 1', 'LOAD 1')
     else:
-      self.data_handler.send(f'LOAD {int(enable)}')
-      self.data_handler.send(f'CHANnel:ACTive {int(enable)}')
+      self._chan_send(channel, 'LOAD 0', 'CHANnel:ACTive 0')
 
   def set_mode(self, channel, mode) -> None:
-    self.data_handler.send(f'CHAN {channel}')
-    mode = util.get_from_dict(CHANNEL_MODE, mode)
-    self.data_handler.send(f'MODE {mode}')
+    self._chan_send(channel, f'MODE {util.get_from_dict(CHANNEL_MODE, mode)}')
 
   def set_level(self, channel, mode, value, curr_lim=None) -> None:
-    mode_cmd = {
-        instrument.ChannelMode.CURRENT_DC: 'CURRent',
-        instrument.ChannelMode.VOLTAGE_DC: 'VOLTage',
-        instrument.ChannelMode.RESISTANCE: 'RESistance',
-        instrument.ChannelMode.POWER: 'POWer',
-    }
-    self.data_handler.send(f'CHAN {channel}')
-    self.data_handler.send(f'{mode_cmd[mode]}:STATic:L1 {value}')
+    commands = [f'{LEVEL_MODE[mode]}:STATic:L1 {value}']
     if mode == instrument.ChannelMode.VOLTAGE_DC and curr_lim:
-      self.data_handler.send(f'VOLTage:STAT:ILIMit {curr_lim}')
+      commands.append(f'VOLTage:STAT:ILIMit {curr_lim}')
+    self._chan_send(channel, *commands)
 
   def set_sequence(self, channel, voltage, current, delay) -> None:
     raise NotImplementedError(
@@ -228,9 +263,7 @@ class Chroma63600(eload.Eload):
     )
 
   def measure_current(self, channel) -> float:
-    self.data_handler.send(f'CHAN {channel}')
-    return float(self.data_handler.query('MEASure:CURRent?'))
+    return float(self._chan_query(channel, 'MEASure:CURRent?'))
 
   def measure_voltage(self, channel) -> float:
-    self.data_handler.send(f'CHAN {channel}')
-    return float(self.data_handler.query('MEASure:VOLTage?'))
+    return float(self._chan_query(channel, 'MEASure:VOLTage?'))
@@ -58,4 +58,6 @@ class KeysightN6705c(keysight_n6705c.KeysightN6705c, eload.Eload):
     pts = 3255
     if power_line_freq == 50:
       pts = 3906
-    self.data_handler.send(f'SENSe:SWEep:POINts {pts * nplc},(@{channel}')
+    self.data_handler.send(
+        f'SENSe:SWEep:POINts {round(pts * nplc)},(@{channel})'
+    )
@@ -16,6 +16,7 @@
 
 from __future__ import annotations
 
+import bisect
 import logging
 import re
 
@@ -33,10 +34,20 @@ CHANNEL_MODE = {
 }
 
 
+# The complete FUNCtion command of each channel mode.
+_FUNCTION = {mode: f'FUNCtion {name}' for mode, name in CHANNEL_MODE.items()}
+
+# The range labels, in the order of the thresholds in Plz205w.mode_range.
+_RANGE_LABELS = ('LOW', 'MEDium', 'HIGH')
+
+
 class MatchError(ValueError):
   pass
 
 
+_MODEL_RE = re.compile(r'(?P<model>PLZ.+W)')
+
+
 class Plz205w(eload.Eload):
   """Child eload Class of PLZ205w."""
 
@@ -46,6 +57,7 @@ class Plz205w(eload.Eload):
       instrument.ChannelMode.RESISTANCE: 'CONDuctance',
       instrument.ChannelMode.POWER: 'POWer',
   }
+  _level_header = {mode: f'{command} ' for mode, command in mode_cmd.items()}
   mode_range = {
       'PLZ205W': {
           instrument.ChannelMode.CURRENT_DC: [0.42, 4.2, 42.0],
@@ -74,18 +86,33 @@ class Plz205w(eload.Eload):
   ) -> None:
     super().__init__(com, inst_config)
 
-    result = re.search(r'(?P<model>PLZ.+W)', self.idn)
+    result = _MODEL_RE.search(self.idn)
     if not result:
       raise RuntimeError
     self.device_name = result['model']
+    self._ranges = {
+        mode: tuple(levels)
+        for mode, levels in self.mode_range[self.device_name].items()
+    }
+    self._range_commands = {
+        mode: tuple(f'{command}:RANGe {label}' for label in _RANGE_LABELS)
+        for mode, command in self.mode_cmd.items()
+    }
+    self._warned_slew = False
 
   def short_output(self, channel, enable) -> None:
-    self.data_handler.send(f'INPut:SHORt {int(enable)}')
-    self.enable_output(channel, enable)
+    # Sent as one compound line, which the load parses left to right, so the
+    # short is set before the input state.
+    with self.data_handler.batch(self.COMMAND_SEPARATOR):
+      self.data_handler.send(f'INPut:SHORt {int(enable)}')
+      self.enable_output(channel, enable)
 
   def set_slewrate(self, channel, edge, rate) -> None:
-    logging.warning('PLZ series does not have individual edge controls')
-    self.data_handler.send(f'CURRent:SLEW {rate}')
+    # Warned once, since the slew rate is often set inside a sweep loop.
+    if not self._warned_slew:
+      logging.warning('PLZ series does not have individual edge controls')
+      self._warned_slew = True
+    self.data_handler.send(f'CURRent:SLEW {util.format_number(rate)}')
 
   def set_current_dynamic(
       self, channel, l1, t1, rise_rate, l2, t2, fall_rate, repeat
@@ -98,8 +125,7 @@ class Plz205w(eload.Eload):
     self.data_handler.send(f'INPut {int(enable)}')
 
   def set_mode(self, channel, mode) -> None:
-    mode = util.get_from_dict(CHANNEL_MODE, mode)
-    self.data_handler.send(f'FUNCtion {mode}')
+    self.data_handler.send(util.get_from_dict(_FUNCTION, mode))
 
   def set_level(self, channel, mode, value, curr_lim=None) -> None:
 
@@ -107,7 +133,9 @@ class Plz205w(eload.Eload):
       if value == 0:
         raise RuntimeError('Can not set resistance to zero')
       value = 1 / value
-    self.data_handler.send(f'{self.mode_cmd[mode]} {value}')
+    self.data_handler.send(
+        self._level_header[mode] + util.format_number(value)
+    )
 
   def set_sequence(self, channel, voltage, current, delay) -> None:
     raise NotImplementedError(
@@ -115,21 +143,13 @@ class Plz205w(eload.Eload):
     )
 
   def set_range(self, channel, range_type, value) -> None:
-    def get_range():
-      value_range = self.mode_range[self.device_name][range_type]
-
-      if value > value_range[2]:
-        raise RuntimeError
-      if value > value_range[1]:
-        return 'HIGH'
-      if value > value_range[0]:
-        return 'MEDium'
-      if value > 0:
-        return 'LOW'
-
+    thresholds = self._ranges[range_type]
+    if not 0 < value <= thresholds[-1]:
       raise RuntimeError
-
-    self.data_handler.send(f'{self.mode_cmd[range_type]}:RANGe {get_range()}')
+    # The smallest range whose threshold is not below the value.
+    self.data_handler.send(
+        self._range_commands[range_type][bisect.bisect_left(thresholds, value)]
+    )
 
   def set_NPLC(self, channel, power_line_freq, nplc) -> None:
     raise NotImplementedError(
@@ -80,10 +80,11 @@ class FunctionGenerator(instrument.Instrument, metaclass=abc.ABCMeta):
         offset (float):
         duty_cycle (float):
     """
-    self.set_output_function(channel, function)
-    self.set_output_frequency(channel, frequency)
-    self.set_output_voltage(channel, amplitude, offset)
-    self.set_output_duty_cycle(channel, function, duty_cycle)
+    with self.data_handler.batch(self.COMMAND_SEPARATOR):
+      self.set_output_function(channel, function)
+      self.set_output_frequency(channel, frequency)
+      self.set_output_voltage(channel, amplitude, offset)
+      self.set_output_duty_cycle(channel, function, duty_cycle)
 
   @abc.abstractmethod
   def set_STD_waveform(
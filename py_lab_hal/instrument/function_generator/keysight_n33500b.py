@@ -14,8 +14,16 @@
 
 """Child FunctionGenerator Module of Keysightn33500b."""
 
+import functools
+
 from py_lab_hal.instrument import instrument
 from py_lab_hal.instrument.function_generator import function_generator
+from py_lab_hal.util import util
+
+
+@functools.lru_cache(maxsize=None)
+def _source(channel: int, header: str) -> str:
+  return f'SOUR{channel}:{header} '
 
 
 class KeysightN33500b(function_generator.FunctionGenerator):
@@ -30,35 +38,82 @@ class KeysightN33500b(function_generator.FunctionGenerator):
   def configure_output(
       self, channel, function, frequency, amplitude, offset, phase
   ):
-    self.data_handler.send(
-        f'SOUR{channel}:APPL:{function.value} {frequency},{amplitude},{offset}'
-    )
-    if function != instrument.FunctionType.DC:
-      self.set_output_phase(channel, phase)
+    with self.data_handler.batch(self.COMMAND_SEPARATOR):
+      self.data_handler.send(
+          f'SOUR{channel}:APPL:{function.value} '
+          + ','.join(map(util.format_number, (frequency, amplitude, offset)))
+      )
+      # APPLy sets the function, frequency, amplitude and offset together.
+      self.invalidate_state(channel)
+      if function != instrument.FunctionType.DC:
+        self.set_output_phase(channel, phase)
 
-  def enable_output(self, channel, enable):
-    self.data_handler.send(f'OUTP{channel} {int(enable)}')
+  def enable_output(self, channel, enable, force=False):
+    self._write_if_changed(
+        ('OUTP', channel),
+        int(enable),
+        self.data_handler.send,
+        f'OUTP{channel} {int(enable)}',
+        force=force,
+    )
 
   def set_STD_waveform(
       self, channel, waveform, freq, amp, dc_offset, duty_cycle
   ):
     pass
 
-  def set_output_function(self, channel, function):
-    self.data_handler.send(f'SOUR{channel}:FUNCtion {function.value}')
+  def set_output_function(self, channel, function, force=False):
+    self._write_if_changed(
+        ('FUNC', channel),
+        function,
+        self.data_handler.send,
+        _source(channel, 'FUNCtion') + function.value,
+        force=force,
+    )
 
-  def set_output_voltage(self, channel, amplitude, offset):
-    self.data_handler.send(f'SOUR{channel}:VOLTage {amplitude}')
-    self.data_handler.send(f'SOUR{channel}:VOLTage:OFFSet {offset}')
+  def set_output_voltage(self, channel, amplitude, offset, force=False):
+    with self.data_handler.batch(self.COMMAND_SEPARATOR):
+      self._write_if_changed(
+          ('VOLT', channel),
+          amplitude,
+          functools.partial(self.data_handler.send, key=('VOLT', channel)),
+          _source(channel, 'VOLTage') + util.format_number(amplitude),
+          force=force,
+      )
+      self._write_if_changed(
+          ('OFFS', channel),
+          offset,
+          functools.partial(self.data_handler.send, key=('OFFS', channel)),
+          _source(channel, 'VOLTage:OFFSet') + util.format_number(offset),
+          force=force,
+      )
 
-  def set_output_frequency(self, channel, frequency):
-    self.data_handler.send(f'SOUR{channel}:FREQuency {frequency}')
+  def set_output_frequency(self, channel, frequency, force=False):
+    self._write_if_changed(
+        ('FREQ', channel),
+        frequency,
+        self.data_handler.send,
+        _source(channel, 'FREQuency') + util.format_number(frequency),
+        force=force,
+    )
 
-  def set_output_phase(self, channel, degree):
-    self.data_handler.send(f'SOUR{channel}:PHASe {degree}')
+  def set_output_phase(self, channel, degree, force=False):
+    self._write_if_changed(
+        ('PHAS', channel),
+        degree,
+        self.data_handler.send,
+        _source(channel, 'PHASe') + util.format_number(degree),
+        force=force,
+    )
 
-  def set_output_impedance(self, channel, impedance):
-    self.data_handler.send(f'SOUR{channel}:LOAD {impedance}')
+  def set_output_impedance(self, channel, impedance, force=False):
+    self._write_if_changed(
+        ('LOAD', channel),
+        impedance,
+        self.data_handler.send,
+        _source(channel, 'LOAD') + util.format_number(impedance),
+        force=force,
+    )
 
   def set_output_duty_cycle(self, channel, function, percent):
     self.data_handler.send(f'SOUR{channel}:FUNCtion:{function.value} {percent}')
@@ -14,11 +14,19 @@
 
 """Parent abstract class for instrument."""
 
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Sequence
+import contextlib
 import dataclasses
 import enum
+import functools
 import importlib
 import logging
 import time
+from typing import Any, Callable
+import weakref
 from py_lab_hal.cominterface import cominterface
 from py_lab_hal.util import json_dataclass
 from py_lab_hal.util import util
@@ -246,6 +254,7 @@ class FunctionType(str, util.InstrumentEnum):
   DC = enum.auto()
 
 
+@json_dataclass.dataclass_json_codegen
 @dataclasses.dataclass
 class InstrumentConfig(json_dataclass.DataClassJsonCamelMixIn):
   """The config for instrument.
@@ -267,6 +276,18 @@ class InstrumentConfig(json_dataclass.DataClassJsonCamelMixIn):
 class Instrument:
   """Parent abstract class for instrument."""
 
+  COMMAND_SEPARATOR = ';:'
+  """The separator to join multiple commands into one write."""
+
+  OPEN_SEPARATOR: str | None = None
+  """The separator to send the open sequence in one write, None to not join.
+
+  The commands open_instrument sends, such as the ones sent by open_interface,
+  *RST and *CLS, are joined into one write. With idn set, the *IDN? query ends
+  that write, so the whole sequence is one write and one read. Only set it for
+  the instruments that accept these as a compound command.
+  """
+
   def __init__(
       self,
       com: cominterface.ComInterfaceClass,
@@ -284,40 +305,136 @@ class Instrument:
 
     self.data_handler = cominterface.DataHandler(com)
     self.inst_config = inst_config
+    # If true, the drivers skip the writes that set a value equal to the one
+    # they last wrote, see _write_if_changed.
+    self.skip_unchanged_writes = False
+    self._state: dict[Any, Any] = {}
+    # A held or queued write may still fail after _write_if_changed returned.
+    self.data_handler.write_error_callbacks.append(self._state.clear)
+
+    # Closes the interface once the instrument is collected, without the
+    # finalizer ordering issues of __del__. Prefer closing explicitly or using
+    # the instrument as a context manager.
+    self._finalizer = weakref.finalize(self, self.data_handler.close)
 
     if self.inst_config.auto_init:
       self.open_instrument()
 
-  def __del__(self) -> None:
-    """Close the instrument when deleting the object."""
+  def __enter__(self) -> Instrument:
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback) -> None:
     self.close()
 
   def open_instrument(self):
     """Open the instrument and open the interface if needed."""
-    if not self.data_handler.interface.enable:
-      self.open_interface()
-
-    logging.info('Opening Instrument')
-
-    if self.inst_config.reset:
-      self.reset()
-    if self.inst_config.clear:
-      self.clear()
-    if self.inst_config.idn:
-      self.ask_idn()
+    if self.OPEN_SEPARATOR is None:
+      open_batch = contextlib.nullcontext()
+    else:
+      open_batch = self.data_handler.batch(self.OPEN_SEPARATOR)
+    with open_batch:
+      if not self.data_handler.interface.enable:
+        self.open_interface()
+
+      logging.info('Opening Instrument')
+
+      if self.inst_config.reset:
+        self.reset()
+      if self.inst_config.clear:
+        self.clear()
+      if self.inst_config.idn:
+        if self.OPEN_SEPARATOR is None:
+          self.ask_idn()
+        else:
+          # Ends the open line, so the sequence is one write and one read.
+          held = self.data_handler.take_batch().decode()
+          self._ask_idn(held + self.OPEN_SEPARATOR if held else '')
 
     logging.debug('Instrument Opened')
 
   def open_interface(self):
     logging.info('Instrument Opening Interface')
+    self.invalidate_state()
+    if not self._finalizer.alive:
+      # Closed before, so the reopened interface is closed on collection again.
+      self._finalizer = weakref.finalize(self, self.data_handler.close)
     self.data_handler.interface.open()
 
-  def self_test(self) -> None:
-    """Send to self test command to the instrument."""
+  def _write_if_changed(
+      self,
+      key: Any,
+      value: Any,
+      write: Callable[..., None],
+      *args,
+      force: bool = False,
+  ) -> None:
+    """Calls write unless it would set the value already written for key.
+
+    The write is only skipped when skip_unchanged_writes is true, because the
+    instrument can also change its state by itself, such as an output turned
+    off by a tripped protection.
+
+    The value is remembered once write returns. If write only held or queued
+    the command, such as inside a batch, and writing it fails later, all the
+    remembered values are forgotten.
+
+    Args:
+        key (Any): Identifies the setting the write changes.
+        value (Any): The value the write sets.
+        write (Callable): The call which writes the setting.
+        *args: The arguments of write.
+        force (bool, optional): If true, always write. Defaults to False.
+    """
+    if (
+        self.skip_unchanged_writes
+        and not force
+        and key in self._state
+        and self._state[key] == value
+    ):
+      return
+    write(*args)
+    self._state[key] = value
+
+  def invalidate_state(self, channel: int | None = None) -> None:
+    """Forgets the values remembered by _write_if_changed.
+
+    Call it after the instrument state was changed behind the driver, such as
+    from the front panel.
+
+    Args:
+        channel (int | None, optional): Only forget the settings keyed by
+          (name, channel) for this channel. Defaults to None, which forgets
+          all the settings.
+    """
+    if channel is None:
+      self._state.clear()
+      return
+    for key in [
+        key
+        for key in self._state
+        if isinstance(key, tuple) and len(key) == 2 and key[1] == channel
+    ]:
+      del self._state[key]
+
+  def self_test(self, timeout: int = 30) -> None:
+    """Send to self test command to the instrument.
+
+    The instrument answers *TST? once the test is done, so the reply is read
+    with a read timeout long enough for the test instead of a fixed sleep.
+
+    Args:
+        timeout (int): The longest time the self test may take in seconds.
+    """
     logging.debug('Doing the self testing')
-    self.data_handler.send('*TST?')
-    time.sleep(10)
-    error_code = int(self.data_handler.recv())
+    interface = self.data_handler.interface
+    previous_timeout = interface.timeout
+    try:
+      error_code = int(self.data_handler.query('*TST?', timeout=timeout))
+    finally:
+      if previous_timeout < 0:
+        interface.apply_timeout('connect')
+      else:
+        interface.set_timeout(previous_timeout)
     if error_code != 0:
       logging.error('Error Found with Error Code: %d', error_code)
       return
@@ -333,10 +450,11 @@ class Instrument:
 
   def close(self) -> None:
     """Call the close command of cominterface."""
-    self.data_handler.interface.close()
+    self._finalizer()
 
   def reset(self) -> None:
     """Resets instrument to factory default state."""
+    self.invalidate_state()
     self.data_handler.send('*RST')
 
   def ask_idn(self) -> None:
@@ -344,7 +462,10 @@ class Instrument:
 
     Returns the instrument's identification string.
     """
-    self.idn = self.data_handler.query('*IDN?')
+    self._ask_idn()
+
+  def _ask_idn(self, prefix: str = '') -> None:
+    self.idn = self.data_handler.query(prefix + '*IDN?')
     logging.info('Instrument IDN Received %s', self.idn)
 
   def wait_task(self, timeout: float = 30):
@@ -359,12 +480,42 @@ class Instrument:
     Raises:
         RuntimeError: If the timeout is reached.
     """
-    time_now = time.time()
-    while self.data_handler.query('*OPC?') != '1':
-      logging.info('Wait for all pending OPC operations are finished.')
-      time.sleep(1)
-      if time.time() - time_now > timeout:
+    # Poll fast first so that short tasks return quickly, then back off so
+    # that long tasks do not flood the bus.
+    deadline = time.monotonic() + timeout
+    delay = 0.005
+    query_raw = self.data_handler.query_raw
+    terminator = self.data_handler.interface.connect_config.terminator
+    read_term = terminator.read.encode()
+    while query_raw(b'*OPC?').strip(read_term) != b'1':
+      if time.monotonic() > deadline:
         raise RuntimeError('Timeout')
+      logging.debug('Wait for all pending OPC operations are finished.')
+      time.sleep(delay)
+      delay = min(delay * 2, 0.5)
+
+  async def measure_bulk_async(
+      self, specs: Iterable[tuple[str, Sequence[Any]]]
+  ) -> list[Any]:
+    """Run several measurements without blocking the event loop.
+
+    The measurements of one instrument run one at a time on the worker of its
+    data handler. Gather the coroutines of several instruments to overlap
+    them.
+
+    Args:
+        specs: The method name and the arguments of each measurement, such as
+          [('measure_voltage', (1,)), ('measure_current', (2,))].
+
+    Returns:
+        list[Any]: The result of each measurement, in the order of specs.
+    """
+    return list(
+        await asyncio.gather(*(
+            self.data_handler.run_async(getattr(self, name), *args)
+            for name, args in specs
+        ))
+    )
 
   def event_status_register(
       self,
@@ -382,11 +533,19 @@ class Instrument:
     Returns:
         int: The current value of the Event Status Register.
     """
-    esr = int(self.data_handler.query('*ESR?'))
+    esr = int(self.data_handler.query_raw(b'*ESR?'))
     logging.debug('Standard Event Status Register: %d with maks %d', esr, mask)
     return esr & mask
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve(instrument_type: str, module_name: str, class_name: str) -> type:
+  # The package argument might need to be updated depending on folder structure
+  package_name = f'py_lab_hal.instrument.{instrument_type}.{module_name}'
+  model_module = importlib.import_module(name=package_name)
+  return getattr(model_module, class_name)
+
+
 def select(
     instrument_type: str,
     module_name: str,
@@ -411,11 +570,7 @@ def select(
   """
   logging.debug('Init instrument select')
 
-  # The package argument might need to be updated depending on folder structure
-  package_name = f'py_lab_hal.instrument.{instrument_type}.{module_name}'
-  model_module = importlib.import_module(name=package_name)
-
-  module = getattr(model_module, class_name)
+  module = _resolve(instrument_type, module_name, class_name)
   instance = module(com=com, inst_config=inst_config)
 
   logging.debug('Selecting Module %s %s.', instrument_type, module_name)
@@ -14,6 +14,9 @@
 
 """Child Light Module of ArriS120."""
 
+from collections.abc import Iterable
+import time
+
 from py_lab_hal.cominterface import cominterface
 from py_lab_hal.cominterface import dmx
 from py_lab_hal.instrument import instrument
@@ -43,15 +46,54 @@ def _check_percentage(percentage: float):
     raise ValueError('The percentage should between 0 - 1')
 
 
-def percent_to_twobytes(percent: float) -> tuple[int, int]:
+def _twobytes(percent: float) -> tuple[int, int]:
   value = int(percent * 0xFFFF)
-  return (value & 0xFF00) >> 8, value & 0x00FF
+  return value >> 8, value & 0xFF
+
+
+# The bytes of the 0.1% steps scripts usually use, keyed by the exact float so
+# the other percentages still get the full 16 bit resolution.
+_PERCENT_TO_TWOBYTES = {
+    step / 1000: _twobytes(step / 1000) for step in range(1001)
+}
+
+
+def percent_to_twobytes(percent: float) -> tuple[int, int]:
+  try:
+    return _PERCENT_TO_TWOBYTES[percent]
+  except KeyError:
+    return _twobytes(percent)
+
+
+def percents_to_twobytes(percents: Iterable[float]) -> list[tuple[int, int]]:
+  """Checks and converts a sequence of percentages to their two-byte values.
+
+  Args:
+    percents (Iterable[float]): The percentages, between 0 - 1.
+
+  Returns:
+    list[tuple[int, int]]: The hi and lo byte of each percentage.
+  """
+  steps = []
+  for percent in percents:
+    _check_percentage(percent)
+    steps.append(percent_to_twobytes(percent))
+  return steps
 
 
 def cal_percent(value, max_value, min_value):
   return (value - min_value) / (max_value - min_value)
 
 
+def _kelvins_to_percent(kelvins: int) -> float:
+  if not COLOR_TEMPERATURE_MIN <= kelvins <= COLOR_TEMPERATURE_MAX:
+    raise ValueError(
+        f'The kelvins should between {COLOR_TEMPERATURE_MIN} -'
+        f' {COLOR_TEMPERATURE_MAX}'
+    )
+  return cal_percent(kelvins, COLOR_TEMPERATURE_MAX, COLOR_TEMPERATURE_MIN)
+
+
 class ArriS120(light.Light):
   """Child Light Class of ArriS120.
 
@@ -68,8 +110,25 @@ class ArriS120(light.Light):
   ) -> None:
     super().__init__(com, inst_config)
 
+    self.inst = com
     self.base_channel = 1
 
+  @property
+  def base_channel(self) -> int:
+    return self._base_channel
+
+  @base_channel.setter
+  def base_channel(self, base_channel: int) -> None:
+    # The first channel of each hi/lo pair, computed once per base channel.
+    self._base_channel = base_channel
+    self._dimmer_channel = base_channel + DIMMER_HI_CHANNEL_OFFSET
+    self._color_temperature_channel = (
+        base_channel + COLOR_TEMPERATURE_HI_CHANNEL_OFFSET
+    )
+    self._red_channel = base_channel + RED_HI_CHANNEL_OFFSET
+    self._green_channel = base_channel + GREEN_HI_CHANNEL_OFFSET
+    self._blue_channel = base_channel + BLUE_HI_CHANNEL_OFFSET
+
   def set_base_channel(self, base_channel: int) -> None:
     """Set the base channel of the DMX device.
 
@@ -80,52 +139,81 @@ class ArriS120(light.Light):
 
   def dimmer(self, percent) -> None:
     _check_percentage(percent)
-    hi, lo = percent_to_twobytes(percent)
-
-    self.inst.set_value(self.base_channel + DIMMER_HI_CHANNEL_OFFSET, hi)
-    self.inst.set_value(self.base_channel + DIMMER_LO_CHANNEL_OFFSET, lo)
+    self.inst.set_values(self._dimmer_channel, percent_to_twobytes(percent))
 
   def color_temperature(self, kelvins: int) -> None:
-    if not COLOR_TEMPERATURE_MIN <= kelvins <= COLOR_TEMPERATURE_MAX:
-      raise ValueError(
-          f'The kelvins should between {COLOR_TEMPERATURE_MIN} -'
-          f' {COLOR_TEMPERATURE_MAX}'
-      )
-
-    percent = cal_percent(kelvins, COLOR_TEMPERATURE_MAX, COLOR_TEMPERATURE_MIN)
-
-    hi, lo = percent_to_twobytes(percent)
-
-    self.inst.set_value(
-        self.base_channel + COLOR_TEMPERATURE_HI_CHANNEL_OFFSET, hi
-    )
-    self.inst.set_value(
-        self.base_channel + COLOR_TEMPERATURE_LO_CHANNEL_OFFSET, lo
+    self.inst.set_values(
+        self._color_temperature_channel,
+        percent_to_twobytes(_kelvins_to_percent(kelvins)),
     )
 
   def red(self, percent) -> None:
     _check_percentage(percent)
-
-    hi, lo = percent_to_twobytes(percent)
-
-    self.inst.set_value(self.base_channel + RED_HI_CHANNEL_OFFSET, hi)
-    self.inst.set_value(self.base_channel + RED_LO_CHANNEL_OFFSET, lo)
+    self.inst.set_values(self._red_channel, percent_to_twobytes(percent))
 
   def green(self, percent) -> None:
     _check_percentage(percent)
-
-    hi, lo = percent_to_twobytes(percent)
-
-    self.inst.set_value(self.base_channel + GREEN_HI_CHANNEL_OFFSET, hi)
-    self.inst.set_value(self.base_channel + GREEN_LO_CHANNEL_OFFSET, lo)
+    self.inst.set_values(self._green_channel, percent_to_twobytes(percent))
 
   def blue(self, percent) -> None:
     _check_percentage(percent)
+    self.inst.set_values(self._blue_channel, percent_to_twobytes(percent))
+
+  def set_all_colors(
+      self, dimmer: float, kelvins: int, red: float, green: float, blue: float
+  ) -> None:
+    """Set the dimmer, the color temperature and the colors together.
 
-    hi, lo = percent_to_twobytes(percent)
+    The dimmer and the color temperature channels are written in one call, and
+    the red, green and blue channels in another.
 
-    self.inst.set_value(self.base_channel + BLUE_HI_CHANNEL_OFFSET, hi)
-    self.inst.set_value(self.base_channel + BLUE_LO_CHANNEL_OFFSET, lo)
+    Args:
+        dimmer (float): The percent of the dimmer.
+        kelvins (int): Color Temperature in kelvins.
+        red (float): The percentage of the red intensity.
+        green (float): The percentage of the green intensity.
+        blue (float): The percentage of the blue intensity.
+    """
+    for percent in (dimmer, red, green, blue):
+      _check_percentage(percent)
+    self.inst.set_values(
+        self._dimmer_channel,
+        percent_to_twobytes(dimmer)
+        + percent_to_twobytes(_kelvins_to_percent(kelvins)),
+    )
+    self.inst.set_values(
+        self._red_channel,
+        percent_to_twobytes(red)
+        + percent_to_twobytes(green)
+        + percent_to_twobytes(blue),
+    )
+
+  def dimmer_ramp(self, percents: Iterable[float], interval: float) -> None:
+    """Step the dimmer through percents, sending one step every interval.
+
+    All the steps are checked and converted before the first one is sent.
+
+    Args:
+        percents (Iterable[float]): The percent of the dimmer at each step.
+        interval (float): The seconds between two steps.
+    """
+    steps = percents_to_twobytes(percents)
+    monotonic = time.monotonic
+    sleep = time.sleep
+    set_values = self.inst.set_values
+    submit = self.inst.submit
+    channel = self._dimmer_channel
+    # Sleep until a deadline from the start, so the time spent sending each
+    # step does not add up over the ramp.
+    deadline = monotonic()
+    for i, step in enumerate(steps):
+      if i:
+        deadline += interval
+        remaining = deadline - monotonic()
+        if remaining > 0:
+          sleep(remaining)
+      set_values(channel, step)
+      submit()
 
   def submit(self) -> None:
     """Send the DMX signal."""
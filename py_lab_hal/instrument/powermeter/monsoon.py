@@ -22,11 +22,14 @@ monitor.
 
 from __future__ import annotations
 
+from collections.abc import Iterator, Sequence
 import dataclasses
 import itertools
 import json
 import logging
 import pathlib
+import queue
+import threading
 
 from Monsoon import sampleEngine
 from py_lab_hal.cominterface import cominterface
@@ -49,6 +52,43 @@ class MonsoonMeasurements(pm.PowerMeasurements):
   usb_volts: float
 
 
+class MonsoonMeasurementsView(Sequence[MonsoonMeasurements]):
+  """The samples of a capture, kept as the columns the sample engine returns.
+
+  A MonsoonMeasurements is only built for the samples that are read, so a long
+  capture does not allocate one object per sample up front. A field missing
+  from a shorter column reads as ''.
+
+  Attributes:
+      columns (Sequence[Sequence[float]]): One column per field of
+        MonsoonMeasurements, in the order of its fields.
+  """
+
+  def __init__(self, columns: Sequence[Sequence[float]]) -> None:
+    self.columns = columns
+    self._len = max(map(len, columns), default=0)
+
+  def __len__(self) -> int:
+    return self._len
+
+  def __getitem__(self, index):
+    if isinstance(index, slice):
+      return [self[i] for i in range(*index.indices(self._len))]
+    if index < 0:
+      index += self._len
+    if not 0 <= index < self._len:
+      raise IndexError('measurement index out of range')
+    return MonsoonMeasurements(*(
+        column[index] if index < len(column) else ''
+        for column in self.columns
+    ))
+
+  def __iter__(self) -> Iterator[MonsoonMeasurements]:
+    return itertools.starmap(
+        MonsoonMeasurements, itertools.zip_longest(*self.columns, fillvalue='')
+    )
+
+
 class MonsoonUsbPassThrough(util.PyLabHalEnum):
   """Values for setting or retrieving the USB Passthrough mode."""
 
@@ -70,17 +110,23 @@ class Monsoon(pm.PowerMeter):
     self.is_sampling = False
     self.measurement_cfg: pm.MeasurementTriggerConfig
     self.measurement_json = None
+    # Held around the sample engine calls, which stream_measurements makes
+    # from a background thread.
+    self._engine_lock = threading.RLock()
 
   def initialize(self, enable_main=False, enable_usb=False, enable_aux=False):
     """initialize Monsoon power sources."""
+    channels = sampleEngine.channels
+    enabled = []
     if enable_main:
-      self.engine.enableChannel(sampleEngine.channels.MainCurrent)
-      self.engine.enableChannel(sampleEngine.channels.MainVoltage)
+      enabled += (channels.MainCurrent, channels.MainVoltage)
     if enable_usb:
-      self.engine.enableChannel(sampleEngine.channels.USBCurrent)
-      self.engine.enableChannel(sampleEngine.channels.USBVoltage)
+      enabled += (channels.USBCurrent, channels.USBVoltage)
     if enable_aux:
-      self.engine.enableChannel(sampleEngine.channels.AuxCurrent)
+      enabled.append(channels.AuxCurrent)
+    enable_channel = self.engine.enableChannel
+    for channel in enabled:
+      enable_channel(channel)
     try:
       self.monitor.fillStatusPacket()
     except AttributeError:
@@ -119,30 +165,96 @@ class Monsoon(pm.PowerMeter):
     self.engine.ConsoleOutput(measurement_cfg.enableConsoleOut)
 
   @staticmethod
-  def _parse_measurements(measurement_list):
-    result_list = []
-    for measurement in itertools.zip_longest(*measurement_list, fillvalue=''):
-      result_list.append(MonsoonMeasurements(*measurement))
-
-    return result_list
+  def _parse_measurements(measurement_list) -> MonsoonMeasurementsView:
+    return MonsoonMeasurementsView(measurement_list)
 
   def get_measurements(
       self, trigger_config: pm.MeasurementTriggerConfig
-  ) -> list[MonsoonMeasurements]:
-    if trigger_config.samplingMode == pm.SamplingMode.oneShot:
-      samples = self.engine.getSamples()
-    else:
-      samples = self.engine.periodicCollectSamples(trigger_config.numSamples)
+  ) -> Sequence[MonsoonMeasurements]:
+    with self._engine_lock:
+      if trigger_config.samplingMode == pm.SamplingMode.oneShot:
+        samples = self.engine.getSamples()
+      else:
+        samples = self.engine.periodicCollectSamples(trigger_config.numSamples)
     if self.measurement_json:
       self._save_measurement_json(samples)
     return self._parse_measurements(samples)
 
+  def stream_measurements(
+      self, chunk: int = 1024, max_pending: int = 2
+  ) -> Iterator[MonsoonMeasurementsView]:
+    """Yield the samples of a periodic capture in chunks while it runs.
+
+    A background thread collects chunk samples at a time from the sample
+    engine, so the next chunk is being collected while the caller processes
+    the current one. The thread waits once max_pending chunks are waiting for
+    the caller. The stream ends once stop_sampling is called, which waits for
+    the chunk being collected, and closing the generator stops the thread
+    after its current chunk. The chunks are not written to the json output.
+
+    Args:
+        chunk (int): The number of samples per chunk. Defaults to 1024.
+        max_pending (int): The number of collected chunks held for the caller.
+          Defaults to 2.
+
+    Yields:
+        MonsoonMeasurementsView: The samples of each chunk.
+
+    Raises:
+        RuntimeError: If periodic sampling was not started.
+    """
+    if (
+        not self.is_sampling
+        or self.measurement_cfg.samplingMode != pm.SamplingMode.periodic
+    ):
+      raise RuntimeError('Periodic sampling is not started')
+    chunks = queue.Queue(maxsize=max_pending)
+    stop = threading.Event()
+
+    def pump():
+      try:
+        while not stop.is_set():
+          with self._engine_lock:
+            if not self.is_sampling:
+              break
+            samples = self.engine.periodicCollectSamples(chunk)
+          chunks.put(samples)
+      except Exception as e:  # pylint: disable=broad-exception-caught
+        chunks.put(e)
+      finally:
+        chunks.put(None)
+
+    threading.Thread(target=pump, name='MonsoonPump', daemon=True).start()
+    samples = ()
+    try:
+      while True:
+        samples = chunks.get()
+        if samples is None:
+          return
+        if isinstance(samples, Exception):
+          raise samples
+        yield self._parse_measurements(samples)
+    finally:
+      stop.set()
+      # Unblocks the thread until it ends, so it never waits on a full queue.
+      while samples is not None:
+        samples = chunks.get()
+
   def _save_measurement_json(self, samples):
+    # Written one column at a time through a large buffer, giving the same
+    # text as json.dump of the field to column dict.
     fields = [f.name for f in dataclasses.fields(MonsoonMeasurements)]
-    with open(self.measurement_json, 'w') as json_file:
-      json.dump(dict(zip(fields, samples)), json_file)
-
-  def measure_current(self) -> list[MonsoonMeasurements]:
+    with open(self.measurement_json, 'w', buffering=1 << 20) as json_file:
+      json_file.write('{')
+      for i, (field, column) in enumerate(zip(fields, samples)):
+        if i:
+          json_file.write(', ')
+        json_file.write(json.dumps(field))
+        json_file.write(': ')
+        json_file.write(json.dumps(column))
+      json_file.write('}')
+
+  def measure_current(self) -> Sequence[MonsoonMeasurements]:
     if not self.is_sampling:
       self.start_sampling(pm.MeasurementTriggerConfig(numSamples=1))
     return self.get_measurements(self.measurement_cfg)
@@ -162,8 +274,12 @@ class Monsoon(pm.PowerMeter):
 
   def stop_sampling(self, trigger_config: pm.MeasurementTriggerConfig):
     if self.is_sampling:
-      if trigger_config.samplingMode == pm.SamplingMode.periodic:
-        self.engine.periodicStopSampling(closeCSV=True)
+      # Cleared first, so a stream does not collect another chunk while this
+      # waits for the engine.
+      self.is_sampling = False
+      with self._engine_lock:
+        if trigger_config.samplingMode == pm.SamplingMode.periodic:
+          self.engine.periodicStopSampling(closeCSV=True)
     else:
       logging.warning('Sampling not started, doing nothing')
     self.is_sampling = False
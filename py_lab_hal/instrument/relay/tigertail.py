@@ -21,6 +21,9 @@ from py_lab_hal.cominterface import cominterface
 from py_lab_hal.instrument import instrument
 from py_lab_hal.instrument.relay import relay
 
+# The mux command of each channel, channel 0 turns both channels off.
+_MUX_COMMAND = {0: b'mux off', 1: b'mux A', 2: b'mux B'}
+
 
 class Tigertail(relay.Relay):
   """Child relay Class of Tigertail."""
@@ -33,25 +36,26 @@ class Tigertail(relay.Relay):
     super().__init__(com, inst_config)
     self._channel_status = 0
 
-  def enable(self, channel, enable) -> None:
+  def enable(self, channel, enable, force=False) -> None:
     if enable:
       if channel == 0:
         logging.warning('Can not enable the channel 0 on Tigertail')
       else:
-        self._channel_on(channel)
+        self._set_mux(channel, force)
 
     else:
       if channel == self._channel_status or channel == 0:
-        self.reset()
+        self._set_mux(0, force)
 
   def reset(self) -> None:
-    self.data_handler.send('mux off')
-    self._channel_status = 0
-
-  def _channel_on(self, channel: Literal[1, 2]) -> None:
-    channel_mapping = {
-        1: 'A',
-        2: 'B',
-    }
-    self.data_handler.send(f'mux {channel_mapping[channel]}')
+    self._set_mux(0, force=True)
+
+  def _set_mux(self, channel: Literal[0, 1, 2], force: bool = False) -> None:
+    self._write_if_changed(
+        'mux',
+        channel,
+        self.data_handler.send_bytes,
+        _MUX_COMMAND[channel],
+        force=force,
+    )
     self._channel_status = channel
@@ -14,8 +14,11 @@
 
 """Child Relay Module of Usbrelay."""
 
+from collections.abc import Iterable
 import time
 
+from py_lab_hal.cominterface import cominterface
+from py_lab_hal.instrument import instrument
 from py_lab_hal.instrument.relay import relay
 
 HEADER = 0xA0
@@ -33,15 +36,39 @@ def crc(channel: int, enable: bool):
   Returns:
     int: The CRC of the command.
   """
-  return HEADER + channel + int(enable)
+  return (HEADER + channel + int(enable)) & 0xFF
 
 
 class Usbrelay(relay.Relay):
-  """Child relay Class of Usbrelay."""
+  """Child relay Class of Usbrelay.
+
+  Attributes:
+      post_write_delay (float): The seconds to wait after each command for the
+        relay to switch. Defaults to 0.2.
+  """
+
+  def __init__(
+      self,
+      com: cominterface.ComInterfaceClass,
+      inst_config: instrument.InstrumentConfig,
+  ) -> None:
+    super().__init__(com, inst_config)
+    self.post_write_delay = 0.2
 
   def enable(self, channel, enable):
-    message_bytes = bytes.fromhex(
-        f'{HEADER:02X} {channel:02X} {int(enable):02X} {crc(channel, enable):02X}'
-    )
-    self.data_handler.send_raw(message_bytes)
-    time.sleep(0.2)
+    self.enable_many(((channel, enable),))
+
+  def enable_many(self, states: Iterable[tuple[int, bool]]) -> None:
+    """Turn on/off several relays with one write and one settle delay.
+
+    Args:
+        states (Iterable[tuple[int, bool]]): The channel and the state of each
+          relay, applied in order.
+    """
+    frames = bytearray()
+    for channel, enable in states:
+      frames += bytes((HEADER, channel, int(enable), crc(channel, enable)))
+    if not frames:
+      return
+    self.data_handler.send_raw(bytes(frames))
+    time.sleep(self.post_write_delay)
@@ -696,14 +696,6 @@ class TektronixMSO(scope.Scope):
     )
     return ans
 
-  def wait_task(self, timeout=30):
-    time_now = time.time()
-    while self.data_handler.query('*OPC?') != '1':
-      logging.info('Wait for all pending OPC operations are finished.')
-      time.sleep(1)
-      if time.time() - time_now > timeout:
-        raise RuntimeError('Timeout')
-
   def wait_trigger_ready(self, timeout=30):
     time_now = time.time()
     while self.data_handler.query('TRIGger:STATE?') != 'REA':
@@ -19,10 +19,10 @@ from py_lab_hal.instrument import instrument
 from py_lab_hal.instrument.common.keysight import keysight_n6705c
 from py_lab_hal.instrument.smu import smu
 
-RESISTANCE_MODE = [
+RESISTANCE_MODE = frozenset({
     instrument.ChannelMode.RESISTANCE,
     instrument.ChannelMode.RESISTANCE_4WIRE,
-]
+})
 
 
 class KeysightN6705c(keysight_n6705c.KeysightN6705c, smu.Smu):
@@ -14,7 +14,10 @@
 
 """Json_dataclass."""
 
+import dataclasses
+import enum
 import re
+import typing
 
 import dataclasses_json
 
@@ -31,3 +34,93 @@ def camel2snake(value: str) -> str:
   return (
       re.sub(pattern=r'([A-Z]+)', repl=r'_\1', string=value).lower().lstrip('_')
   )
+
+
+def _decode_expr(
+    field_type, var: str, namespace: dict[str, typing.Any]
+) -> str:
+  """Build the expression that decodes the var into the field_type.
+
+  Args:
+      field_type: The type hint of the field.
+      var (str): The name of the variable that holds the raw value.
+      namespace (dict[str, Any]): The namespace of the generated code, the
+        types referenced by the expression will be added into it.
+
+  Returns:
+      str: The python expression.
+  """
+  origin = typing.get_origin(field_type)
+  args = typing.get_args(field_type)
+
+  if origin is typing.Union and type(None) in args:
+    not_none = [arg for arg in args if arg is not type(None)]
+    if len(not_none) == 1:
+      return _decode_expr(not_none[0], var, namespace)
+
+  if origin is list and args:
+    item_expr = _decode_expr(args[0], 'item', namespace)
+    if item_expr == 'item':
+      return f'list({var})'
+    return f'[{item_expr} for item in {var}]'
+
+  if isinstance(field_type, type):
+    name = f'_type{len(namespace)}'
+    if dataclasses.is_dataclass(field_type):
+      namespace[name] = field_type
+      return (
+          f'{var} if isinstance({var}, {name}) else '
+          f'{name}.from_dict({var}, infer_missing=infer_missing)'
+      )
+    if issubclass(field_type, enum.Enum):
+      namespace[name] = field_type
+      return f'{name}({var})'
+
+  return var
+
+
+def dataclass_json_codegen(cls):
+  """Replace the from_dict of the dataclass with a generated one.
+
+  The generated from_dict decodes each field with straight-line code built
+  from the type hints once, instead of inspecting the types on every call.
+  Dataclass fields call the from_dict of their own type, so the nested
+  configs should be decorated as well. The result is the same as the
+  dataclasses_json from_dict for the dataclass, enum, list and primitive
+  fields, including infer_missing, which sets the missing fields without a
+  default to None.
+
+  Args:
+      cls: The dataclass with the dataclasses_json mixin.
+
+  Returns:
+      The same class with the generated from_dict.
+  """
+  hints = typing.get_type_hints(cls)
+  letter_case = getattr(cls, 'dataclass_json_config', {}).get('letter_case')
+  namespace: dict[str, typing.Any] = {}
+  lines = ['def from_dict(cls, kvs, *, infer_missing=False):', '  kwargs = {}']
+  for field in dataclasses.fields(cls):
+    if not field.init:
+      continue
+    keys = [field.name]
+    if letter_case is not None and letter_case(field.name) != field.name:
+      keys.insert(0, letter_case(field.name))
+    expr = _decode_expr(hints[field.name], 'value', namespace)
+    for index, key in enumerate(keys):
+      lines.append(f'  {"if" if index == 0 else "elif"} {key!r} in kvs:')
+      lines.append(f'    value = kvs[{key!r}]')
+      lines.append(
+          f'    kwargs[{field.name!r}] = None if value is None else {expr}'
+      )
+    if (
+        field.default is dataclasses.MISSING
+        and field.default_factory is dataclasses.MISSING
+    ):
+      lines.append('  elif infer_missing:')
+      lines.append(f'    kwargs[{field.name!r}] = None')
+  lines.append('  return cls(**kwargs)')
+
+  exec('\n'.join(lines), namespace)  # pylint: disable=exec-used
+  cls.from_dict = classmethod(namespace['from_dict'])
+  return cls
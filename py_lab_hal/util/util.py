@@ -124,6 +124,13 @@ def get_from_dict(
 ) -> VALUETYPE:
   """The helper function of get item in the dict."""
 
+  # Enum members hash to their own key, so only free-form strings need to be
+  # normalized before the lookup.
+  try:
+    return dict_in[key_in]
+  except (KeyError, TypeError):
+    pass
+
   try:
     val = dict_in[re.sub('[^a-zA-Z0-9_]', '', key_in).upper()]  # type: ignore
   except KeyError:
@@ -142,3 +149,21 @@ def find_the_nearest(list_in, value_in):
   difference = lambda list_in: abs(list_in - value_in)
   res = min(list_in, key=difference)
   return res
+
+
+def format_number(value) -> str:
+  """Formats a number for a SCPI command.
+
+  Floats are written with 15 significant digits, which every double holds
+  exactly, so arithmetic noise such as 0.30000000000000004 is sent as 0.3.
+  Other values, such as int or MAX, are written with str.
+
+  Args:
+      value: The value to format.
+
+  Returns:
+      (str): The formatted value.
+  """
+  if isinstance(value, float):
+    return format(value, '.15g')
+  return str(value)
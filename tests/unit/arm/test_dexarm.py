@@ -0,0 +1,62 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Dexarm Unit Test."""
+
+from py_lab_hal import builder
+from py_lab_hal.cominterface import cominterface
+from py_lab_hal.instrument.arm import dexarm
+
+
+def test_connect_config_not_changed() -> None:
+  build = builder.PyLabHALBuilder()
+  connect_config = cominterface.ConnectConfig(interface_type='debug')
+  build.connection_config = connect_config
+
+  build.instrument_config.clear = False
+  build.instrument_config.reset = False
+  build.instrument_config.idn = False
+  build.instrument_config.auto_init = False
+
+  inst = build.build_instrument(builder.Arm.DEXARM)
+  com = inst.data_handler.interface
+  assert com.connect_config is not connect_config
+  assert com.connect_config.terminator.read == 'ok\n'
+  assert connect_config.terminator.read == cominterface.DEFAULT_READ_TERMINATOR
+  assert connect_config.interface_type == 'debug'
+
+
+def test_get_current_position_removes_y_offset() -> None:
+  build = builder.PyLabHALBuilder()
+  build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+
+  build.instrument_config.clear = False
+  build.instrument_config.reset = False
+  build.instrument_config.idn = False
+  build.instrument_config.auto_init = False
+
+  inst = build.build_instrument(builder.Arm.DEXARM)
+  com = inst.data_handler.interface
+  com.open()
+  com.push_recv_queue(
+      b'X:10.00 Y:350.00 Z:-5.00 E:0.00\n'
+      b'DEXARM Theta A:1.00 Theta B:2.00 Theta C:3.00\n'
+      b'ok\n'
+  )
+  position = inst.get_current_position()
+  assert com.get_send_queue() == b'M114'
+  assert position['X'] == 10.0
+  assert position['Y'] == 350.0 - dexarm.Y_OFFSET
+  assert position['Z'] == -5.0
+  assert position['A'] == 1.0
@@ -0,0 +1,106 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Admesy Hyperion Unit Test."""
+
+import asyncio
+import struct
+
+from py_lab_hal import builder
+from py_lab_hal.cominterface import cominterface
+from py_lab_hal.cominterface import debug
+from py_lab_hal.instrument.color_meter import admesy_hyperion
+import pytest
+
+
+class TestAdmesyHyperion:
+  com: debug.Debug
+
+  @pytest.fixture(scope='function', autouse=True)
+  def setup_thermal_f(self):
+    self.com.clean_send_queue()
+    yield
+
+  @pytest.fixture(scope='class', autouse=True)
+  def setup_thermal(self):
+    build = builder.PyLabHALBuilder()
+    build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+
+    build.instrument_config.clear = False
+    build.instrument_config.reset = False
+    build.instrument_config.idn = False
+    build.instrument_config.auto_init = False
+
+    TestAdmesyHyperion.instrument = build.build_instrument(
+        builder.ColorMeter.ADMESY_HYPERION
+    )
+    TestAdmesyHyperion.instrument.open_instrument()
+    TestAdmesyHyperion.com = (
+        TestAdmesyHyperion.instrument.data_handler.interface
+    )
+
+  def test_measure_XYZ(self) -> None:
+    self.com.push_recv_queue(b'1,2,3,0,0')
+    recv = self.instrument.measure_XYZ()
+    assert self.com.get_send_queue() == b':MEASure:XYZ'
+    assert recv == '1,2,3,0,0'
+
+  def test_measure_bulk(self) -> None:
+    self.com.push_recv_queue(b'1,2,3,0,0')
+    self.com.push_recv_queue(b'6500,0,0')
+    recv = self.instrument.measure_bulk(['XYZ', 'CCT'])
+    assert self.com.get_send_queue() == b':MEASure:XYZ'
+    assert self.com.get_send_queue() == b':MEASure:CCT'
+    assert recv == {'XYZ': '1,2,3,0,0', 'CCT': '6500,0,0'}
+
+  def test_ameasure_bulk(self) -> None:
+    self.com.push_recv_queue(b'1,2,3,0,0')
+    self.com.push_recv_queue(b'6500,0,0')
+    recv = asyncio.run(self.instrument.ameasure_bulk(['XYZ', 'CCT']))
+    assert self.com.get_send_queue() == b':MEASure:XYZ'
+    assert self.com.get_send_queue() == b':MEASure:CCT'
+    assert recv == {'XYZ': '1,2,3,0,0', 'CCT': '6500,0,0'}
+
+  def test_measure_sample_XYZ_values(self) -> None:
+    self.com.push_recv_queue(b'#2')
+    self.com.push_recv_queue(b'12')
+    self.com.push_recv_queue(struct.pack('<3f', 1.0, 2.0, 3.5))
+    recv = self.instrument.measure_sample_XYZ_values(1, 0)
+    assert self.com.get_send_queue() == b':SAMPle:XYZ 1,0'
+    assert recv == [1.0, 2.0, 3.5]
+
+  def test_measure_sequence_XYZ_frames(self) -> None:
+    self.com.push_recv_queue(b'#2')
+    self.com.push_recv_queue(b'24')
+    self.com.push_recv_queue(struct.pack('<6f', 1, 2, 3, 4, 5, 6))
+    recv = self.instrument.measure_sequence_XYZ_frames(2)
+    assert self.com.get_send_queue() == b':MEASure:SEQXYZ 2'
+    assert recv == [(1, 2, 3), (4, 5, 6)]
+
+  def test_measure_sequence_XYZ_frames_one_reply(self) -> None:
+    # The whole block arrives in one reply, followed by the terminator, and
+    # its values hold 0x0A bytes, the same as the terminator.
+    value = b'\n\n\x20\x41'
+    self.com.connect_config.terminator.read = '\n'
+    try:
+      self.com.push_recv_queue(b'#224' + value * 6 + b'\n')
+      recv = self.instrument.measure_sequence_XYZ_frames(2)
+    finally:
+      self.com.connect_config.terminator.read = ''
+    assert self.com.get_send_queue() == b':MEASure:SEQXYZ 2'
+    assert recv == [struct.unpack('<3f', value * 3)] * 2
+    assert not self.com.buf
+
+  def test_parse_xyz_ascii(self) -> None:
+    assert admesy_hyperion.parse_xyz('1,2,3,4,5,6') == [(1, 2, 3), (4, 5, 6)]
@@ -14,6 +14,9 @@
 
 """GW Instek PST3202 Unit Test."""
 
+import threading
+import time
+
 from py_lab_hal import builder
 from py_lab_hal.cominterface import cominterface
 from py_lab_hal.cominterface import debug
@@ -94,9 +97,7 @@ class TestGwinpst3202:
 
   def test_set_output(self):
     self.instrument.set_output(1, 1, 1)
-    ans = b'CHAN1:CURR 1.00'
-    assert self.com.get_send_queue() == ans
-    ans = b'CHAN1:VOLT 1.00'
+    ans = b'CHAN1:CURR 1.00;:CHAN1:VOLT 1.00'
     assert self.com.get_send_queue() == ans
 
   @pytest.mark.parametrize('channel, enable', [(1, True), (1, False)])
@@ -104,3 +105,96 @@ class TestGwinpst3202:
     self.instrument.enable_output(channel, enable)
     ans = f'OUTP:STATE {int(enable)}'.encode()
     assert self.com.get_send_queue() == ans
+
+  def test_set_sequence(self) -> None:
+    self.instrument.set_sequence(1, [1, 2], [0.1, 0.2], [0, 0.01])
+    assert self.com.get_send_queue() == b'CHAN1:CURR 0.10;:CHAN1:VOLT 1.00'
+    assert self.com.get_send_queue() == b'CHAN1:CURR 0.20;:CHAN1:VOLT 2.00'
+
+  def test_skip_unchanged_writes(self) -> None:
+    self.instrument.skip_unchanged_writes = True
+    try:
+      self.instrument.set_output_voltage(1, 3, force=True)
+      self.instrument.set_output_voltage(1, 3)
+      self.instrument.set_output_voltage(1, 4)
+    finally:
+      self.instrument.skip_unchanged_writes = False
+    assert self.com.get_send_queue() == b'CHAN1:VOLT 3.00'
+    assert self.com.get_send_queue() == b'CHAN1:VOLT 4.00'
+
+  def test_send_nowait(self) -> None:
+    self.instrument.data_handler.send_nowait('CHAN1:VOLT 1.00')
+    self.instrument.data_handler.send_nowait('CHAN1:CURR 0.10')
+    self.com.push_recv_queue(b'1.0')
+    assert self.instrument.measure_voltage(1) == 1.0
+    assert self.com.get_send_queue() == b'CHAN1:VOLT 1.00'
+    assert self.com.get_send_queue() == b'CHAN1:CURR 0.10'
+    assert self.com.get_send_queue() == b'CHAN1:MEAS:VOLT?'
+
+  def test_set_sequence_length_mismatch(self) -> None:
+    with pytest.raises(RuntimeError):
+      self.instrument.set_sequence(1, [1, 2], [0.1], [0, 0])
+
+
+def test_close_stops_writer() -> None:
+  build = builder.PyLabHALBuilder()
+  build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+
+  build.instrument_config.clear = False
+  build.instrument_config.reset = False
+  build.instrument_config.idn = False
+
+  inst = build.build_instrument(builder.DCPowerSupply.GWIN_PST3202)
+  com = inst.data_handler.interface
+  inst.data_handler.send_nowait('CHAN1:VOLT 1.00')
+  inst.data_handler.send_nowait('CHAN1:CURR 0.10')
+  writer = inst.data_handler._writer
+  inst.close()
+  assert not writer.is_alive()
+  assert not com.enable
+  assert com.get_send_queue() == b'CHAN1:VOLT 1.00'
+  assert com.get_send_queue() == b'CHAN1:CURR 0.10'
+
+
+def test_close_waits_for_submitted() -> None:
+  build = builder.PyLabHALBuilder()
+  build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+
+  build.instrument_config.clear = False
+  build.instrument_config.reset = False
+  build.instrument_config.idn = False
+
+  inst = build.build_instrument(builder.DCPowerSupply.GWIN_PST3202)
+  com = inst.data_handler.interface
+  started = threading.Event()
+
+  def send_later() -> None:
+    started.set()
+    time.sleep(0.05)
+    inst.data_handler.send('CHAN1:VOLT 1.00')
+
+  future = inst.data_handler.submit(send_later)
+  assert started.wait(timeout=5)
+  inst.close()
+  assert future.done()
+  assert inst.data_handler._executor is None
+  assert com.get_send_queue() == b'CHAN1:VOLT 1.00'
+
+
+def test_close_runs_finalizer() -> None:
+  build = builder.PyLabHALBuilder()
+  build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+
+  build.instrument_config.clear = False
+  build.instrument_config.reset = False
+  build.instrument_config.idn = False
+
+  inst = build.build_instrument(builder.DCPowerSupply.GWIN_PST3202)
+  com = inst.data_handler.interface
+  inst.close()
+  assert not inst._finalizer.alive
+  assert not com.enable
+  inst.open_instrument()
+  assert inst._finalizer.alive
+  assert com.enable
+  inst.close()
@@ -0,0 +1,112 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Keysight E36300 Series Unit Test."""
+
+import queue
+
+from py_lab_hal import builder
+from py_lab_hal.cominterface import cominterface
+from py_lab_hal.cominterface import debug
+import pytest
+
+
+class TestKeysighte36300:
+  com: debug.Debug
+
+  @pytest.fixture(scope='function', autouse=True)
+  def setup_thermal_f(self):
+    self.com.clean_send_queue()
+    self.instrument.prefetch_pair = False
+    self.instrument._pending_measure.clear()
+    yield
+
+  @pytest.fixture(scope='class', autouse=True)
+  def setup_thermal(self):
+    build = builder.PyLabHALBuilder()
+    build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+
+    build.instrument_config.clear = False
+    build.instrument_config.reset = False
+    build.instrument_config.idn = False
+    build.instrument_config.auto_init = False
+
+    TestKeysighte36300.instrument = build.build_instrument(
+        builder.DCPowerSupply.KEYSIGHT_E36313A
+    )
+    TestKeysighte36300.instrument.open_instrument()
+    TestKeysighte36300.com = (
+        TestKeysighte36300.instrument.data_handler.interface
+    )
+    yield
+
+  def test_measure_voltage_current(self) -> None:
+    self.com.push_recv_queue(b'5.0;0.25')
+    recv = self.instrument.measure_voltage_current(2)
+    assert (
+        self.com.get_send_queue()
+        == b'measure:scalar:voltage? (@2);:measure:scalar:current? (@2)'
+    )
+    assert recv == (5.0, 0.25)
+
+  def test_prefetch_pair(self) -> None:
+    self.instrument.prefetch_pair = True
+    self.com.push_recv_queue(b'5.0;0.25')
+    assert self.instrument.measure_voltage(1) == 5.0
+    assert self.instrument.measure_current(1) == 0.25
+    assert (
+        self.com.get_send_queue()
+        == b'measure:scalar:voltage? (@1);:measure:scalar:current? (@1)'
+    )
+    with pytest.raises(queue.Empty):
+      self.com.get_send_queue()
+
+  def test_prefetch_pair_expired(self) -> None:
+    self.instrument.prefetch_pair = True
+    self.instrument.prefetch_max_age = 0
+    try:
+      self.com.push_recv_queue(b'5.0;0.25')
+      self.com.push_recv_queue(b'5.1;0.3')
+      assert self.instrument.measure_voltage(1) == 5.0
+      assert self.instrument.measure_current(1) == 0.3
+    finally:
+      self.instrument.prefetch_max_age = 0.1
+    assert (
+        self.com.get_send_queue()
+        == b'measure:scalar:voltage? (@1);:measure:scalar:current? (@1)'
+    )
+    assert (
+        self.com.get_send_queue()
+        == b'measure:scalar:voltage? (@1);:measure:scalar:current? (@1)'
+    )
+
+  @pytest.mark.parametrize(
+      'setter, args',
+      [
+          ('enable_output', (1, True)),
+          ('set_output_voltage', (1, 3.3)),
+          ('set_output_current', (1, 0.5)),
+          ('set_output', (1, 3.3, 0.5)),
+          ('set_OCP_value', (1, 1.0)),
+          ('enable_OVP', (1, True)),
+      ],
+  )
+  def test_prefetch_pair_dropped_by_setter(self, setter, args) -> None:
+    self.instrument.prefetch_pair = True
+    self.com.push_recv_queue(b'5.0;0.25')
+    self.com.push_recv_queue(b'3.3;0.5')
+    assert self.instrument.measure_voltage(1) == 5.0
+    getattr(self.instrument, setter)(*args)
+    assert self.instrument.measure_current(1) == 0.5
+    assert self.instrument.measure_voltage(1) == 3.3
@@ -14,6 +14,9 @@
 
 """Keysight E3632A Unit Test."""
 
+import asyncio
+import queue
+
 from py_lab_hal import builder
 from py_lab_hal.cominterface import cominterface
 from py_lab_hal.cominterface import debug
@@ -84,12 +87,9 @@ class TestKeysighte3632a:
   #   pass
 
   def test_measure_power(self) -> None:
-    self.com.push_recv_queue(b'10')
-    self.com.push_recv_queue(b'1')
+    self.com.push_recv_queue(b'10;1')
     recv = self.instrument.measure_power(1)
-    ans = b'measure:current?'
-    assert self.com.get_send_queue() == ans
-    ans = b'measure:voltage?'
+    ans = b'measure:current?;:measure:voltage?'
     assert self.com.get_send_queue() == ans
     assert 10 == recv
 
@@ -112,9 +112,7 @@ class TestKeysighte3632a:
 
   def test_set_output(self) -> None:
     self.instrument.set_output(1, 1, 1)
-    ans = b'CURR 1'
-    assert self.com.get_send_queue() == ans
-    ans = b'VOLT 1'
+    ans = b'CURR 1;:VOLT 1'
     assert self.com.get_send_queue() == ans
 
   @pytest.mark.parametrize(
@@ -136,3 +134,42 @@ class TestKeysighte3632a:
     self.instrument.set_output_current(1, current)
     ans = f'CURR {current}'.encode()
     assert self.com.get_send_queue() == ans
+
+  def test_measure_bulk_async(self) -> None:
+    self.com.push_recv_queue(b'10')
+    self.com.push_recv_queue(b'1')
+    recv = asyncio.run(
+        self.instrument.measure_bulk_async(
+            [('measure_current', (1,)), ('measure_voltage', (1,))]
+        )
+    )
+    assert self.com.get_send_queue() == b'measure:current?'
+    assert self.com.get_send_queue() == b'measure:voltage?'
+    assert recv == [10, 1]
+
+  def test_open_instrument(self) -> None:
+    build = builder.PyLabHALBuilder()
+    build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+    build.instrument_config.idn = False
+    build.instrument_config.auto_init = False
+    instrument = build.build_instrument(builder.DCPowerSupply.KEYSIGHT_E3632A)
+    instrument.open_instrument()
+    com = instrument.data_handler.interface
+    assert com.get_send_queue() == b'SYSTem:REMote;*RST;*CLS'
+
+
+def test_open_with_idn_one_write() -> None:
+  build = builder.PyLabHALBuilder()
+  build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+  build.instrument_config.idn = False
+
+  inst = build.build_instrument(builder.DCPowerSupply.KEYSIGHT_E3632A)
+  com = inst.data_handler.interface
+  com.clean_send_queue()
+  inst.inst_config.idn = True
+  com.push_recv_queue(b'Keysight Technologies,E3632A,0,1.0')
+  inst.open_instrument()
+  assert com.get_send_queue() == b'*RST;*CLS;*IDN?'
+  with pytest.raises(queue.Empty):
+    com.get_send_queue()
+  assert inst.idn == 'Keysight Technologies,E3632A,0,1.0'
@@ -14,6 +14,8 @@
 
 """Keysight N6705C Unit Test."""
 
+import queue
+
 from py_lab_hal import builder
 from py_lab_hal.cominterface import cominterface
 from py_lab_hal.cominterface import debug
@@ -94,19 +96,90 @@ class TestKeysightn6705c:
 
   def test_measure_power(self) -> None:
     self.com.push_recv_queue(b'10')
-    self.com.push_recv_queue(b'1')
     recv = self.instrument.measure_power(1)
     ans = b'measure:scalar:power? (@1)'
     assert self.com.get_send_queue() == ans
     assert 10 == recv
 
+  def test_set_slewrate(self) -> None:
+    self.instrument.set_priority(1, instrument.ChannelMode.CURRENT_DC)
+    self.instrument.set_slewrate(1, instrument.EdgeTriggerSlope.RISE, 10)
+    assert self.com.get_send_queue() == b'FUNC CURRENT_DC, (@1)'
+    assert self.com.get_send_queue() == b'CURRent:SLEW:POSitive 10,(@1)'
+    self.instrument.set_priority(1, instrument.ChannelMode.VOLTAGE_DC)
+
+  def test_set_slewrate_after_invalidate_state(self) -> None:
+    self.instrument.set_priority(1, instrument.ChannelMode.CURRENT_DC)
+    self.instrument.invalidate_state(1)
+    self.com.push_recv_queue(b'VOLT')
+    self.instrument.set_slewrate(1, instrument.EdgeTriggerSlope.RISE, 10)
+    assert self.com.get_send_queue() == b'FUNC CURRENT_DC, (@1)'
+    assert self.com.get_send_queue() == b'FUNC? (@1)'
+    assert self.com.get_send_queue() == b'VOLT:SLEW:POSitive 10,(@1)'
+    self.instrument.set_priority(1, instrument.ChannelMode.VOLTAGE_DC)
+
+  def test_set_priority_unchanged(self) -> None:
+    self.instrument.skip_unchanged_writes = True
+    try:
+      self.instrument.set_priority(2, instrument.ChannelMode.CURRENT_DC)
+      self.instrument.set_priority(2, instrument.ChannelMode.CURRENT_DC)
+      self.instrument.set_priority(2, instrument.ChannelMode.VOLTAGE_DC)
+    finally:
+      self.instrument.skip_unchanged_writes = False
+    assert self.com.get_send_queue() == b'FUNC CURRENT_DC, (@2)'
+    assert self.com.get_send_queue() == b'FUNC VOLTAGE_DC, (@2)'
+
+  def test_set_priority_written_by_default(self) -> None:
+    self.instrument.set_priority(2, instrument.ChannelMode.CURRENT_DC)
+    self.instrument.set_priority(2, instrument.ChannelMode.CURRENT_DC)
+    assert self.com.get_send_queue() == b'FUNC CURRENT_DC, (@2)'
+    assert self.com.get_send_queue() == b'FUNC CURRENT_DC, (@2)'
+
+  def test_select_mode_after_invalidate_state(self) -> None:
+    self.instrument.skip_unchanged_writes = True
+    try:
+      self.instrument.select_mode(3, instrument.SmuEmulationMode.PS1Q)
+      self.instrument.select_mode(3, instrument.SmuEmulationMode.PS1Q)
+      self.instrument.invalidate_state(3)
+      self.instrument.select_mode(3, instrument.SmuEmulationMode.PS1Q)
+      self.instrument.select_mode(
+          3, instrument.SmuEmulationMode.PS1Q, force=True
+      )
+    finally:
+      self.instrument.skip_unchanged_writes = False
+    assert self.com.get_send_queue() == b'EMULation PS1Q,(@3)'
+    assert self.com.get_send_queue() == b'EMULation PS1Q,(@3)'
+    assert self.com.get_send_queue() == b'EMULation PS1Q,(@3)'
+    with pytest.raises(queue.Empty):
+      self.com.get_send_queue()
+
+  def test_measure_voltage_many(self) -> None:
+    self.com.push_recv_queue(b'1.5,2.5,3.5')
+    recv = self.instrument.measure_voltage_many([1, 2, 4])
+    ans = b'measure:scalar:voltage? (@1,2,4)'
+    assert self.com.get_send_queue() == ans
+    assert recv == [1.5, 2.5, 3.5]
+
   def test_set_output(self) -> None:
     self.instrument.set_output(1, 1, 1)
-    ans = b'SOUR:CURRent:DC 1,(@1)'
+    ans = b'SOUR:CURRent:DC 1,(@1);:SOUR:VOLTage:DC 1,(@1)'
     assert self.com.get_send_queue() == ans
-    ans = b'SOUR:VOLTage:DC 1,(@1)'
+
+  def test_set_output_voltage_coalesced(self) -> None:
+    with self.instrument.data_handler.batch(';:'):
+      self.instrument.set_output_voltage(1, 1)
+      self.instrument.set_output_voltage(2, 1)
+      self.instrument.set_output_voltage(1, 2)
+    ans = b'SOUR:VOLTage 2,(@1);:SOUR:VOLTage 1,(@2)'
     assert self.com.get_send_queue() == ans
 
+  def test_set_output_voltage_window(self) -> None:
+    with self.instrument.data_handler.batch(';:', window=0):
+      self.instrument.set_output_voltage(1, 1)
+      self.instrument.set_output_voltage(1, 2)
+    assert self.com.get_send_queue() == b'SOUR:VOLTage 1,(@1)'
+    assert self.com.get_send_queue() == b'SOUR:VOLTage 2,(@1)'
+
   def test_enable_output(self) -> None:
     self.instrument.enable_output(1, 1)
     ans = b'OUTP:STATE 1,(@1)'
@@ -115,3 +188,42 @@ class TestKeysightn6705c:
     self.instrument.enable_output(1, 0)
     ans = b'OUTP:STATE 0,(@1)'
     assert self.com.get_send_queue() == ans
+
+    self.instrument.enable_output([1, 2, 3], 1)
+    ans = b'OUTP:STATE 1,(@1,2,3)'
+    assert self.com.get_send_queue() == ans
+
+  def test_enable_output_shorted(self) -> None:
+    self.instrument.enable_output_shorted(1, True, True)
+    ans = b'OUTPut:SHORt 1,(@1);:OUTP:STATE 1,(@1)'
+    assert self.com.get_send_queue() == ans
+
+  def test_set_sequence(self) -> None:
+    self.instrument.set_sequence(1, [1, 2.5], [0.1, 0.2], [0.5, 1])
+    ans = (
+        b'VOLT:MODE LIST,(@1);:CURR:MODE LIST,(@1);'
+        b':LIST:VOLT 1,2.5,(@1);:LIST:CURR 0.1,0.2,(@1);'
+        b':LIST:DWEL 0.5,1,(@1)'
+    )
+    assert self.com.get_send_queue() == ans
+
+
+@pytest.mark.parametrize(
+    'model',
+    [
+        builder.BatteryEmulator.KEYSIGHT_N6705C,
+        builder.DCPowerSupply.KEYSIGHT_N6705C,
+        builder.Eload.KEYSIGHT_N6705C,
+        builder.SMU.KEYSIGHT_N6705C,
+    ],
+)
+def test_build_with_reset(model) -> None:
+  build = builder.PyLabHALBuilder()
+  build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+  build.instrument_config.idn = False
+
+  inst = build.build_instrument(model)
+
+  com = inst.data_handler.interface
+  assert com.get_send_queue() == b'*RST'
+  assert com.get_send_queue() == b'*CLS'
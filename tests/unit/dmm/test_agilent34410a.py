@@ -14,9 +14,12 @@
 
 """Agilent/Keysight 34410A Unit Test."""
 
+import asyncio
+
 from py_lab_hal import builder
 from py_lab_hal.cominterface import cominterface
 from py_lab_hal.cominterface import debug
+from py_lab_hal.instrument import instrument
 import pytest
 
 
@@ -50,3 +53,26 @@ class TestAgilent34410a:
     ans = b':read?'
     assert self.com.get_send_queue() == ans
     assert 10 == recv
+
+  def test_config_range(self) -> None:
+    self.instrument.config_channel_mode(1, instrument.ChannelMode.VOLTAGE_DC)
+    self.instrument.config_range(1, instrument.ValueRange.MAX)
+    assert self.com.get_send_queue() == b'CONF:VOLTage:DC'
+    assert self.com.get_send_queue() == b'VOLTage:DC:RANGE MAX'
+
+  def test_config_resolution(self) -> None:
+    self.instrument.config_channel_mode(1, instrument.ChannelMode.VOLTAGE_DC)
+    self.instrument.config_resolution(1, 0.001)
+    assert self.com.get_send_queue() == b'CONF:VOLTage:DC'
+    assert self.com.get_send_queue() == b'VOLTage:DC:RES 0.001'
+
+  def test_config_measurement_async(self) -> None:
+    asyncio.run(
+        self.instrument.config_measurement_async(
+            1, instrument.ChannelMode.VOLTAGE_DC, False, 10, 0.001
+        )
+    )
+    assert self.com.get_send_queue() == (
+        b'CONF:VOLTage:DC;:VOLTage:DC:RANGE:AUTO 0;:VOLTage:DC:RANGE 10;'
+        b':VOLTage:DC:RES 0.001'
+    )
@@ -39,7 +39,7 @@ class TestKeysight34970a:
     build.instrument_config.auto_init = False
 
     TestKeysight34970a.instrument = build.build_instrument(
-        builder.DMM.AGILENT_34410A
+        builder.DMM.KEYSIGHT_34970A
     )
     TestKeysight34970a.instrument.open_instrument()
     TestKeysight34970a.com = (
@@ -58,3 +58,13 @@ class TestKeysight34970a:
   #   ans = b':read?'
   #   assert self.com.get_send_queue() ==  ans
   #   assert 10 ==  recv
+
+  def test_read(self) -> None:
+    self.com.push_recv_queue(b'+1.5E+00')
+    assert self.instrument.read(101) == 1.5
+    assert self.com.get_send_queue() == b'ROUT:SCAN (@101);:read?'
+
+  def test_read_list(self) -> None:
+    self.com.push_recv_queue(b'+1.5E+00,-2.0E-01,+3.0E+00')
+    assert self.instrument.read_list([101, 103, 105]) == [1.5, -0.2, 3.0]
+    assert self.com.get_send_queue() == b'ROUT:SCAN (@101,103,105);:read?'
@@ -0,0 +1,89 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""BK Precision 8500B Unit Test."""
+
+import queue
+
+from py_lab_hal import builder
+from py_lab_hal.cominterface import cominterface
+from py_lab_hal.cominterface import debug
+from py_lab_hal.instrument import instrument
+import pytest
+
+
+class TestBk8500b:
+  com: debug.Debug
+
+  @pytest.fixture(scope='function', autouse=True)
+  def setup_thermal_f(self):
+    self.com.clean_send_queue()
+    yield
+
+  @pytest.fixture(scope='class', autouse=True)
+  def setup_thermal(self):
+    build = builder.PyLabHALBuilder()
+    build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+
+    build.instrument_config.clear = False
+    build.instrument_config.reset = False
+    build.instrument_config.idn = False
+    build.instrument_config.auto_init = False
+
+    TestBk8500b.instrument = build.build_instrument(builder.Eload.BK_8500B)
+    TestBk8500b.instrument.open_instrument()
+    TestBk8500b.com = TestBk8500b.instrument.data_handler.interface
+    yield
+
+  @pytest.mark.parametrize('enable', [True, False])
+  def test_short_output(self, enable) -> None:
+    self.instrument.short_output(1, enable)
+    ans = f'INPut:SHORt {int(enable)};:INPut {int(enable)}'.encode()
+    assert self.com.get_send_queue() == ans
+
+  def test_set_mode(self) -> None:
+    self.instrument.set_mode(1, instrument.ChannelMode.RESISTANCE)
+    assert self.com.get_send_queue() == b'FUNCtion RESistance'
+
+  def test_set_level(self) -> None:
+    self.instrument.set_level(1, instrument.ChannelMode.CURRENT_DC, 1.5)
+    assert self.com.get_send_queue() == b'CURRent 1.5'
+
+  def test_measure_voltage_current(self) -> None:
+    self.com.push_recv_queue(b'12.5;0.75')
+    assert self.instrument.measure_voltage_current(1) == (12.5, 0.75)
+    assert (
+        self.com.get_send_queue() == b'MEASure:VOLTage?;:MEASure:CURRent?'
+    )
+
+  def test_coalesce_batch_keeps_short(self) -> None:
+    data_handler = self.instrument.data_handler
+    with data_handler.batch(';:', coalesce=True):
+      data_handler.send('INPut:SHORt 1')
+      data_handler.send('INPut:SHORt 0')
+      data_handler.send('CURRent 1')
+      data_handler.send('CURRent 2')
+    assert (
+        self.com.get_send_queue()
+        == b'INPut:SHORt 1;:INPut:SHORt 0;:CURRent 2'
+    )
+
+  def test_send_batch_generator(self) -> None:
+    data_handler = self.instrument.data_handler
+    data_handler.send_batch((f'INPut {state}' for state in (1, 0)), '\n')
+    data_handler.send_batch(iter(()))
+    assert self.com.get_send_queue() == b'INPut 1\nINPut 0'
+    with pytest.raises(queue.Empty):
+      self.com.get_send_queue()
@@ -0,0 +1,154 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Chroma 63600 Unit Test."""
+
+import queue
+
+from py_lab_hal import builder
+from py_lab_hal.cominterface import cominterface
+from py_lab_hal.cominterface import debug
+from py_lab_hal.instrument import instrument
+import pytest
+
+_ID_80_60 = b'CHROMA,63630-80-60,0,1.00'
+_ID_80_20 = b'CHROMA,63610-80-20,0,1.00'
+
+
+def _build_instrument():
+  build = builder.PyLabHALBuilder()
+  build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+
+  build.instrument_config.clear = False
+  build.instrument_config.reset = False
+  build.instrument_config.idn = False
+  build.instrument_config.auto_init = False
+
+  inst = build.build_instrument(builder.Eload.CHROMA_63600)
+  inst.open_interface()
+  com = inst.data_handler.interface
+  assert com.get_send_queue() == b'SYSTem:REMote'
+  return inst, com
+
+
+def test_check_channel_number_compound_query() -> None:
+  inst, com = _build_instrument()
+  com.push_recv_queue(b'2')
+  com.push_recv_queue(_ID_80_60 + b';' + _ID_80_20)
+  inst.open_instrument()
+  assert com.get_send_queue() == b'CHAN MAX;CHAN?'
+  assert com.get_send_queue() == b'CHAN 1;:CHAN:ID?;:CHAN 2;:CHAN:ID?'
+  with pytest.raises(queue.Empty):
+    com.get_send_queue()
+  assert inst.ch_ids == {1: '63630-80-60', 2: '63610-80-20'}
+
+
+def test_check_channel_number_per_channel() -> None:
+  inst, com = _build_instrument()
+  com.push_recv_queue(b'2')
+  # A mainframe which only answers the last query of a compound line.
+  com.push_recv_queue(_ID_80_20)
+  com.push_recv_queue(_ID_80_60)
+  com.push_recv_queue(_ID_80_20)
+  inst.open_instrument()
+  assert com.get_send_queue() == b'CHAN MAX;CHAN?'
+  assert com.get_send_queue() == b'CHAN 1;:CHAN:ID?;:CHAN 2;:CHAN:ID?'
+  assert com.get_send_queue() == b'CHAN 1;:CHAN:ID?'
+  assert com.get_send_queue() == b'CHAN 2;:CHAN:ID?'
+  assert inst.ch_ids == {1: '63630-80-60', 2: '63610-80-20'}
+
+
+class TestChroma63600:
+  com: debug.Debug
+
+  @pytest.fixture(scope='function', autouse=True)
+  def setup_thermal_f(self):
+    self.com.clean_send_queue()
+    yield
+
+  @pytest.fixture(scope='class', autouse=True)
+  def setup_thermal(self):
+    TestChroma63600.instrument, TestChroma63600.com = _build_instrument()
+    TestChroma63600.com.push_recv_queue(b'1')
+    TestChroma63600.com.push_recv_queue(_ID_80_60)
+    TestChroma63600.instrument.open_instrument()
+    yield
+
+  @pytest.mark.parametrize(
+      'enable, ans',
+      [
+          (True, b'CHAN 2;:CHANnel:ACTive 1;:LOAD 1'),
+          (False, b'CHAN 2;:LOAD 0;:CHANnel:ACTive 0'),
+      ],
+  )
+  def test_enable_output(self, enable, ans) -> None:
+    self.instrument.enable_output(2, enable)
+    assert self.com.get_send_queue() == ans
+
+  def test_enable_output_separator(self) -> None:
+    self.instrument.COMMAND_SEPARATOR = ';'
+    try:
+      self.instrument.enable_output(2, True)
+    finally:
+      del self.instrument.COMMAND_SEPARATOR
+    assert self.com.get_send_queue() == b'CHAN 2;CHANnel:ACTive 1;LOAD 1'
+
+  @pytest.mark.parametrize(
+      'enable, ans',
+      [
+          (
+              True,
+              b'CHAN 1;:LOAD:SHORT 1;:CHAN 1;:CHANnel:ACTive 1;:LOAD 1',
+          ),
+          (
+              False,
+              b'CHAN 1;:LOAD:SHORT 0;:CHAN 1;:LOAD 0;:CHANnel:ACTive 0',
+          ),
+      ],
+  )
+  def test_short_output(self, enable, ans) -> None:
+    self.instrument.short_output(1, enable)
+    assert self.com.get_send_queue() == ans
+    with pytest.raises(queue.Empty):
+      self.com.get_send_queue()
+
+  def test_set_level(self) -> None:
+    self.instrument.set_level(1, instrument.ChannelMode.CURRENT_DC, 1.5)
+    assert self.com.get_send_queue() == b'CHAN 1;:CURRent:STATic:L1 1.5'
+
+  def test_set_level_current_limit(self) -> None:
+    self.instrument.set_level(1, instrument.ChannelMode.VOLTAGE_DC, 5, 2)
+    assert (
+        self.com.get_send_queue()
+        == b'CHAN 1;:VOLTage:STATic:L1 5;:VOLTage:STAT:ILIMit 2'
+    )
+
+  @pytest.mark.parametrize(
+      'mode, value, ans',
+      [
+          (instrument.ChannelMode.CURRENT_DC, 0.6, b'CHAN 1;:MODE CCL'),
+          (instrument.ChannelMode.CURRENT_DC, 5, b'CHAN 1;:MODE CCM'),
+          (instrument.ChannelMode.VOLTAGE_DC, 20, b'CHAN 1;:MODE CVH'),
+          (instrument.ChannelMode.POWER, 300, b'CHAN 1;:MODE CPH'),
+      ],
+  )
+  def test_set_range(self, mode, value, ans) -> None:
+    self.instrument.set_range(1, mode, value)
+    assert self.com.get_send_queue() == ans
+
+  def test_set_range_out_of_range(self) -> None:
+    with pytest.raises(ValueError):
+      self.instrument.set_range(1, instrument.ChannelMode.CURRENT_DC, 61)
+    with pytest.raises(queue.Empty):
+      self.com.get_send_queue()
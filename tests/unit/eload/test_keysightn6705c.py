@@ -0,0 +1,57 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Keysight N6705C Eload Unit Test."""
+
+from py_lab_hal import builder
+from py_lab_hal.cominterface import cominterface
+from py_lab_hal.cominterface import debug
+import pytest
+
+
+class TestKeysightn6705c:
+  com: debug.Debug
+
+  @pytest.fixture(scope='function', autouse=True)
+  def setup_thermal_f(self):
+    self.com.clean_send_queue()
+    yield
+
+  @pytest.fixture(scope='class', autouse=True)
+  def setup_thermal(self):
+    build = builder.PyLabHALBuilder()
+    build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+
+    build.instrument_config.clear = False
+    build.instrument_config.reset = False
+    build.instrument_config.idn = False
+    build.instrument_config.auto_init = False
+
+    TestKeysightn6705c.instrument = build.build_instrument(
+        builder.Eload.KEYSIGHT_N6705C
+    )
+    TestKeysightn6705c.instrument.open_instrument()
+    TestKeysightn6705c.com = (
+        TestKeysightn6705c.instrument.data_handler.interface
+    )
+    yield
+
+  @pytest.mark.parametrize(
+      'power_line_freq, nplc, points', [(60, 1, 3255), (50, 0.5, 1953)]
+  )
+  def test_set_NPLC(self, power_line_freq, nplc, points) -> None:
+    self.instrument.set_NPLC(2, power_line_freq, nplc)
+    ans = f'SENSe:SWEep:POINts {points},(@2)'.encode()
+    assert self.com.get_send_queue() == ans
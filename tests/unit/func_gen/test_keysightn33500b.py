@@ -0,0 +1,211 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Keysight 33500B Unit Test."""
+
+import queue
+import threading
+
+from py_lab_hal import builder
+from py_lab_hal.cominterface import cominterface
+from py_lab_hal.cominterface import debug
+from py_lab_hal.instrument import instrument
+import pytest
+
+
+class TestKeysightn33500b:
+  com: debug.Debug
+
+  @pytest.fixture(scope='function', autouse=True)
+  def setup_thermal_f(self):
+    self.com.clean_send_queue()
+    yield
+
+  @pytest.fixture(scope='class', autouse=True)
+  def setup_thermal(self):
+    build = builder.PyLabHALBuilder()
+    build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+
+    build.instrument_config.clear = False
+    build.instrument_config.reset = False
+    build.instrument_config.idn = False
+    build.instrument_config.auto_init = False
+
+    TestKeysightn33500b.instrument = build.build_instrument(
+        builder.FunctionGenerator.KEYSIGHT_N33500B
+    )
+    TestKeysightn33500b.instrument.open_instrument()
+    TestKeysightn33500b.com = (
+        TestKeysightn33500b.instrument.data_handler.interface
+    )
+    yield
+
+  def test_set_output_voltage(self) -> None:
+    self.instrument.set_output_voltage(1, 2.5, 0.5)
+    assert (
+        self.com.get_send_queue()
+        == b'SOUR1:VOLTage 2.5;:SOUR1:VOLTage:OFFSet 0.5'
+    )
+
+  def test_configure_duty_cycle(self) -> None:
+    self.instrument.configure_duty_cycle(
+        1, instrument.FunctionType.SQU, 1000, 2.5, 0.5, 25
+    )
+    assert self.com.get_send_queue() == (
+        b'SOUR1:FUNCtion SQU;:SOUR1:FREQuency 1000;:SOUR1:VOLTage 2.5;'
+        b':SOUR1:VOLTage:OFFSet 0.5;:SOUR1:FUNCtion:SQU 25'
+    )
+
+  def test_coalesce_batch(self) -> None:
+    with self.instrument.data_handler.batch(';:', coalesce=True):
+      for frequency in (1000, 2000, 3000):
+        self.instrument.set_output_frequency(1, frequency)
+        self.instrument.set_output_phase(1, frequency / 100)
+    assert (
+        self.com.get_send_queue()
+        == b'SOUR1:FREQuency 3000;:SOUR1:PHASe 30'
+    )
+
+  def test_nested_batch_separator(self) -> None:
+    data_handler = self.instrument.data_handler
+    with data_handler.batch(';'):
+      data_handler.send('*CLS')
+      self.instrument.set_output_voltage(1, 1, 0)
+      data_handler.send('*TRG')
+    assert self.com.get_send_queue() == (
+        b'*CLS;:SOUR1:VOLTage 1;:SOUR1:VOLTage:OFFSet 0;*TRG'
+    )
+
+  def test_batch_held_by_other_thread(self) -> None:
+    data_handler = self.instrument.data_handler
+    opened = threading.Event()
+    release = threading.Event()
+
+    def hold_batch():
+      with data_handler.batch():
+        self.instrument.set_output_frequency(1, 1000)
+        opened.set()
+        release.wait(timeout=5)
+
+    future = data_handler.submit(hold_batch)
+    assert opened.wait(timeout=5)
+    data_handler.send('*TRG')
+    assert self.com.get_send_queue() == b'*TRG'
+    release.set()
+    future.result(timeout=5)
+    assert self.com.get_send_queue() == b'SOUR1:FREQuency 1000'
+
+  def test_batch_default_separator(self) -> None:
+    with self.instrument.data_handler.batch():
+      self.instrument.set_output_frequency(1, 1000)
+      self.instrument.set_output_voltage(1, 1, 0)
+    assert self.com.get_send_queue() == (
+        b'SOUR1:FREQuency 1000;:SOUR1:VOLTage 1;:SOUR1:VOLTage:OFFSet 0'
+    )
+
+  def test_coalesce_batch_keeps_order(self) -> None:
+    with self.instrument.data_handler.batch(';:', coalesce=True):
+      self.instrument.set_output_frequency(1, 1000)
+      self.instrument.set_output_phase(1, 10)
+      self.instrument.set_output_frequency(1, 2000)
+    assert (
+        self.com.get_send_queue()
+        == b'SOUR1:FREQuency 2000;:SOUR1:PHASe 10'
+    )
+
+  def test_queue_sends(self) -> None:
+    data_handler = self.instrument.data_handler
+    data_handler.queue_sends = True
+    try:
+      self.instrument.set_output_frequency(1, 1000)
+      self.instrument.set_output_voltage(1, 2.5, 0.5)
+      self.instrument.enable_output(1, True)
+      data_handler.flush()
+    finally:
+      data_handler.queue_sends = False
+    assert self.com.get_send_queue() == b'SOUR1:FREQuency 1000'
+    assert (
+        self.com.get_send_queue()
+        == b'SOUR1:VOLTage 2.5;:SOUR1:VOLTage:OFFSet 0.5'
+    )
+    assert self.com.get_send_queue() == b'OUTP1 1'
+
+  def test_skip_unchanged_writes(self) -> None:
+    self.instrument.skip_unchanged_writes = True
+    try:
+      self.instrument.set_output_frequency(2, 1000, force=True)
+      self.instrument.set_output_frequency(2, 1000)
+      self.instrument.invalidate_state(2)
+      self.instrument.set_output_frequency(2, 1000)
+    finally:
+      self.instrument.skip_unchanged_writes = False
+    assert self.com.get_send_queue() == b'SOUR2:FREQuency 1000'
+    assert self.com.get_send_queue() == b'SOUR2:FREQuency 1000'
+    with pytest.raises(queue.Empty):
+      self.com.get_send_queue()
+
+  def test_skip_unchanged_writes_failed_flush(self, monkeypatch) -> None:
+    def fail(data):
+      raise OSError(data)
+
+    self.instrument.skip_unchanged_writes = True
+    try:
+      with monkeypatch.context() as patch:
+        patch.setattr(self.com, '_send', fail)
+        with pytest.raises(OSError):
+          with self.instrument.data_handler.batch():
+            self.instrument.set_output_frequency(1, 2000)
+      self.instrument.set_output_frequency(1, 2000)
+    finally:
+      self.instrument.skip_unchanged_writes = False
+    assert self.com.get_send_queue() == b'SOUR1:FREQuency 2000'
+    with pytest.raises(queue.Empty):
+      self.com.get_send_queue()
+
+  def test_any_channel(self) -> None:
+    self.instrument.set_output_frequency(3, 1000)
+    self.instrument.set_output_voltage(3, 1, 0.25)
+    self.instrument.enable_output(4, True)
+    assert self.com.get_send_queue() == b'SOUR3:FREQuency 1000'
+    assert (
+        self.com.get_send_queue()
+        == b'SOUR3:VOLTage 1;:SOUR3:VOLTage:OFFSet 0.25'
+    )
+    assert self.com.get_send_queue() == b'OUTP4 1'
+
+  def test_submit(self) -> None:
+    future = self.instrument.data_handler.submit(
+        self.instrument.set_output_frequency, 1, 1000
+    )
+    assert future.result(timeout=5) is None
+    assert self.com.get_send_queue() == b'SOUR1:FREQuency 1000'
+
+  def test_set_output_frequency_format(self) -> None:
+    self.instrument.set_output_frequency(1, 0.1 + 0.2)
+    assert self.com.get_send_queue() == b'SOUR1:FREQuency 0.3'
+
+  @pytest.mark.parametrize(
+      'function, ans',
+      [
+          (
+              instrument.FunctionType.SIN,
+              b'SOUR1:APPL:SIN 1000,2.5,0.5;:SOUR1:PHASe 90',
+          ),
+          (instrument.FunctionType.DC, b'SOUR1:APPL:DC 1000,2.5,0.5'),
+      ],
+  )
+  def test_configure_output(self, function, ans) -> None:
+    self.instrument.configure_output(1, function, 1000, 2.5, 0.5, 90)
+    assert self.com.get_send_queue() == ans
@@ -0,0 +1,97 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Arri S120 Unit Test."""
+
+import queue
+
+from py_lab_hal.cominterface import cominterface
+from py_lab_hal.cominterface import dmx
+from py_lab_hal.instrument import instrument
+from py_lab_hal.instrument.light import arri_s120
+import pytest
+
+
+class _DebugDmx(dmx.Dmx):
+  """A DMX interface which queues the messages instead of writing them."""
+
+  def _open(self) -> None:
+    self._send_queue = queue.SimpleQueue()
+    self.data = [0] * dmx.DMX_SIZE
+
+  def _close(self) -> None:
+    pass
+
+  def _send(self, data) -> None:
+    self._send_queue.put_nowait(data)
+
+  def _set_timeout(self, seconds) -> None:
+    pass
+
+  def get_send_queue(self) -> bytes:
+    return self._send_queue.get_nowait()
+
+
+def _dimmer_message(hi: int, lo: int) -> bytes:
+  # The dimmer of base channel 1 is on channels 2 and 3.
+  data = bytearray(dmx.DMX_SIZE)
+  data[1:3] = hi, lo
+  return b'\x7e\x06\x00\x02' + bytes(data) + b'\xe7'
+
+
+class TestArriS120:
+  com: _DebugDmx
+
+  @pytest.fixture(scope='function', autouse=True)
+  def setup_thermal_f(self):
+    self.com.clear()
+    yield
+
+  @pytest.fixture(scope='class', autouse=True)
+  def setup_thermal(self):
+    TestArriS120.com = _DebugDmx(
+        cominterface.ConnectConfig(interface_type='debug')
+    )
+    TestArriS120.com.open()
+    TestArriS120.instrument = arri_s120.ArriS120(
+        TestArriS120.com, instrument.InstrumentConfig(auto_init=False)
+    )
+    yield
+
+  def test_percents_to_twobytes(self) -> None:
+    assert arri_s120.percents_to_twobytes([0, 0.25, 0.5, 1, 0.12345]) == [
+        (0x00, 0x00),
+        (0x3F, 0xFF),
+        (0x7F, 0xFF),
+        (0xFF, 0xFF),
+        (0x1F, 0x9A),
+    ]
+
+  def test_percents_to_twobytes_invalid(self) -> None:
+    with pytest.raises(ValueError):
+      arri_s120.percents_to_twobytes([0.5, -0.1])
+
+  def test_dimmer_ramp(self) -> None:
+    self.instrument.dimmer_ramp([0, 0.25, 1], interval=0)
+    assert self.com.get_send_queue() == _dimmer_message(0x00, 0x00)
+    assert self.com.get_send_queue() == _dimmer_message(0x3F, 0xFF)
+    assert self.com.get_send_queue() == _dimmer_message(0xFF, 0xFF)
+    with pytest.raises(queue.Empty):
+      self.com.get_send_queue()
+
+  def test_dimmer_ramp_invalid(self) -> None:
+    with pytest.raises(ValueError):
+      self.instrument.dimmer_ramp([0.5, 1.5], interval=0)
+    with pytest.raises(queue.Empty):
+      self.com.get_send_queue()
@@ -0,0 +1,150 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Monsoon Unit Test."""
+
+import threading
+import time
+
+from py_lab_hal.cominterface import cominterface
+from py_lab_hal.instrument import instrument
+from py_lab_hal.instrument.powermeter import powermeter as pm
+import pytest
+
+monsoon = pytest.importorskip('py_lab_hal.instrument.powermeter.monsoon')
+
+_PERIODIC = pm.MeasurementTriggerConfig(samplingMode=pm.SamplingMode.periodic)
+
+
+def _chunk(timestamp):
+  return [[timestamp], [1.0], [2.0], [3.0], [4.0], [5.0]]
+
+
+class _StubEngine:
+  """A sample engine returning the given chunks, then calling on_end."""
+
+  def __init__(self, chunks, on_end):
+    self.chunks = iter(chunks)
+    self.on_end = on_end
+    self.sizes = []
+    self.busy = False
+    self.overlapped = False
+
+  def _enter(self):
+    self.overlapped |= self.busy
+    self.busy = True
+    time.sleep(0.001)
+
+  def ConsoleOutput(self, enable):  # pylint: disable=invalid-name
+    pass
+
+  def periodicStartSampling(self):  # pylint: disable=invalid-name
+    pass
+
+  def periodicStopSampling(self, closeCSV):  # pylint: disable=invalid-name
+    self._enter()
+    self.busy = False
+
+  def periodicCollectSamples(self, num):  # pylint: disable=invalid-name
+    self._enter()
+    try:
+      self.sizes.append(num)
+      samples = next(self.chunks, None)
+      if samples is None:
+        return self.on_end()
+      return samples
+    finally:
+      self.busy = False
+
+
+def _build_monsoon(chunks, on_end=None):
+  com = cominterface.select(cominterface.ConnectConfig(interface_type='debug'))
+  com.engine = _StubEngine(chunks, on_end or (lambda: _chunk(-1.0)))
+  com.monitor = None
+  inst = monsoon.Monsoon(com, instrument.InstrumentConfig(auto_init=False))
+  inst.start_sampling(_PERIODIC)
+  return inst
+
+
+def _pump_threads():
+  return [t for t in threading.enumerate() if t.name == 'MonsoonPump']
+
+
+def test_stream_measurements_stop_sampling() -> None:
+  inst = None
+
+  def stop():
+    inst.stop_sampling(_PERIODIC)
+    return _chunk(2.0)
+
+  inst = _build_monsoon([_chunk(0.0), _chunk(1.0)], stop)
+  chunks = list(inst.stream_measurements(chunk=16))
+  assert [c[0].timestamp for c in chunks] == [0.0, 1.0, 2.0]
+  assert list(chunks[0]) == [monsoon.MonsoonMeasurements(0.0, 1, 2, 3, 4, 5)]
+  assert inst.engine.sizes == [16, 16, 16]
+
+
+def test_stream_measurements_stop_from_caller() -> None:
+  inst = _build_monsoon([])
+  timestamps = []
+  for chunk in inst.stream_measurements(chunk=4):
+    timestamps.append(chunk[0].timestamp)
+    if len(timestamps) == 3:
+      inst.stop_sampling(_PERIODIC)
+  assert timestamps[:3] == [-1.0, -1.0, -1.0]
+  assert not inst.engine.overlapped
+  assert not inst.is_sampling
+
+
+def test_stream_measurements_bounded() -> None:
+  inst = _build_monsoon([])
+  stream = inst.stream_measurements(max_pending=1)
+  assert next(stream)[0].timestamp == -1.0
+  time.sleep(0.1)
+  # One chunk read, one waiting in the queue and one waiting to be queued.
+  assert len(inst.engine.sizes) <= 3
+  stream.close()
+  assert not _pump_threads()
+
+
+def test_stream_measurements_close() -> None:
+  inst = _build_monsoon([_chunk(0.0)])
+  stream = inst.stream_measurements()
+  assert next(stream)[0].timestamp == 0.0
+  stream.close()
+  for thread in _pump_threads():
+    thread.join(timeout=5)
+  assert not _pump_threads()
+  assert inst.is_sampling
+
+
+def test_stream_measurements_engine_error() -> None:
+  def fail():
+    raise OSError('USB disconnected')
+
+  inst = _build_monsoon([_chunk(0.0)], fail)
+  stream = inst.stream_measurements()
+  assert next(stream)[0].timestamp == 0.0
+  with pytest.raises(OSError, match='USB disconnected'):
+    next(stream)
+  for thread in _pump_threads():
+    thread.join(timeout=5)
+  assert not _pump_threads()
+
+
+def test_stream_measurements_not_started() -> None:
+  inst = _build_monsoon([])
+  inst.stop_sampling(_PERIODIC)
+  with pytest.raises(RuntimeError):
+    next(inst.stream_measurements())
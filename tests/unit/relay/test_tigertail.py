@@ -0,0 +1,66 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tigertail Unit Test."""
+
+import queue
+
+from py_lab_hal import builder
+from py_lab_hal.cominterface import cominterface
+from py_lab_hal.cominterface import debug
+import pytest
+
+
+class TestTigertail:
+  com: debug.Debug
+
+  @pytest.fixture(scope='function', autouse=True)
+  def setup_thermal_f(self):
+    self.com.clean_send_queue()
+    yield
+
+  @pytest.fixture(scope='class', autouse=True)
+  def setup_thermal(self):
+    build = builder.PyLabHALBuilder()
+    build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+    build.instrument_config.clear = False
+    build.instrument_config.reset = False
+    build.instrument_config.idn = False
+    TestTigertail.instrument = build.build_instrument(builder.Relay.TIGERTAIL)
+    TestTigertail.com = TestTigertail.instrument.data_handler.interface
+    yield
+
+  def test_enable(self):
+    self.instrument.enable(2, True)
+    assert self.com.get_send_queue() == b'mux B'
+    self.instrument.enable(1, False)
+    with pytest.raises(queue.Empty):
+      self.com.get_send_queue()
+    self.instrument.enable(2, False)
+    assert self.com.get_send_queue() == b'mux off'
+
+  def test_skip_unchanged_writes(self):
+    self.instrument.skip_unchanged_writes = True
+    try:
+      self.instrument.enable(1, True)
+      self.instrument.enable(1, True)
+      self.instrument.reset()
+      self.instrument.reset()
+    finally:
+      self.instrument.skip_unchanged_writes = False
+    assert self.com.get_send_queue() == b'mux A'
+    assert self.com.get_send_queue() == b'mux off'
+    assert self.com.get_send_queue() == b'mux off'
+    with pytest.raises(queue.Empty):
+      self.com.get_send_queue()
@@ -47,3 +47,23 @@ class TestUsbrelay:
     self.instrument.enable(1, False)
     ans = b'\xa0\x01\x00\xa1'
     assert self.com.get_send_queue() == ans
+
+  def test_checksum_wraps(self):
+    self.instrument.enable(100, True)
+    ans = b'\xa0\x64\x01\x05'
+    assert self.com.get_send_queue() == ans
+
+  def test_enable_many(self):
+    self.instrument.enable_many([(1, True), (2, False)])
+    ans = b'\xa0\x01\x01\xa2\xa0\x02\x00\xa2'
+    assert self.com.get_send_queue() == ans
+
+  def test_context_manager_closes(self):
+    build = builder.PyLabHALBuilder()
+    build.connection_config = cominterface.ConnectConfig(interface_type='debug')
+    build.instrument_config.clear = False
+    build.instrument_config.reset = False
+    build.instrument_config.idn = False
+    with build.build_instrument(builder.Relay.USBRELAY) as relay:
+      assert relay.data_handler.interface.enable
+    assert not relay.data_handler.interface.enable
@@ -15,6 +15,7 @@
 """Test of TektronixMSO456."""
 
 import os
+import time
 
 from py_lab_hal import builder
 from py_lab_hal.cominterface import cominterface
@@ -514,6 +515,22 @@ class TestTektronixMSO456:
     expected = b'*OPC?'
     assert expected == self.com.get_send_queue()
 
+  def test_wait_task_polls(self):
+    self.com.push_recv_queue(b'0')
+    self.com.push_recv_queue(b'1')
+    start = time.monotonic()
+    self.instrument.wait_task(1)
+    assert time.monotonic() - start < 0.5
+    assert self.com.get_send_queue() == b'*OPC?'
+    assert self.com.get_send_queue() == b'*OPC?'
+
+  def test_self_test(self):
+    self.com.push_recv_queue(b'0')
+    start = time.monotonic()
+    self.instrument.self_test()
+    assert time.monotonic() - start < 1
+    assert self.com.get_send_queue() == b'*TST?'
+
   def test_wait_task_timeout(self):
     self.com.push_recv_queue(b'1999')
     self.instrument.wait_task(1)
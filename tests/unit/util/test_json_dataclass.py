@@ -0,0 +1,96 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Json Dataclass Unit Test."""
+
+import dataclasses
+
+import dataclasses_json
+from py_lab_hal.cominterface import cominterface
+from py_lab_hal.instrument import instrument
+from py_lab_hal.util import json_dataclass
+import pytest
+
+
+def _reference_from_dict(cls, kvs, infer_missing=False):
+  return dataclasses_json.DataClassJsonMixin.from_dict.__func__(
+      cls, kvs, infer_missing=infer_missing
+  )
+
+
+def _fields(obj):
+  return {
+      field.name: repr(getattr(obj, field.name, None))
+      for field in dataclasses.fields(obj)
+  }
+
+
+@pytest.mark.parametrize(
+    'kvs',
+    [
+        {'interfaceType': 'debug'},
+        {'interfaceType': 'debug', 'pyLabHalBoardIp': '127.0.0.1'},
+        {
+            'visaResource': '/dev/ttyUSB0',
+            'serialConfig': {
+                'baudRate': 115200,
+                'stopBits': 2,
+                'parity': 'E',
+                'flowControl': 1,
+            },
+            'terminator': {'read': 'ok\n'},
+            'timeout': {'recv': 3},
+            'httpConfig': {'authData': {'user': 'admin'}},
+            'unknownKey': 1,
+        },
+        {
+            'network': {'host': '127.0.0.1', 'port': 5025},
+            'visa_resource': '',
+        },
+    ],
+)
+def test_connect_config_from_dict(kvs):
+  expected = _reference_from_dict(cominterface.ConnectConfig, kvs)
+  assert _fields(cominterface.ConnectConfig.from_dict(kvs)) == _fields(
+      expected
+  )
+
+
+def test_instrument_config_from_dict():
+  kvs = {'autoInit': False, 'reset': False, 'channel': 2}
+  assert instrument.InstrumentConfig.from_dict(kvs) == _reference_from_dict(
+      instrument.InstrumentConfig, kvs
+  )
+
+
+
+@json_dataclass.dataclass_json_codegen
+@dataclasses.dataclass
+class _Inst(json_dataclass.DataClassJsonCamelMixIn):
+  name: str
+  com_name: str
+  config: instrument.InstrumentConfig
+  comment: str = ''
+
+
+def test_from_dict_infer_missing():
+  kvs = {'name': 'psu', 'config': {'reset': False}}
+  result = _Inst.from_dict(kvs, infer_missing=True)
+  with pytest.warns(RuntimeWarning):
+    expected = _reference_from_dict(_Inst, kvs, infer_missing=True)
+  assert result == expected
+  assert result.com_name is None
+  assert not result.comment
+  with pytest.raises(TypeError):
+    _Inst.from_dict(kvs)